@@ -0,0 +1,86 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.__main__`
+====================================================
+
+Command line tools, run on a host with Blinka.
+
+``python -m adafruit_seesaw scan [--all | --address ADDR ...] [--cache PATH]``
+lists the seesaw devices on ``board.I2C()`` using
+`adafruit_seesaw.discovery.probe`, optionally saving them to a cache file for
+`adafruit_seesaw.discovery.discover`. Only the addresses in
+`adafruit_seesaw.discovery.DEFAULT_ADDRESSES` are probed unless ``--all`` or
+``--address`` is given. Probing writes two bytes to every device at the
+probed addresses, so only widen it on buses without parts such as EEPROMs or
+DACs there.
+
+* Author(s): Adafruit Industries
+"""
+
+import argparse
+
+from adafruit_seesaw import discovery
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+
+def scan(i2c, cache=None, addresses=discovery.DEFAULT_ADDRESSES):
+    """Print the seesaw devices on ``i2c`` at ``addresses``, saving them to
+    ``cache`` if given"""
+    devices = discovery.probe(i2c, addresses)
+    print("address  chip  pid    date   pin mapping")
+    for device in devices:
+        pin_mapping = device.pin_mapping
+        print(
+            f"0x{device.address:02x}     0x{device.chip_id:02x}  {device.pid:<5}  "
+            f"{device.date_code:<5}  {pin_mapping.__name__ if pin_mapping else '-'}"
+        )
+    if not devices:
+        print("no seesaw devices found")
+    if cache is not None:
+        discovery.save(devices, cache)
+    return devices
+
+
+def main(argv=None):
+    """Parse ``argv`` and run the requested command"""
+    parser = argparse.ArgumentParser(prog="python -m adafruit_seesaw")
+    commands = parser.add_subparsers(dest="command", required=True)
+    scan_parser = commands.add_parser("scan", help="list the seesaw devices on board.I2C()")
+    scan_parser.add_argument("--cache", help="also save the devices to this JSON file")
+    addresses = scan_parser.add_mutually_exclusive_group()
+    addresses.add_argument(
+        "--address",
+        action="append",
+        type=lambda text: int(text, 0),
+        help="probe this address, such as 0x36, instead of the defaults. Repeat for more",
+    )
+    addresses.add_argument(
+        "--all",
+        action="store_true",
+        help=(
+            "probe 0x2E and 0x30 to 0x60, not just the factory addresses. This "
+            "writes two bytes to every device there, which can change the output "
+            "of a DAC or the contents of an EEPROM"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    import board  # noqa: PLC0415
+
+    if args.command == "scan":
+        if args.address:
+            addresses = tuple(args.address)
+        elif args.all:
+            addresses = discovery.ALL_ADDRESSES
+        else:
+            addresses = discovery.DEFAULT_ADDRESSES
+        scan(board.I2C(), args.cache, addresses)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@
 ====================================================
 """
 
+import array
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
 
@@ -18,9 +20,11 @@ class AnalogInput:
     This class is intended to be a compatible subset of `analogio.AnalogIn`
 
     :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The device
-    :param int pin: The pin number on the device"""
+    :param int pin: The pin number on the device
+    :param float delay: The conversion delay, or None to use the device's
+        timing profile"""
 
-    def __init__(self, seesaw, pin, delay=0.008):
+    def __init__(self, seesaw, pin, delay=None):
         self._seesaw = seesaw
         self._pin = pin
         self._delay = delay
@@ -37,3 +41,209 @@ class AnalogInput:
     def reference_voltage(self):
         """The reference voltage for the pin"""
         return 3.3
+
+
+class MovingAverage:
+    """The mean of the last ``size`` samples, kept in a ring buffer with a
+    running total so each update costs the same whatever the size.
+
+    :param int size: The number of samples averaged"""
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._ring = array.array("f", [0] * size)
+        self.reset()
+
+    def reset(self):
+        """Forget every sample"""
+        self._index = 0
+        self._count = 0
+        self._total = 0
+
+    def update(self, sample):
+        """Add ``sample`` and return the new average"""
+        ring = self._ring
+        index = self._index
+        if self._count == len(ring):
+            self._total -= ring[index]
+        else:
+            self._count += 1
+        ring[index] = sample
+        # add the stored value, so removing it later leaves no rounding error
+        self._total += ring[index]
+        self._index = (index + 1) % len(ring)
+        return self._total / self._count
+
+
+class ExponentialAverage:
+    """An exponential moving average, ``value += alpha * (sample - value)``
+
+    :param float alpha: The weight of each new sample, above 0 and at most 1"""
+
+    def __init__(self, alpha):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be above 0 and at most 1")
+        self._alpha = alpha
+        self._value = None
+
+    def reset(self):
+        """Forget every sample"""
+        self._value = None
+
+    def update(self, sample):
+        """Add ``sample`` and return the new average"""
+        value = self._value
+        if value is None:
+            value = float(sample)
+        else:
+            value += self._alpha * (sample - value)
+        self._value = value
+        return value
+
+
+class Median:
+    """The median of the last ``size`` samples, which rejects single sample
+    spikes. A sorted copy of the window is updated in place, so an update
+    costs one pass over the window rather than a sort.
+
+    :param int size: The number of samples, ideally odd"""
+
+    def __init__(self, size):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._ring = array.array("f", [0] * size)
+        self._sorted = array.array("f", [0] * size)
+        self.reset()
+
+    def reset(self):
+        """Forget every sample"""
+        self._index = 0
+        self._count = 0
+
+    def update(self, sample):
+        """Add ``sample`` and return the new median"""
+        ring = self._ring
+        ordered = self._sorted
+        count = self._count
+        if count == len(ring):
+            # drop the oldest sample from the sorted window
+            oldest = ring[self._index]
+            i = 0
+            while ordered[i] != oldest:
+                i += 1
+            count -= 1
+            while i < count:
+                ordered[i] = ordered[i + 1]
+                i += 1
+        i = count
+        while i and ordered[i - 1] > sample:
+            ordered[i] = ordered[i - 1]
+            i -= 1
+        ordered[i] = sample
+        count += 1
+        self._count = count
+        ring[self._index] = sample
+        self._index = (self._index + 1) % len(ring)
+        return ordered[count // 2]
+
+
+class Decimator:
+    """Averages each block of ``factor`` samples into one output, for
+    oversampling. `update` returns None until a block is complete.
+
+    :param int factor: The number of samples per output"""
+
+    def __init__(self, factor):
+        if factor < 1:
+            raise ValueError("factor must be at least 1")
+        self._factor = factor
+        self.reset()
+
+    def reset(self):
+        """Forget the samples of the current block"""
+        self._count = 0
+        self._total = 0
+
+    def update(self, sample):
+        """Add ``sample`` and return the block average if it completes a block"""
+        self._total += sample
+        self._count += 1
+        if self._count < self._factor:
+            return None
+        value = self._total / self._factor
+        self.reset()
+        return value
+
+
+class FilteredAnalogInput(AnalogInput):
+    """An `AnalogInput` that passes its samples through a chain of filters
+    and can report only the changes that matter.
+
+    .. code-block:: python
+
+        stick = FilteredAnalogInput(seesaw, 14, (Median(5),), threshold=3)
+        while True:
+            x = stick.update()
+            if x is not None:
+                print(x)
+
+    :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The device
+    :param int pin: The pin number on the device
+    :param filters: Filters such as `MovingAverage`, `ExponentialAverage`,
+        `Median` and `Decimator`, applied in order. Any object with
+        ``update(sample)`` and ``reset()`` methods will do.
+    :param float threshold: `update` only reports values that differ from
+        the last reported one by more than this. None reports every value.
+    :param float delay: The conversion delay, or None to use the device's
+        timing profile"""
+
+    def __init__(self, seesaw, pin, filters=(), threshold=None, delay=None):
+        super().__init__(seesaw, pin, delay)
+        self._filters = tuple(filters)
+        self._threshold = threshold
+        self._output = None
+        self._reported = None
+
+    @property
+    def raw_value(self):
+        """One unfiltered sample, which does not pass through the filters"""
+        return self._seesaw.analog_read(self._pin, self._delay)
+
+    @property
+    def value(self):
+        """Read one sample and return the latest filter output. While a
+        `Decimator` collects a block this is the previous output."""
+        self._sample()
+        return self._output
+
+    def update(self):
+        """Read one sample and return the filter output if it is to be
+        reported, otherwise None"""
+        if not self._sample():
+            return None
+        output = self._output
+        reported = self._reported
+        threshold = self._threshold
+        if threshold is not None and reported is not None and abs(output - reported) <= threshold:
+            return None
+        self._reported = output
+        return output
+
+    def reset(self):
+        """Clear the filters and the last reported value"""
+        for stage in self._filters:
+            stage.reset()
+        self._output = None
+        self._reported = None
+
+    def _sample(self):
+        """Pass one sample through the filters, returning whether it produced
+        an output"""
+        value = self._seesaw.analog_read(self._pin, self._delay)
+        for stage in self._filters:
+            value = stage.update(value)
+            if value is None:
+                return False
+        self._output = value
+        return True
@@ -0,0 +1,888 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.async_seesaw`
+====================================================
+
+asyncio versions of the seesaw driver and its helper classes.
+
+Every method that talks to the device is a coroutine. The conversion delay
+between selecting a register and reading it back, the settle time after a
+PWM write and the wait after a software reset are awaited instead of slept,
+so other coroutines keep running and can use the bus meanwhile. Each device
+has a lock, so transactions on one device never interleave. The register
+encoding is shared with `adafruit_seesaw.seesaw.Seesaw`.
+
+.. code-block:: python
+
+    import asyncio
+
+    import board
+
+    from adafruit_seesaw.async_seesaw import AsyncAnalogInput, AsyncSeesaw
+
+    async def main():
+        seesaw = await AsyncSeesaw.create(board.I2C())
+        knob = AsyncAnalogInput(seesaw, 2)
+        while True:
+            print(await knob.get_value())
+            await asyncio.sleep(0.1)
+
+    asyncio.run(main())
+
+Properties that only report state kept on the host, such as
+`AsyncPWMOut.duty_cycle`, remain properties. Everything that needs the bus is
+a ``get_`` or ``set_`` coroutine instead.
+
+* Author(s): Adafruit Industries
+"""
+
+import asyncio
+import struct
+import time
+
+import digitalio
+from adafruit_bus_device.i2c_device import I2CDevice
+
+from adafruit_seesaw.keypad import (
+    _KEYPAD_BASE,
+    _KEYPAD_COUNT,
+    _KEYPAD_EVENT,
+    _KEYPAD_FIFO,
+    _KEYPAD_INTENCLR,
+    _KEYPAD_INTENSET,
+    KeyEvents,
+    Keypad,
+    _EdgeShadow,
+    _key_events,
+)
+from adafruit_seesaw.seesaw import (
+    _ADC_BASE,
+    _ADC_CHANNEL_OFFSET,
+    _ADC_STATUS,
+    _ADC_WINMODE,
+    _ADC_WINMON,
+    _ADC_WINTHRESH,
+    _CHIP_IDS,
+    _EEPROM_BASE,
+    _ENCODER_BASE,
+    _ENCODER_DELTA,
+    _ENCODER_INTENCLR,
+    _ENCODER_INTENSET,
+    _ENCODER_POSITION,
+    _GPIO_BASE,
+    _GPIO_BULK,
+    _GPIO_BULK_CLR,
+    _GPIO_BULK_SET,
+    _GPIO_INTENCLR,
+    _GPIO_INTENSET,
+    _GPIO_INTFLAG,
+    _MOISTURE_ATTEMPTS,
+    _MOISTURE_RETRY_DELAY,
+    _READY_POLL_INTERVAL,
+    _SERCOM0_BASE,
+    _SERCOM_BAUD,
+    _SERCOM_DATA,
+    _SERCOM_INTEN,
+    _SERCOM_INTEN_DATA_RDY,
+    _SERCOM_INTENCLR,
+    _SERCOM_STATUS,
+    _SERCOM_STATUS_DATA_RDY,
+    _STATUS_BASE,
+    _STATUS_HW_ID,
+    _STATUS_OPTIONS,
+    _STATUS_SWRST,
+    _STATUS_TEMP,
+    _STATUS_VERSION,
+    _TIMER_BASE,
+    _TIMER_FREQ,
+    _TIMER_PWM,
+    _TOUCH_BASE,
+    _TOUCH_CHANNEL_OFFSET,
+    Seesaw,
+)
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+
+class AsyncSeesaw(Seesaw):
+    """asyncio driver for a seesaw device
+
+    Create instances with `create`, which awaits the reset and
+    identification that the `adafruit_seesaw.seesaw.Seesaw` constructor
+    blocks on. Constructing directly and awaiting `begin` does the same.
+
+    :param ~busio.I2C i2c_bus: Bus the SeeSaw is connected to
+    :param int addr: I2C address of the SeeSaw device
+    :param ~digitalio.DigitalInOut drdy: Pin connected to SeeSaw's 'ready' output
+    :param ~adafruit_seesaw.timing.TimingProfile timing: Register read delays to
+        use instead of the built-in profile for the detected chip
+    :param bool shadow: Whether to skip pin and PWM writes that would not
+        change anything, see `adafruit_seesaw.seesaw.Seesaw.shadow`"""
+
+    # Checked by adafruit_seesaw.scheduler.ReadSchedule, which cannot await
+    _blocking_io = False
+
+    def __init__(self, i2c_bus, addr=0x49, drdy=None, timing=None, shadow=False):
+        self._prepare(drdy, shadow)
+        self._timing_override = timing
+        self._lock = asyncio.Lock()
+        self.i2c_device = I2CDevice(i2c_bus, addr)
+
+    @classmethod
+    async def create(
+        cls, i2c_bus, addr=0x49, drdy=None, reset=True, timing=None, shadow=False, poll_reset=False
+    ):
+        """Construct a device and await `begin` on it
+
+        Takes the same arguments as the class, plus ``reset`` and
+        ``poll_reset``."""
+        seesaw = cls(i2c_bus, addr, drdy, timing=timing, shadow=shadow)
+        await seesaw.begin(reset, poll_reset)
+        return seesaw
+
+    @classmethod
+    async def attach(cls, i2c_bus, addr=0x49, identity=None, **kwargs):
+        """Construct a driver for a device that is already running, without
+        resetting it, see `adafruit_seesaw.seesaw.Seesaw.attach`"""
+        seesaw = cls(i2c_bus, addr, **kwargs)
+        await seesaw.begin(reset=False)
+        seesaw._check_identity(identity)
+        return seesaw
+
+    async def begin(self, reset=True, poll_reset=False):
+        """Optionally reset the device, then identify it and pick its pin
+        mapping and timing profile"""
+        chip_id = None
+        if reset:
+            chip_id = await self.sw_reset(poll=poll_reset)
+        if chip_id is None:
+            chip_id = await self.read8(_STATUS_BASE, _STATUS_HW_ID)
+        self._identify(chip_id, self._timing_override)
+        self._map_pins(await self.get_version() >> 16)
+
+    async def sw_reset(self, post_reset_delay=0.5, poll=False):
+        """Trigger a software reset of the SeeSaw chip, see
+        `adafruit_seesaw.seesaw.Seesaw.sw_reset`"""
+        await self.write8(_STATUS_BASE, _STATUS_SWRST, 0xFF)
+        self.invalidate_shadow()
+        if poll:
+            return await self.wait_ready(post_reset_delay)
+        await asyncio.sleep(post_reset_delay)
+        return None
+
+    async def wait_ready(self, timeout=0.5):
+        """Poll the hardware ID until the device answers with a known one,
+        see `adafruit_seesaw.seesaw.Seesaw.wait_ready`"""
+        deadline = time.monotonic() + timeout
+        interval = _READY_POLL_INTERVAL
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                chip_id = await self.read8(_STATUS_BASE, _STATUS_HW_ID)
+            except OSError:
+                chip_id = None
+            if chip_id in _CHIP_IDS:
+                return chip_id
+            if time.monotonic() >= deadline:
+                raise RuntimeError("Seesaw did not answer after reset")
+            interval = self._poll_interval(interval, deadline)
+
+    async def get_options(self):
+        """Retrieve the 'options' word from the SeeSaw board"""
+        async with self._lock:
+            buf = self._in4
+            await self._read(_STATUS_BASE, _STATUS_OPTIONS, buf)
+            return struct.unpack_from(">I", buf)[0]
+
+    async def get_version(self):
+        """Retrieve the 'version' word from the SeeSaw board"""
+        async with self._lock:
+            buf = self._in4
+            await self._read(_STATUS_BASE, _STATUS_VERSION, buf)
+            return struct.unpack_from(">I", buf)[0]
+
+    async def pin_mode(self, pin, mode):
+        """Set the mode of a pin by number"""
+        if pin >= 32:
+            await self.pin_mode_bulk_b(1 << (pin - 32), mode)
+        else:
+            await self.pin_mode_bulk(1 << pin, mode)
+
+    async def digital_write(self, pin, value):
+        """Set the value of an output pin by number"""
+        if pin >= 32:
+            await self.digital_write_bulk_b(1 << (pin - 32), value)
+        else:
+            await self.digital_write_bulk(1 << pin, value)
+
+    async def digital_read(self, pin):
+        """Get the value of an input pin by number"""
+        if pin >= 32:
+            return await self.digital_read_bulk_b(1 << (pin - 32)) != 0
+        return await self.digital_read_bulk(1 << pin) != 0
+
+    async def digital_read_bulk(self, pins, delay=None):
+        """Get the values of all the pins on the 'A' port as a bitmask"""
+        async with self._lock:
+            if await self._snapshot_current():
+                return self._snapshot[0] & pins
+            buf = self._in4
+            await self._read(_GPIO_BASE, _GPIO_BULK, buf, delay)
+            return self._unpack_port(buf, 0) & pins
+
+    async def digital_read_bulk_b(self, pins, delay=None):
+        """Get the values of all the pins on the 'B' port as a bitmask"""
+        async with self._lock:
+            if await self._snapshot_current():
+                return self._snapshot[1] & pins
+            buf = self._in8
+            await self._read(_GPIO_BASE, _GPIO_BULK, buf, delay)
+            return struct.unpack_from(">I", buf, 4)[0] & pins
+
+    async def refresh_snapshot(self, delay=None):
+        """Read ports A and B in a single transaction and keep the result,
+        see `adafruit_seesaw.seesaw.Seesaw.refresh_snapshot`. Use
+        ``async with seesaw.snapshot():`` for a scoped snapshot."""
+        async with self._lock:
+            return await self._refresh_snapshot(delay)
+
+    async def _refresh_snapshot(self, delay=None):
+        buf = self._in8
+        await self._read(_GPIO_BASE, _GPIO_BULK, buf, delay)
+        return self._store_snapshot(buf)
+
+    async def _snapshot_current(self):
+        if not self._snapshot_in_use():
+            return False
+        if self._snapshot_stale():
+            await self._refresh_snapshot()
+        return True
+
+    async def set_GPIO_interrupts(self, pins, enabled):
+        """Enable or disable the GPIO interrupt"""
+        async with self._lock:
+            struct.pack_into(">I", self._out, 2, pins)
+            await self._write_out(_GPIO_BASE, _GPIO_INTENSET if enabled else _GPIO_INTENCLR, 4)
+
+    async def get_GPIO_interrupt_flag(self, delay=None):
+        """Read and clear GPIO interrupts that have fired"""
+        async with self._lock:
+            buf = self._in4
+            await self._read(_GPIO_BASE, _GPIO_INTFLAG, buf, delay)
+            return struct.unpack_from(">I", buf)[0]
+
+    async def analog_read(self, pin, delay=None):
+        """Read the value of an analog pin by number"""
+        offset = self._adc_offset(pin)
+        async with self._lock:
+            buf = self._in2
+            await self._read(_ADC_BASE, _ADC_CHANNEL_OFFSET + offset, buf, delay)
+            return struct.unpack_from(">H", buf)[0]
+
+    async def analog_scan(self, pins, out=None, volts=False, delay=None):
+        """Read several analog pins in one call, see
+        `adafruit_seesaw.seesaw.Seesaw.analog_scan`"""
+        registers = self._scan_registers(pins)
+        count = len(registers)
+        out = self._scan_output(count, out)
+        async with self._lock:
+            buf = self._in2
+            for i in range(count):
+                await self._read(_ADC_BASE, registers[i], buf, delay)
+                out[i] = (buf[0] << 8) | buf[1]
+        if volts:
+            return self._to_volts(out, count)
+        return out
+
+    async def set_adc_window(self, pin, mode, low=0, high=0):
+        """Set up the ADC window comparator to watch an analog pin, see
+        `adafruit_seesaw.seesaw.Seesaw.set_adc_window`"""
+        offset = self._adc_offset(pin)
+        async with self._lock:
+            await self._write_out(_ADC_BASE, _ADC_WINTHRESH, self._pack_window(mode, low, high))
+            await self._write_out(_ADC_BASE, _ADC_WINMODE, self._pack_byte(mode))
+            if mode:
+                await self._read(_ADC_BASE, _ADC_CHANNEL_OFFSET + offset, self._in2)
+            await self._write_out(
+                _ADC_BASE, self._window_interrupt_register(mode), self._pack_byte(_ADC_WINMON)
+            )
+        self.adc_window_pin = pin if mode else None
+
+    async def get_adc_window_flag(self, delay=None):
+        """Read and clear whether the ADC window comparator has triggered"""
+        async with self._lock:
+            buf = self._in1
+            await self._read(_ADC_BASE, _ADC_STATUS, buf, delay)
+            return bool(buf[0] & _ADC_WINMON)
+
+    async def touch_read(self, pin, delay=None):
+        """Read the value of a touch pin by number"""
+        offset = self._touch_offset(pin)
+        async with self._lock:
+            buf = self._in2
+            await self._read(_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET + offset, buf, delay)
+            return struct.unpack_from(">H", buf)[0]
+
+    async def moisture_read(self, delay=None, deadline=None):
+        """Read the value of the moisture sensor, see
+        `adafruit_seesaw.seesaw.Seesaw.moisture_read`. Sensors read from
+        concurrent tasks overlap their delays."""
+        async with self._lock:
+            buf = self._in2
+            for attempt in range(_MOISTURE_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(_MOISTURE_RETRY_DELAY)
+                if not self._moisture_retry(attempt, deadline):
+                    break
+                await self._read(_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET, buf, delay)
+                value = self._moisture_value(buf)
+                if value is not None:
+                    return value
+        raise self._moisture_failed()
+
+    async def _write_pins(self, capacity, offset, reg, pins):
+        shadow = self._shadow
+        if shadow is not None:
+            pins = shadow.needed(offset >> 2, reg, pins)
+            if not pins:
+                return
+        self._pack_pins(offset, pins)
+        await self._write_out(_GPIO_BASE, reg, capacity)
+        if shadow is not None:
+            shadow.record(offset >> 2, reg, pins)
+
+    async def _pin_mode_bulk_x(self, capacity, offset, pins, mode):
+        registers = self._pin_mode_registers(mode)
+        async with self._lock:
+            for reg in registers:
+                await self._write_pins(capacity, offset, reg, pins)
+
+    async def pin_mode_bulk(self, pins, mode):
+        """Set the mode of all the pins on the 'A' port as a bitmask"""
+        await self._pin_mode_bulk_x(4, 0, pins, mode)
+
+    async def pin_mode_bulk_b(self, pins, mode):
+        """Set the mode of all the pins on the 'B' port as a bitmask"""
+        await self._pin_mode_bulk_x(8, 4, pins, mode)
+
+    async def digital_write_bulk(self, pins, value):
+        """Set the mode of pins on the 'A' port as a bitmask"""
+        async with self._lock:
+            await self._write_pins(4, 0, _GPIO_BULK_SET if value else _GPIO_BULK_CLR, pins)
+
+    async def digital_write_bulk_b(self, pins, value):
+        """Set the mode of pins on the 'B' port as a bitmask"""
+        async with self._lock:
+            await self._write_pins(8, 4, _GPIO_BULK_SET if value else _GPIO_BULK_CLR, pins)
+
+    async def analog_write(self, pin, value, delay=0.001):
+        """Set the value of an analog output by number"""
+        offset = self._pwm_offset(pin)
+        shadow = self._shadow
+        if shadow is not None and shadow.pwm.get(offset) == value:
+            return
+
+        async with self._lock:
+            await self._write_out(_TIMER_BASE, _TIMER_PWM, self._pack_pwm(offset, value))
+            if shadow is not None:
+                shadow.pwm[offset] = value
+            await asyncio.sleep(delay)
+
+    async def get_temp(self, delay=None):
+        """Read the temperature"""
+        async with self._lock:
+            buf = self._in4
+            await self._read(_STATUS_BASE, _STATUS_TEMP, buf, delay)
+            buf[0] &= 0x3F
+            ret = struct.unpack_from(">I", buf)[0]
+        return 0.00001525878 * ret
+
+    async def set_pwm_freq(self, pin, freq):
+        """Set the PWM frequency of a pin by number"""
+        offset = self._pwm_offset(pin)
+        shadow = self._shadow
+        if shadow is not None and shadow.pwm_freq.get(offset) == freq:
+            return
+
+        async with self._lock:
+            await self._write_out(_TIMER_BASE, _TIMER_FREQ, self._pack_pwm_freq(offset, freq))
+            if shadow is not None:
+                shadow.pwm_freq[offset] = freq
+
+    async def encoder_position(self, encoder=0):
+        """The current position of the encoder"""
+        async with self._lock:
+            buf = self._in4
+            await self._read(_ENCODER_BASE, _ENCODER_POSITION + encoder, buf)
+            return struct.unpack_from(">i", buf)[0]
+
+    async def set_encoder_position(self, pos, encoder=0):
+        """Set the current position of the encoder"""
+        async with self._lock:
+            struct.pack_into(">i", self._out, 2, pos)
+            await self._write_out(_ENCODER_BASE, _ENCODER_POSITION + encoder, 4)
+
+    async def encoder_delta(self, encoder=0):
+        """The change in encoder position since it was last read"""
+        async with self._lock:
+            buf = self._in4
+            await self._read(_ENCODER_BASE, _ENCODER_DELTA + encoder, buf)
+            return struct.unpack_from(">i", buf)[0]
+
+    async def enable_encoder_interrupt(self, encoder=0):
+        """Enable the interrupt to fire when the encoder changes position"""
+        await self.write8(_ENCODER_BASE, _ENCODER_INTENSET + encoder, 0x01)
+
+    async def disable_encoder_interrupt(self, encoder=0):
+        """Disable the interrupt from firing when the encoder changes"""
+        await self.write8(_ENCODER_BASE, _ENCODER_INTENCLR + encoder, 0x01)
+
+    async def enable_sercom_data_rdy_interrupt(self, sercom=0):
+        """Enable the interrupt to fire when the SERCOM has received data"""
+        await self.write8(_SERCOM0_BASE + sercom, _SERCOM_INTEN, _SERCOM_INTEN_DATA_RDY)
+
+    async def disable_sercom_data_rdy_interrupt(self, sercom=0):
+        """Disable the interrupt from firing when the SERCOM receives data"""
+        await self.write8(_SERCOM0_BASE + sercom, _SERCOM_INTENCLR, _SERCOM_INTEN_DATA_RDY)
+
+    async def sercom_data_ready(self, sercom=0):
+        """Whether the SERCOM has received data waiting to be read"""
+        status = await self.read8(_SERCOM0_BASE + sercom, _SERCOM_STATUS)
+        return bool(status & _SERCOM_STATUS_DATA_RDY)
+
+    async def read_sercom_data(self, sercom=0):
+        """Read one received byte from the SERCOM"""
+        return await self.read8(_SERCOM0_BASE + sercom, _SERCOM_DATA)
+
+    async def set_i2c_addr(self, addr):
+        """Store a new address in the device's EEPROM and reboot it."""
+        await self.eeprom_write8(self._get_eeprom_i2c_addr(), addr)
+
+    async def get_i2c_addr(self):
+        """Return the device's I2C address stored in its EEPROM"""
+        return await self.read8(_EEPROM_BASE, self._get_eeprom_i2c_addr())
+
+    async def eeprom_write8(self, addr, val):
+        """Write a single byte directly to the device's EEPROM"""
+        await self.write8(_EEPROM_BASE, addr, val)
+        self._eeprom_record(addr, bytes((val,)))
+
+    async def eeprom_write(self, addr, buf, compare=False):
+        """Write multiple bytes directly to the device's EEPROM, see
+        `adafruit_seesaw.seesaw.Seesaw.eeprom_write`"""
+        length = len(buf)
+        self._check_eeprom_range(addr, length)
+        current = self._eeprom_known(addr, length)
+        if current is None and compare:
+            current = await self.eeprom_read(addr, length)
+        written = 0
+        for reg, chunk in self._eeprom_writes(addr, buf, current):
+            await self.write(_EEPROM_BASE, reg, chunk)
+            written += len(chunk)
+        self._eeprom_record(addr, buf)
+        return written
+
+    async def eeprom_read8(self, addr):
+        """Read a single byte directly to the device's EEPROM"""
+        known = self._eeprom_known(addr, 1)
+        if known is not None:
+            return known[0]
+        value = await self.read8(_EEPROM_BASE, addr)
+        self._eeprom_record(addr, bytes((value,)))
+        return value
+
+    async def eeprom_read(self, addr, length):
+        """Read ``length`` bytes from the device's EEPROM"""
+        return await self.eeprom_readinto(addr, bytearray(length))
+
+    async def eeprom_readinto(self, addr, buf):
+        """Fill ``buf`` from the device's EEPROM starting at ``addr``, see
+        `adafruit_seesaw.seesaw.Seesaw.eeprom_readinto`"""
+        self._check_eeprom_range(addr, len(buf))
+        known = self._eeprom_known(addr, len(buf))
+        if known is not None:
+            buf[:] = known
+            return buf
+        async with self._lock:
+            for reg, chunk in self._eeprom_reads(addr, buf):
+                await self._read(_EEPROM_BASE, reg, chunk)
+        self._eeprom_record(addr, buf)
+        return buf
+
+    async def uart_set_baud(self, baud):
+        """Set the serial baudrate of the device"""
+        async with self._lock:
+            struct.pack_into(">I", self._out, 2, baud)
+            await self._write_out(_SERCOM0_BASE, _SERCOM_BAUD, 4)
+
+    async def write8(self, reg_base, reg, value):
+        """Write an arbitrary I2C byte register on the device"""
+        async with self._lock:
+            await self._write_out(reg_base, reg, self._pack_byte(value))
+
+    async def read8(self, reg_base, reg):
+        """Read an arbitrary I2C byte register on the device"""
+        async with self._lock:
+            ret = self._in1
+            await self._read(reg_base, reg, ret)
+            return ret[0]
+
+    async def read(self, reg_base, reg, buf, delay=None, end=None):
+        """Read an arbitrary I2C register range on the device
+
+        Unless ``delay`` is given, the wait between selecting the register and
+        reading it back comes from the device's `timing` profile. Only the
+        first ``end`` bytes of ``buf`` are filled if ``end`` is given."""
+        async with self._lock:
+            await self._read(reg_base, reg, buf, delay, end)
+
+    async def write(self, reg_base, reg, buf=None):
+        """Write an arbitrary I2C register range on the device"""
+        async with self._lock:
+            length = 0
+            if buf is not None:
+                length = len(buf)
+                if length + 2 > len(self._out):
+                    self._out = bytearray(length + 2)
+                self._out[2 : length + 2] = buf
+            await self._write_out(reg_base, reg, length)
+
+    async def write_raw(self, buf):
+        """Write ``buf``, which already starts with the module base and
+        register, as a single transaction"""
+        async with self._lock:
+            await self._wait_ready()
+            with self.i2c_device as i2c:
+                i2c.write(buf)
+
+    def read_start(self, reg_base, reg):  # noqa: PLR6301
+        """Not available: a split read would leave the device lock unheld
+        between its halves. Await `read`, or gather several devices' reads."""
+        raise TypeError("AsyncSeesaw reads must be awaited, use read")
+
+    def read_finish(self, buf):  # noqa: PLR6301
+        """Not available, see `read_start`"""
+        raise TypeError("AsyncSeesaw reads must be awaited, use read")
+
+    async def _read(self, reg_base, reg, buf, delay=None, end=None):
+        """`read` for callers already holding the device lock"""
+        await self._write_out(reg_base, reg, 0)
+        if self._drdy is None:
+            if delay is None:
+                delay = self.timing.delay(reg_base, reg)
+            await asyncio.sleep(delay)
+        else:
+            await self._wait_ready()
+        with self.i2c_device as i2c:
+            # CircuitPython defaults end to sys.maxsize and rejects None
+            if end is None:
+                i2c.readinto(buf)
+            else:
+                i2c.readinto(buf, end=end)
+
+    async def _write_out(self, reg_base, reg, length):
+        """Send the register header followed by the first ``length`` payload
+        bytes already placed in the output buffer. The caller must hold the
+        device lock."""
+        out = self._out
+        out[0] = reg_base
+        out[1] = reg
+        await self._wait_ready()
+        with self.i2c_device as i2c:
+            i2c.write(out, end=length + 2)
+
+    async def _wait_ready(self):
+        drdy = self._drdy
+        if drdy is not None:
+            while drdy.value is False:
+                await asyncio.sleep(0)
+
+
+class AsyncDigitalIO:
+    """asyncio version of `adafruit_seesaw.digitalio.DigitalIO`
+
+    :param AsyncSeesaw seesaw: The device
+    :param int pin: The pin number on the device"""
+
+    def __init__(self, seesaw, pin):
+        self._seesaw = seesaw
+        self._pin = pin
+        self._drive_mode = digitalio.DriveMode.PUSH_PULL
+        self._direction = digitalio.Direction.INPUT
+        self._pull = None
+        self._value = False
+
+    def deinit(self):
+        pass
+
+    async def switch_to_output(self, value=False, drive_mode=digitalio.DriveMode.PUSH_PULL):
+        """Switch the pin to output mode"""
+        await self._seesaw.pin_mode(self._pin, self._seesaw.OUTPUT)
+        await self._seesaw.digital_write(self._pin, value)
+        self._drive_mode = drive_mode
+        self._pull = None
+
+    async def switch_to_input(self, pull=None):
+        """Switch the pin to input mode"""
+        if pull == digitalio.Pull.DOWN:
+            await self._seesaw.pin_mode(self._pin, self._seesaw.INPUT_PULLDOWN)
+        elif pull == digitalio.Pull.UP:
+            await self._seesaw.pin_mode(self._pin, self._seesaw.INPUT_PULLUP)
+        else:
+            await self._seesaw.pin_mode(self._pin, self._seesaw.INPUT)
+        self._pull = pull
+
+    @property
+    def direction(self):
+        """The direction of the pin, changed with `set_direction`"""
+        return self._direction
+
+    async def set_direction(self, value):
+        """Set the direction of the pin"""
+        if value == digitalio.Direction.OUTPUT:
+            await self.switch_to_output()
+        elif value == digitalio.Direction.INPUT:
+            await self.switch_to_input()
+        else:
+            raise ValueError("Out of range")
+        self._direction = value
+
+    async def get_value(self):
+        """The value of the pin. Outputs report the last value set."""
+        if self._direction == digitalio.Direction.OUTPUT:
+            return self._value
+        return await self._seesaw.digital_read(self._pin)
+
+    async def set_value(self, val):
+        """Set the value of an output pin"""
+        if not 0 <= val <= 1:
+            raise ValueError("Out of range")
+        await self._seesaw.digital_write(self._pin, val)
+        self._value = val
+
+    @property
+    def drive_mode(self):
+        """The drive mode of an output pin"""
+        return self._drive_mode
+
+    @property
+    def pull(self):
+        """The pull mode of an input pin, changed with `set_pull`"""
+        return self._pull
+
+    async def set_pull(self, mode):
+        """Set the pull mode of an input pin"""
+        if self._direction == digitalio.Direction.OUTPUT:
+            raise AttributeError("cannot set pull on an output pin")
+        if mode == digitalio.Pull.DOWN:
+            await self._seesaw.pin_mode(self._pin, self._seesaw.INPUT_PULLDOWN)
+        elif mode == digitalio.Pull.UP:
+            await self._seesaw.pin_mode(self._pin, self._seesaw.INPUT_PULLUP)
+        elif mode is None:
+            await self._seesaw.pin_mode(self._pin, self._seesaw.INPUT)
+        else:
+            raise ValueError("Out of range")
+        self._pull = mode
+
+
+class AsyncAnalogInput:
+    """asyncio version of `adafruit_seesaw.analoginput.AnalogInput`
+
+    :param AsyncSeesaw seesaw: The device
+    :param int pin: The pin number on the device
+    :param float delay: The conversion delay, or None to use the device's
+        timing profile"""
+
+    def __init__(self, seesaw, pin, delay=None):
+        self._seesaw = seesaw
+        self._pin = pin
+        self._delay = delay
+
+    def deinit(self):
+        pass
+
+    async def get_value(self):
+        """The current analog value on the pin, as an integer from 0..65535 (inclusive)"""
+        return await self._seesaw.analog_read(self._pin, self._delay)
+
+    @property
+    def reference_voltage(self):
+        """The reference voltage for the pin"""
+        return 3.3
+
+
+class AsyncPWMOut:
+    """asyncio version of `adafruit_seesaw.pwmout.PWMOut`
+
+    :param AsyncSeesaw seesaw: The device
+    :param int pin: The pin number on the device"""
+
+    def __init__(self, seesaw, pin):
+        self._seesaw = seesaw
+        self._pin = pin
+        self._dc = 0
+        self._frequency = 0
+
+    @property
+    def frequency(self):
+        """The overall PWM frequency in Hertz, changed with `set_frequency`"""
+        return self._frequency
+
+    async def set_frequency(self, frequency):
+        """Set the PWM frequency in Hertz"""
+        await self._seesaw.set_pwm_freq(self._pin, frequency)
+        self._frequency = frequency
+
+    @property
+    def duty_cycle(self):
+        """The 16-bit duty cycle last set with `set_duty_cycle`"""
+        return self._dc
+
+    async def set_duty_cycle(self, value):
+        """Set the 16-bit duty cycle, from 0 (always low) to 65535 (always high)"""
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError("Must be 0 to 65535")
+        await self._seesaw.analog_write(self._pin, value)
+        self._dc = value
+
+    @property
+    def fraction(self):
+        """Expresses duty_cycle as a fractional value. Ranges from 0.0-1.0."""
+        return self.duty_cycle / 65535
+
+    async def set_fraction(self, value):
+        """Set the duty cycle as a fraction from 0.0 to 1.0"""
+        if not 0.0 <= value <= 1.0:
+            raise ValueError("Must be 0.0 to 1.0")
+        await self.set_duty_cycle(int(value * 65535))
+
+
+class AsyncIncrementalEncoder:
+    """asyncio version of `adafruit_seesaw.rotaryio.IncrementalEncoder`
+
+    :param AsyncSeesaw seesaw: The device
+    :param int encoder: The encoder number on the device"""
+
+    def __init__(self, seesaw, encoder=0):
+        self._seesaw = seesaw
+        self._encoder = encoder
+
+    async def get_position(self):
+        """The current position in terms of pulses. The number of pulses per
+        rotation is defined by the specific hardware."""
+        return await self._seesaw.encoder_position(self._encoder)
+
+    async def set_position(self, value):
+        """Set the current position"""
+        await self._seesaw.set_encoder_position(value, self._encoder)
+
+
+class AsyncKeypad(AsyncSeesaw):
+    """asyncio version of `adafruit_seesaw.keypad.Keypad`
+
+    :param ~busio.I2C i2c_bus: Bus the SeeSaw is connected to
+    :param int addr: I2C address of the SeeSaw device
+    :param ~digitalio.DigitalInOut drdy: Pin connected to SeeSaw's 'ready' output"""
+
+    EDGE_HIGH = Keypad.EDGE_HIGH
+    EDGE_LOW = Keypad.EDGE_LOW
+    EDGE_FALLING = Keypad.EDGE_FALLING
+    EDGE_RISING = Keypad.EDGE_RISING
+
+    def __init__(self, i2c_bus, addr=0x49, drdy=None, timing=None, shadow=False):
+        super().__init__(i2c_bus, addr, drdy, timing, shadow)
+        self._interrupt_enabled = False
+        self._events = None
+        self._edges = _EdgeShadow()
+
+    def invalidate_shadow(self):
+        """Forget the remembered pin and PWM settings and the keypad events
+        enabled by `set_events`"""
+        super().invalidate_shadow()
+        self._edges = _EdgeShadow()
+
+    @property
+    def interrupt_enabled(self):
+        """The interrupt enable flag, changed with `set_interrupt_enabled`"""
+        return self._interrupt_enabled
+
+    async def set_interrupt_enabled(self, value):
+        """Enable or disable the keypad interrupt"""
+        if value not in {True, False}:
+            raise ValueError("interrupt_enabled must be True or False")
+
+        self._interrupt_enabled = value
+        if value:
+            await self.write8(_KEYPAD_BASE, _KEYPAD_INTENSET, 1)
+        else:
+            await self.write8(_KEYPAD_BASE, _KEYPAD_INTENCLR, 1)
+
+    async def get_count(self):
+        """The number of events waiting in the FIFO"""
+        return await self.read8(_KEYPAD_BASE, _KEYPAD_COUNT)
+
+    async def set_event(self, key, edge, enable):
+        """Control which kinds of events are set
+
+        :param int key: The key number
+        :param int edge: The type of event
+        :param bool enable: True to enable the event, False to disable it"""
+        await self._write_edges(key, _EdgeShadow.mask((edge,), enable), enable)
+
+    async def set_events(self, keys, edges, enable=True, force=False):
+        """Enable or disable several kinds of events on several keys, see
+        `adafruit_seesaw.keypad.Keypad.set_events`
+
+        :return: The number of writes sent"""
+        mask = _EdgeShadow.mask(edges, enable)
+        writes = 0
+        for key in keys:
+            needed = mask if force else self._edges.needed(key, mask, enable)
+            if needed:
+                await self._write_edges(key, needed, enable)
+                writes += 1
+        return writes
+
+    async def _write_edges(self, key, mask, enable):
+        async with self._lock:
+            await self._write_out(
+                _KEYPAD_BASE, _KEYPAD_EVENT, _EdgeShadow.pack(self._out, key, mask, enable)
+            )
+        self._edges.record(key, mask, enable)
+
+    async def read_keypad(self, num):
+        """Read data from the keypad
+
+        :param int num: The number of bytes to read"""
+        ret = bytearray(num)
+        await self.read(_KEYPAD_BASE, _KEYPAD_FIFO, ret)
+        return ret
+
+    async def get_events(self):
+        """Read every waiting event as a list of
+        `adafruit_seesaw.keypad.KeyEvent`"""
+        count = await self.get_count()
+        if not count:
+            return []
+        return _key_events(await self.read_keypad(count))
+
+    async def drain(self, events=None):
+        """Read the waiting events into a reusable
+        `adafruit_seesaw.keypad.KeyEvents` buffer, see
+        `adafruit_seesaw.keypad.Keypad.drain`"""
+        if events is None:
+            events = self._events
+            if events is None:
+                events = self._events = KeyEvents()
+        async with self._lock:
+            buf = self._in1
+            await self._read(_KEYPAD_BASE, _KEYPAD_COUNT, buf)
+            count = min(buf[0], len(events.raw))
+            if count:
+                await self._read(_KEYPAD_BASE, _KEYPAD_FIFO, events.raw, end=count)
+        events.decode(count)
+        return events
@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.benchmark`
+====================================================
+
+Microbenchmarks for the seesaw register layer, run against
+`adafruit_seesaw.emulator` on a host computer.
+
+For every call under test the suite reports the time spent in the driver's
+Python code, the time it spent sleeping on conversion delays, the bus
+traffic and the heap blocks the call allocated. Sleeps happen on a virtual
+clock, so they are accounted for without costing wall time. The Python time
+and allocations are taken with the emulated bus detached, so the emulator's
+own handling of each transaction is not counted against the driver.
+
+Run the whole suite with::
+
+    python -m adafruit_seesaw.benchmark
+
+* Author(s): Adafruit Industries
+"""
+
+import array
+import time
+import tracemalloc
+
+import digitalio
+
+from adafruit_seesaw.analoginput import AnalogInput
+from adafruit_seesaw.digitalio import DigitalIO
+from adafruit_seesaw.emulator import EmulatedI2C, SeesawEmulator
+from adafruit_seesaw.keypad import Keypad
+from adafruit_seesaw.neopixel import NeoPixel
+from adafruit_seesaw.pwmout import PWMOut
+from adafruit_seesaw.seesaw import Seesaw
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+_ATTINY817_HW_ID_CODE = 0x87
+_SAMD09_HW_ID_CODE = 0x55
+_CRICKIT_PID = 9999
+
+
+class BenchmarkResult:
+    """Per-call cost of one benchmarked operation
+
+    :param str name: What was measured
+    :param int calls: How many calls the figures are averaged over"""
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+        #: Seconds of driver Python execution per call, with the bus detached
+        self.python_time = 0.0
+        #: Seconds spent in ``time.sleep`` per call
+        self.sleep_time = 0.0
+        #: Estimated seconds on the wire per call, see `bus_time`
+        self.bus_time = 0.0
+        #: Bytes written to and read from the bus per call
+        self.bus_bytes = 0.0
+        #: I2C transactions per call
+        self.transactions = 0.0
+        #: Heap blocks per call that are still allocated when it returns, its
+        #: result included, as traced by `tracemalloc`. Temporaries freed
+        #: before the call returns are not counted.
+        self.allocations = 0.0
+
+    @property
+    def calls_per_second(self):
+        """Throughput of back to back calls on a single device"""
+        total = self.python_time + self.sleep_time + self.bus_time
+        return 1 / total if total else float("inf")
+
+    def __str__(self):
+        return (
+            f"{self.name:<36} {self.calls_per_second:>9.0f} "
+            f"{self.python_time * 1e6:>9.1f} {self.sleep_time * 1e6:>9.1f} "
+            f"{self.bus_time * 1e6:>9.1f} {self.bus_bytes:>6.1f} "
+            f"{self.transactions:>5.1f} {self.allocations:>6.1f}"
+        )
+
+    #: Column titles matching the layout of `str` on a result
+    HEADER = (
+        f"{'call':<36} {'calls/s':>9} {'py us':>9} {'sleep us':>9} "
+        f"{'bus us':>9} {'bytes':>6} {'xfers':>5} {'allocs':>6}"
+    )
+
+
+def bus_time(transactions, nbytes, frequency=100000):
+    """Estimate the time on the wire for a number of transactions and bytes.
+
+    Every byte costs nine clocks with its ACK, and every transaction adds an
+    address byte plus its start and stop conditions."""
+    return (9 * (nbytes + transactions) + 2 * transactions) / frequency
+
+
+def _python_time(func, i2c, calls):
+    """Average wall time of ``calls`` calls of ``func`` with the bus detached,
+    so that only the driver's own code is timed"""
+    i2c.detached = True
+    try:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        return (time.perf_counter() - start) / calls
+    finally:
+        i2c.detached = False
+
+
+def _allocations(func, i2c, calls):
+    """Average number of heap blocks each of ``calls`` calls of ``func``
+    leaves allocated
+
+    The results are kept, so objects a call returns count as well as any it
+    keeps itself. The bus is detached meanwhile so that only the driver's
+    allocations count."""
+    results = [None] * calls
+    exclude = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    i2c.detached = True
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for index in range(calls):
+            results[index] = func()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        i2c.detached = False
+    before = before.filter_traces(exclude)
+    after = after.filter_traces(exclude)
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename")) / calls
+
+
+def measure(name, func, i2c, calls=500, warmup=20, alloc_calls=100, frequency=100000):
+    """Benchmark ``func``, which talks over the emulated bus ``i2c``.
+
+    The virtual clock of ``i2c`` must be installed while this runs. The sleep
+    and traffic figures come from calls on the attached bus, the Python time
+    and allocations from further calls with it detached.
+
+    :param str name: The name to report the result under
+    :param func: A callable taking no arguments
+    :param ~adafruit_seesaw.emulator.EmulatedI2C i2c: The bus ``func`` uses
+    :param int calls: Calls to average timing and traffic over
+    :param int warmup: Calls made before measuring anything
+    :param int alloc_calls: Calls to average allocations over
+    :param int frequency: Bus clock used for the wire time estimate"""
+    clock = i2c.clock
+    for _ in range(warmup):
+        func()
+    result = BenchmarkResult(name, calls)
+
+    i2c.reset_counters()
+    slept = clock.slept
+    for _ in range(calls):
+        func()
+    result.sleep_time = (clock.slept - slept) / calls
+    result.bus_bytes = (i2c.bytes_written + i2c.bytes_read) / calls
+    result.transactions = i2c.transactions / calls
+    result.bus_time = bus_time(i2c.transactions, i2c.bytes_written + i2c.bytes_read, frequency)
+    result.bus_time /= calls
+
+    result.python_time = _python_time(func, i2c, calls)
+    result.allocations = _allocations(func, i2c, alloc_calls)
+    return result
+
+
+def default_cases(i2c):
+    """Attach emulated devices to ``i2c`` and return ``(name, callable)``
+    pairs for the hot paths of the driver."""
+    attiny = i2c.add_device(0x49, SeesawEmulator(chip_id=_ATTINY817_HW_ID_CODE))
+    i2c.add_device(0x4A, SeesawEmulator(chip_id=_SAMD09_HW_ID_CODE, pid=_CRICKIT_PID))
+    i2c.add_device(0x4B, SeesawEmulator(chip_id=_ATTINY817_HW_ID_CODE))
+
+    seesaw = Seesaw(i2c, 0x49)
+    crickit = Seesaw(i2c, 0x4A)
+    keypad = Keypad(i2c, 0x4B)
+
+    attiny.set_analog(2, 512)
+    touch_pin = crickit.pin_mapping.touch_pins[0]
+    pixels = NeoPixel(seesaw, 10, 60, auto_write=False, track_changes=False)
+    pixel_buffer = bytearray(60 * pixels.bpp)
+    tracked = NeoPixel(seesaw, 10, 60, auto_write=False)
+
+    def change_one_pixel():
+        pixel_buffer[90] ^= 0xFF
+        tracked._transmit(pixel_buffer)
+
+    button = DigitalIO(seesaw, 18)
+    button.switch_to_input(digitalio.Pull.UP)
+    led = DigitalIO(seesaw, 12)
+    led.switch_to_output()
+    pwm = PWMOut(seesaw, 0)
+    analog = AnalogInput(seesaw, 2)
+    analog_pins = seesaw.pin_mapping.analog_pins
+    samples = array.array("H", bytes(2 * len(analog_pins)))
+
+    return [
+        ("Seesaw.digital_read_bulk", lambda: seesaw.digital_read_bulk(0xFFFF)),
+        ("Seesaw.analog_read", lambda: seesaw.analog_read(2)),
+        (
+            f"Seesaw.analog_scan ({len(analog_pins)} pins)",
+            lambda: seesaw.analog_scan(analog_pins, samples),
+        ),
+        ("Seesaw.encoder_position", seesaw.encoder_position),
+        ("Seesaw.touch_read", lambda: crickit.touch_read(touch_pin)),
+        ("Seesaw.analog_write", lambda: seesaw.analog_write(0, 0x8000)),
+        ("NeoPixel._transmit (60 px)", lambda: pixels._transmit(pixel_buffer)),
+        ("NeoPixel._transmit (1 of 60 px)", change_one_pixel),
+        ("Keypad.read_keypad", lambda: keypad.read_keypad(4)),
+        ("Keypad.drain (idle)", keypad.drain),
+        ("DigitalIO.value (input)", lambda: button.value),
+        ("DigitalIO.value = (output)", lambda: setattr(led, "value", True)),
+        ("PWMOut.duty_cycle =", lambda: setattr(pwm, "duty_cycle", 0x8000)),
+        ("AnalogInput.value", lambda: analog.value),
+    ]
+
+
+def run(calls=500, frequency=100000, cases=None):
+    """Run the suite against fresh emulated devices and return the results.
+
+    :param int calls: Calls to average each result over
+    :param int frequency: Bus clock used for the wire time estimate
+    :param cases: A function taking the bus and returning ``(name, callable)``
+        pairs. Defaults to `default_cases`."""
+    i2c = EmulatedI2C()
+    with i2c.clock:
+        benchmarks = (cases or default_cases)(i2c)
+        return [
+            measure(name, func, i2c, calls=calls, frequency=frequency) for name, func in benchmarks
+        ]
+
+
+def main():
+    """Print the results of the default suite"""
+    print(BenchmarkResult.HEADER)
+    for result in run():
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
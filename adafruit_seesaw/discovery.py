@@ -0,0 +1,310 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.discovery`
+====================================================
+
+Finding seesaw devices on a bus, and remembering them for the next start.
+
+Constructing a `adafruit_seesaw.seesaw.Seesaw` resets the device and reads
+its IDs, so trying every candidate address that way costs over half a second
+each. `probe` instead scans the bus, then reads HW_ID from every responding
+address in one overlapped pass and VERSION from the seesaws among them in a
+second, without resetting anything. The results can be saved to a small JSON
+cache, from which `attach` builds the device objects without any bus
+traffic.
+
+.. code-block:: python
+
+    from adafruit_seesaw import discovery
+
+    devices = discovery.discover(board.I2C(), "/seesaw.json")
+    seesaws = discovery.attach(board.I2C(), devices)
+
+The same scan is available from the command line as
+``python -m adafruit_seesaw scan``.
+
+`init_group` constructs many devices with a single reset wait between them,
+rather than one per device.
+
+* Author(s): Adafruit Industries
+"""
+
+import struct
+import time
+
+from adafruit_bus_device.i2c_device import I2CDevice
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(x):
+        return x
+
+
+from adafruit_seesaw.scheduler import ReadSchedule
+from adafruit_seesaw.seesaw import Seesaw, pin_mapping_for
+from adafruit_seesaw.timing import DEFAULT_DELAY
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+_STATUS_BASE = const(0x00)
+
+_STATUS_HW_ID = const(0x01)
+_STATUS_VERSION = const(0x02)
+_STATUS_SWRST = const(0x7F)
+
+_READY_POLL_INTERVAL = 0.002
+_READY_POLL_MAX_INTERVAL = 0.05
+
+#: The addresses `probe` tries by default: the factory addresses of the
+#: seesaw breakouts, shields and wings that no common non-seesaw part shares.
+#: Probing writes the bytes ``0x00 0x01`` to each responding address, which
+#: any other device there takes as an ordinary register write. So 0x36 (the
+#: soil sensor, rotary encoder and Crickit, but also the MAX17048 fuel gauge),
+#: 0x50 (the Gamepad QT, but also 24Cxx EEPROMs) and 0x60 (the NeoKey 1x4 and
+#: NeoSlider, but also MCP4725 DACs and Si5351 clocks) are left out. Pass them
+#: explicitly on buses known to be free of those parts.
+DEFAULT_ADDRESSES = (0x2E, 0x30, 0x3A, 0x49, 0x5E)
+
+#: A wide range that also covers 0x36, 0x50, 0x60 and boards moved with their
+#: address jumpers. Every device answering in it receives the two byte probe
+#: write: a 24Cxx EEPROM at 0x50 to 0x57 stores 0x01 at memory address 0, an
+#: MCP4725 DAC at 0x60 to 0x67 changes its output voltage, and other parts
+#: may change a register. Only probe it on buses holding nothing but seesaws
+#: and devices known to ignore such a write.
+ALL_ADDRESSES = (0x2E, *range(0x30, 0x61))
+
+
+class DeviceInfo:
+    """What `probe` learned about one device
+
+    :param int address: The I2C address
+    :param int chip_id: The hardware ID
+    :param int pid: The product ID, the upper 16 bits of VERSION
+    :param int date_code: The firmware date code, the lower 16 bits"""
+
+    def __init__(self, address, chip_id, pid, date_code=0):
+        self.address = address
+        self.chip_id = chip_id
+        self.pid = pid
+        self.date_code = date_code
+
+    def __repr__(self):
+        return (
+            f"DeviceInfo(0x{self.address:02x}, chip_id=0x{self.chip_id:02x}, "
+            f"pid={self.pid}, date_code={self.date_code})"
+        )
+
+    @property
+    def pin_mapping(self):
+        """The pin mapping class the device will use"""
+        return pin_mapping_for(self.chip_id, self.pid)
+
+    @property
+    def identity(self):
+        """The ``identity`` argument for `adafruit_seesaw.seesaw.Seesaw`"""
+        return (self.chip_id, self.pid)
+
+    def to_dict(self):
+        """A JSON serializable representation of the device"""
+        return {
+            "address": self.address,
+            "chip_id": self.chip_id,
+            "pid": self.pid,
+            "date_code": self.date_code,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild the information from the output of `to_dict`"""
+        return cls(data["address"], data["chip_id"], data["pid"], data.get("date_code", 0))
+
+
+class _Probe:
+    """Just enough of a device for a `ReadSchedule`, before it is identified"""
+
+    def __init__(self, i2c, address):
+        self.address = address
+        self.chip_id = None
+        self.i2c_device = I2CDevice(i2c, address, probe=False)
+        self._select = bytearray(2)
+
+    def read_start(self, reg_base, reg):
+        select = self._select
+        select[0] = reg_base
+        select[1] = reg
+        with self.i2c_device as i2c:
+            i2c.write(select)
+        return DEFAULT_DELAY
+
+    def read_finish(self, buf):
+        with self.i2c_device as i2c:
+            i2c.readinto(buf)
+
+    def reset(self):
+        with self.i2c_device as i2c:
+            i2c.write(bytes((_STATUS_BASE, _STATUS_SWRST, 0xFF)))
+
+
+def _scan(i2c):
+    while not i2c.try_lock():
+        pass
+    try:
+        return i2c.scan()
+    finally:
+        i2c.unlock()
+
+
+def _read_each(devices, reg, size):
+    """Read status register ``reg`` from every device with the delays
+    overlapped, giving None for devices that NAK instead of failing them all"""
+    results = [None] * len(devices)
+    selected = []
+    for index, device in enumerate(devices):
+        try:
+            selected.append((index, device.read_start(_STATUS_BASE, reg)))
+        except OSError:
+            pass
+    if selected:
+        time.sleep(max(delay for _, delay in selected))
+    for index, _ in selected:
+        buf = bytearray(size)
+        try:
+            devices[index].read_finish(buf)
+        except OSError:
+            continue
+        results[index] = buf
+    return results
+
+
+def _not_ready(devices):
+    """The ``devices`` that do not answer with a known hardware ID yet"""
+    pending = []
+    for device, buf in zip(devices, _read_each(devices, _STATUS_HW_ID, 1)):
+        if buf is not None and pin_mapping_for(buf[0], 0) is not None:
+            device.chip_id = buf[0]
+        else:
+            pending.append(device)
+    return pending
+
+
+def probe(i2c, addresses=DEFAULT_ADDRESSES):
+    """Find the seesaw devices on a bus without resetting them. Devices that
+    NAK or answer with an unknown hardware ID are skipped.
+
+    Every responding address in ``addresses`` is sent the two bytes
+    ``0x00 0x01``, which select HW_ID on a seesaw but are a register write to
+    any other kind of device, and may change its state or stored data. Only
+    pass addresses where no such device could be, see `ALL_ADDRESSES`.
+
+    :param ~busio.I2C i2c: The bus
+    :param addresses: The addresses to consider, see `DEFAULT_ADDRESSES`
+    :return: A `DeviceInfo` for every seesaw found, in address order"""
+    found = set(_scan(i2c))
+    probes = [_Probe(i2c, address) for address in sorted(found) if address in addresses]
+    seesaws = [
+        (device, buf[0])
+        for device, buf in zip(probes, _read_each(probes, _STATUS_HW_ID, 1))
+        if buf is not None and pin_mapping_for(buf[0], 0) is not None
+    ]
+    versions = _read_each([device for device, _ in seesaws], _STATUS_VERSION, 4)
+    return [
+        DeviceInfo(device.address, chip_id, *struct.unpack(">HH", version))
+        for (device, chip_id), version in zip(seesaws, versions)
+        if version is not None
+    ]
+
+
+def save(devices, path):
+    """Write ``devices``, as returned by `probe`, to a JSON file at ``path``"""
+    import json  # noqa: PLC0415
+
+    with open(path, "w") as file:
+        json.dump({"devices": [device.to_dict() for device in devices]}, file)
+
+
+def load(path):
+    """Read the devices written by `save`"""
+    import json  # noqa: PLC0415
+
+    with open(path) as file:
+        return [DeviceInfo.from_dict(data) for data in json.load(file)["devices"]]
+
+
+def discover(i2c, path=None, addresses=DEFAULT_ADDRESSES, refresh=False):
+    """The devices on a bus, from the cache at ``path`` if there is one,
+    otherwise from `probe`, saving the results to ``path``.
+
+    :param ~busio.I2C i2c: The bus
+    :param str path: The cache file, or None to always probe
+    :param addresses: The addresses to consider when probing
+    :param bool refresh: Probe even if the cache exists"""
+    if path is not None and not refresh:
+        try:
+            return load(path)
+        except (OSError, ValueError, KeyError):
+            pass
+    devices = probe(i2c, addresses)
+    if path is not None:
+        save(devices, path)
+    return devices
+
+
+def attach(i2c, devices, cls=Seesaw, verify=False, **kwargs):
+    """Build device objects for ``devices`` without touching the bus.
+
+    :param ~busio.I2C i2c: The bus the devices are on
+    :param devices: `DeviceInfo` objects, from `probe` or `load`
+    :param cls: The class to build, which must accept ``identity``
+    :param bool verify: Read each device's IDs and check they still match,
+        using `adafruit_seesaw.seesaw.Seesaw.attach`
+    :return: The devices, in the order of ``devices``"""
+    if verify:
+        return [cls.attach(i2c, device.address, device.identity, **kwargs) for device in devices]
+    return [cls(i2c, device.address, identity=device.identity, **kwargs) for device in devices]
+
+
+def init_group(specs, timeout=0.5, **kwargs):
+    """Reset and construct several devices, waiting for all of them to
+    restart at once instead of half a second each.
+
+    Every device is sent a software reset first. They are then polled until
+    each answers, their versions are read in one overlapped pass, and each is
+    constructed with the resulting ``identity``, which picks its pin mapping
+    without further reads.
+
+    :param specs: ``(i2c, address, cls)`` tuples, where ``cls`` is
+        `adafruit_seesaw.seesaw.Seesaw` or a class that accepts ``identity``
+    :param float timeout: The longest to wait for the devices to restart
+    :raises RuntimeError: If a device did not answer in time
+    :return: The devices, in the order of ``specs``
+
+    Other arguments are passed to every class."""
+    probes = [_Probe(i2c, address) for i2c, address, _ in specs]
+    for device in probes:
+        device.reset()
+    pending = probes
+    deadline = time.monotonic() + timeout
+    interval = _READY_POLL_INTERVAL
+    while pending:
+        time.sleep(interval)
+        pending = _not_ready(pending)
+        if pending and time.monotonic() >= deadline:
+            raise RuntimeError(
+                "Seesaw at "
+                + ", ".join(f"0x{device.address:02x}" for device in pending)
+                + " did not answer after reset"
+            )
+        interval = max(0, min(interval * 2, _READY_POLL_MAX_INTERVAL, deadline - time.monotonic()))
+    schedule = ReadSchedule()
+    for device in probes:
+        schedule.add(device, _STATUS_BASE, _STATUS_VERSION, ">HH")
+    return [
+        cls(i2c, address, identity=(device.chip_id, pid), **kwargs)
+        for (i2c, address, cls), device, (pid, _) in zip(specs, probes, schedule.run())
+    ]
@@ -0,0 +1,765 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.emulator`
+====================================================
+
+An in-process stand-in for seesaw hardware, for use on a host computer.
+
+`EmulatedI2C` behaves like a `busio.I2C` bus and can be handed to
+`adafruit_seesaw.seesaw.Seesaw` (or any of its subclasses) in place of a real
+bus. Each address on it is answered by a `SeesawEmulator`, which implements the
+register protocol used by `Seesaw.read` and `Seesaw.write`. Conversion delays
+are modelled on a `VirtualClock`, so the driver's ``time.sleep`` calls cost no
+wall time while the clock is installed.
+
+.. code-block:: python
+
+    from adafruit_seesaw.emulator import EmulatedI2C, SeesawEmulator
+    from adafruit_seesaw.seesaw import Seesaw
+
+    i2c = EmulatedI2C()
+    device = i2c.add_device(0x49, SeesawEmulator(chip_id=0x87, pid=5743))
+    with i2c.clock:
+        ss = Seesaw(i2c, 0x49)
+        device.set_analog(2, 512)
+        print(ss.analog_read(2), i2c.clock.now)
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(x):
+        return x
+
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+_STATUS_BASE = const(0x00)
+_GPIO_BASE = const(0x01)
+_SERCOM0_BASE = const(0x02)
+_TIMER_BASE = const(0x08)
+_ADC_BASE = const(0x09)
+_EEPROM_BASE = const(0x0D)
+_NEOPIXEL_BASE = const(0x0E)
+_TOUCH_BASE = const(0x0F)
+_KEYPAD_BASE = const(0x10)
+_ENCODER_BASE = const(0x11)
+
+_STATUS_HW_ID = const(0x01)
+_STATUS_VERSION = const(0x02)
+_STATUS_OPTIONS = const(0x03)
+_STATUS_TEMP = const(0x04)
+_STATUS_SWRST = const(0x7F)
+
+_GPIO_DIRSET_BULK = const(0x02)
+_GPIO_DIRCLR_BULK = const(0x03)
+_GPIO_BULK = const(0x04)
+_GPIO_BULK_SET = const(0x05)
+_GPIO_BULK_CLR = const(0x06)
+_GPIO_BULK_TOGGLE = const(0x07)
+_GPIO_INTENSET = const(0x08)
+_GPIO_INTENCLR = const(0x09)
+_GPIO_INTFLAG = const(0x0A)
+_GPIO_PULLENSET = const(0x0B)
+_GPIO_PULLENCLR = const(0x0C)
+
+_SERCOM_STATUS = const(0x00)
+_SERCOM_INTEN = const(0x02)
+_SERCOM_INTENCLR = const(0x03)
+_SERCOM_BAUD = const(0x04)
+_SERCOM_DATA = const(0x05)
+
+_SERCOM_STATUS_DATA_RDY = const(0x02)
+_SERCOM_INTEN_DATA_RDY = const(0x01)
+
+_TIMER_PWM = const(0x01)
+_TIMER_FREQ = const(0x02)
+
+_ADC_STATUS = const(0x00)
+_ADC_INTEN = const(0x02)
+_ADC_INTENCLR = const(0x03)
+_ADC_WINMODE = const(0x04)
+_ADC_WINTHRESH = const(0x05)
+_ADC_CHANNEL_OFFSET = const(0x07)
+
+_ADC_WINMON = const(0x02)
+
+_NEOPIXEL_PIN = const(0x01)
+_NEOPIXEL_SPEED = const(0x02)
+_NEOPIXEL_BUF_LENGTH = const(0x03)
+_NEOPIXEL_BUF = const(0x04)
+_NEOPIXEL_SHOW = const(0x05)
+
+_TOUCH_CHANNEL_OFFSET = const(0x10)
+
+_KEYPAD_EVENT = const(0x01)
+_KEYPAD_INTENSET = const(0x02)
+_KEYPAD_INTENCLR = const(0x03)
+_KEYPAD_COUNT = const(0x04)
+_KEYPAD_FIFO = const(0x10)
+
+_KEYPAD_EDGE_RISING = const(3)
+_KEYPAD_EDGE_FALLING = const(2)
+
+_ENCODER_INTENSET = const(0x10)
+_ENCODER_INTENCLR = const(0x20)
+_ENCODER_POSITION = const(0x30)
+_ENCODER_DELTA = const(0x40)
+
+_SAMD09_HW_ID_CODE = const(0x55)
+_ATTINY817_HW_ID_CODE = const(0x87)
+
+_PORT_MASK = const(0xFFFFFFFF)
+
+#: Time, in seconds, the emulated firmware needs before a selected register
+#: can be read back. Keys are a module base, or a ``(base, register)`` tuple
+#: for registers that differ from the rest of their module.
+RESPONSE_TIMES = {
+    _STATUS_BASE: 0.0002,
+    (_STATUS_BASE, _STATUS_TEMP): 0.001,
+    _GPIO_BASE: 0.0002,
+    _SERCOM0_BASE: 0.0002,
+    _TIMER_BASE: 0.0002,
+    _ADC_BASE: 0.0005,
+    _EEPROM_BASE: 0.0002,
+    _NEOPIXEL_BASE: 0.0002,
+    _TOUCH_BASE: 0.003,
+    _KEYPAD_BASE: 0.0002,
+    _ENCODER_BASE: 0.0002,
+}
+
+_EEPROM_SIZES = {
+    _SAMD09_HW_ID_CODE: 64,
+    0x88: 256,  # ATtiny1616
+    0x89: 256,  # ATtiny1617
+}
+
+
+class VirtualClock:
+    """A monotonic clock that only moves forward when something sleeps on it.
+
+    Used as a context manager it replaces `time.sleep` and `time.monotonic`
+    with its own, so that driver code waiting on conversion delays advances
+    the clock instantly instead of blocking. Do not install it while an
+    asyncio event loop is running, since the loop also reads `time.monotonic`.
+
+    :param float start: The initial reading of the clock, in seconds"""
+
+    def __init__(self, start=0.0):
+        self.now = start
+        #: Total time, in seconds, passed to `sleep` since creation
+        self.slept = 0.0
+        self._saved = None
+
+    def monotonic(self):
+        """The current reading of the clock, in seconds"""
+        return self.now
+
+    def monotonic_ns(self):
+        """The current reading of the clock, in nanoseconds"""
+        return int(self.now * 1000000000)
+
+    def sleep(self, seconds):
+        """Advance the clock by ``seconds`` without blocking"""
+        if seconds > 0:
+            self.now += seconds
+            self.slept += seconds
+
+    def advance(self, seconds):
+        """Let ``seconds`` pass without counting them as sleep time"""
+        self.now += seconds
+
+    def __enter__(self):
+        self._saved = (time.sleep, time.monotonic, time.monotonic_ns)
+        time.sleep = self.sleep
+        time.monotonic = self.monotonic
+        time.monotonic_ns = self.monotonic_ns
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        time.sleep, time.monotonic, time.monotonic_ns = self._saved
+        self._saved = None
+
+
+class SystemClock:
+    """A clock that follows `time.monotonic`, for emulating devices under an
+    asyncio event loop, where `VirtualClock` cannot be installed"""
+
+    @property
+    def now(self):
+        """The current reading of the clock, in seconds"""
+        return time.monotonic()
+
+
+class EmulatedI2C:
+    """A `busio.I2C` compatible bus whose devices are emulated in-process.
+
+    Every transaction is counted, so the bus doubles as a meter for the traffic
+    a piece of driver code generates.
+
+    :param clock: The clock used to time conversion delays, a `VirtualClock`
+        or a `SystemClock`. A new `VirtualClock` is created when omitted."""
+
+    def __init__(self, clock=None):
+        self.clock = VirtualClock() if clock is None else clock
+        self.devices = {}
+        #: When True, transactions are acknowledged but neither delivered to
+        #: the devices nor counted, so the bus itself allocates nothing.
+        self.detached = False
+        self._locked = False
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Zero the transaction and byte counters"""
+        #: Number of completed write or read transactions
+        self.transactions = 0
+        #: Number of bytes sent to devices
+        self.bytes_written = 0
+        #: Number of bytes received from devices
+        self.bytes_read = 0
+
+    def add_device(self, address, device):
+        """Answer ``address`` with ``device`` and return the device"""
+        self.devices[address] = device
+        return device
+
+    def remove_device(self, address):
+        """Stop answering ``address``"""
+        del self.devices[address]
+
+    def _device(self, address):
+        device = self.devices.get(address)
+        if device is None:
+            raise OSError(19, "No such device")
+        return device
+
+    def try_lock(self):
+        """Lock the bus, returning False if it is already locked"""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        """Release the bus lock"""
+        self._locked = False
+
+    def scan(self):
+        """List the addresses that acknowledge"""
+        now = self.clock.now
+        return sorted(addr for addr, device in self.devices.items() if device.responding(now))
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        """Write ``buffer[start:end]`` to the device at ``address``"""
+        if self.detached:
+            return
+        if end is None:
+            end = len(buffer)
+        self._device(address).handle_write(bytes(buffer[start:end]), self.clock.now)
+        self.transactions += 1
+        self.bytes_written += end - start
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        """Read into ``buffer[start:end]`` from the device at ``address``"""
+        if self.detached:
+            return
+        if end is None:
+            end = len(buffer)
+        data = self._device(address).handle_read(end - start, self.clock.now)
+        buffer[start:end] = data
+        self.transactions += 1
+        self.bytes_read += end - start
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        buffer_out,
+        buffer_in,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None,
+    ):
+        """Write to, then read from, the device at ``address``"""
+        self.writeto(address, buffer_out, start=out_start, end=out_end)
+        self.readfrom_into(address, buffer_in, start=in_start, end=in_end)
+
+    def deinit(self):
+        """Release the bus. Nothing to do for an emulated bus."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.deinit()
+
+
+class SeesawEmulator:
+    """Register-level model of a seesaw device.
+
+    The emulator keeps the state a host can observe over I2C: GPIO direction,
+    pulls and latches, ADC and touch readings, the ADC window comparator, PWM
+    settings, the UART, encoders, the keypad FIFO, the NeoPixel buffer and the
+    EEPROM. Inputs from the outside world are injected with `set_input`,
+    `set_analog`, `set_touch`, `receive`, `turn`, `press` and `release`.
+
+    Reading a register sooner than its response time after selecting it
+    returns ``0xFF`` bytes, which is how a driver that does not wait long
+    enough would see garbage on real hardware.
+
+    :param int chip_id: The value reported by the HW_ID register
+    :param int pid: The product ID reported in the upper half of VERSION
+    :param int date_code: The lower half of VERSION
+    :param int options: The module bitmask reported by OPTIONS. Defaults to
+        every module the emulator implements.
+    :param dict response_times: Overrides for `RESPONSE_TIMES`
+    :param float boot_time: How long the device ignores the bus after a
+        software reset, in seconds
+    :param int eeprom_size: Size of the EEPROM in bytes. Chosen from
+        ``chip_id`` when omitted.
+    :param int max_write: The longest write transaction, header included,
+        the device accepts. Longer writes are NAKed. None for no limit."""
+
+    def __init__(
+        self,
+        chip_id=_ATTINY817_HW_ID_CODE,
+        pid=0,
+        *,
+        date_code=0,
+        options=None,
+        response_times=None,
+        boot_time=0.01,
+        eeprom_size=None,
+        max_write=None,
+    ):
+        self.chip_id = chip_id
+        self.max_write = max_write
+        self.pid = pid
+        self.date_code = date_code
+        if options is None:
+            options = 0
+            for base in RESPONSE_TIMES:
+                if not isinstance(base, tuple):
+                    options |= 1 << base
+        self.options = options
+        self.response_times = dict(RESPONSE_TIMES)
+        if response_times:
+            self.response_times.update(response_times)
+        self.boot_time = boot_time
+        if eeprom_size is None:
+            eeprom_size = _EEPROM_SIZES.get(chip_id, 128)
+        self.eeprom = bytearray(b"\xff" * eeprom_size)
+        #: The temperature reported by the TEMP register, in degrees C
+        self.temperature = 25.0
+        #: Number of reads that came before the register was ready
+        self.early_reads = 0
+        #: Number of software resets received
+        self.resets = 0
+        self._ready_at = 0.0
+        self._reset_state()
+
+    def _reset_state(self):
+        self.direction = 0
+        self.pulls = 0
+        self.latch = 0
+        self.gpio_inten = 0
+        self.gpio_intflag = 0
+        #: External levels applied to input pins, keyed by pin number
+        self.inputs = {}
+        self._last_levels = 0
+        #: ADC readings keyed by firmware channel offset
+        self.adc = {}
+        self.adc_inten = 0
+        self.adc_status = 0
+        self.adc_winmode = 0
+        self.adc_winthresh = (0, 0)
+        #: The channel the window comparator watches, the last one read
+        self.adc_window_channel = None
+        #: Touch readings keyed by firmware channel offset
+        self.touch = {}
+        #: PWM duty cycles keyed by firmware channel offset
+        self.pwm = {}
+        #: PWM frequencies keyed by firmware channel offset
+        self.pwm_freq = {}
+        self.encoders = [0, 0, 0, 0]
+        self._encoder_last = [0, 0, 0, 0]
+        self.encoder_inten = 0
+        self.encoder_intflag = 0
+        self.uart_baud = None
+        self.uart_inten = 0
+        #: Bytes received on the UART and not yet read by the host
+        self.uart_rx = bytearray()
+        #: Bytes the host has sent out of the UART
+        self.uart_tx = bytearray()
+        self.keypad_events = set()
+        self.keypad_inten = False
+        self.keypad_fifo = []
+        self.neopixel_pin = None
+        self.neopixel_speed = None
+        self.neopixel_buf = bytearray()
+        #: The NeoPixel buffer as of the most recent SHOW
+        self.shown = b""
+        #: Number of SHOW commands received
+        self.shows = 0
+        self._selected = (_STATUS_BASE, _STATUS_HW_ID)
+        self._selected_at = 0.0
+
+    def responding(self, now):
+        """Whether the device acknowledges its address at time ``now``"""
+        return now >= self._ready_at
+
+    @property
+    def interrupt(self):
+        """True while the device is holding its INT line asserted"""
+        return bool(
+            self.gpio_intflag
+            or self.encoder_intflag
+            or (self.adc_inten & self.adc_status & _ADC_WINMON)
+            or (self.uart_inten & _SERCOM_INTEN_DATA_RDY and self.uart_rx)
+            or (self.keypad_inten and self.keypad_fifo)
+        )
+
+    def response_time(self, base, reg):
+        """How long after selection the register ``(base, reg)`` can be read"""
+        delay = self.response_times.get((base, reg))
+        if delay is None:
+            delay = self.response_times.get(base, 0.0)
+        return delay
+
+    # Outside world
+
+    def levels(self):
+        """The logic level of every pin as a 64 bit mask"""
+        levels = self.latch & self.direction
+        for pin in range(64):
+            bit = 1 << pin
+            if self.direction & bit:
+                continue
+            if pin in self.inputs:
+                if self.inputs[pin]:
+                    levels |= bit
+            elif self.pulls & bit:
+                levels |= self.latch & bit
+        return levels
+
+    def _update_gpio_interrupts(self):
+        levels = self.levels()
+        self.gpio_intflag |= (levels ^ self._last_levels) & self.gpio_inten & ~self.direction
+        self._last_levels = levels
+
+    def set_input(self, pin, value):
+        """Drive input ``pin`` high or low, or release it with ``None``"""
+        if value is None:
+            self.inputs.pop(pin, None)
+        else:
+            self.inputs[pin] = bool(value)
+        self._update_gpio_interrupts()
+
+    def set_analog(self, channel, value):
+        """Set the reading of ADC ``channel`` (the firmware channel offset)"""
+        self.adc[channel] = value
+        self._update_adc_window()
+
+    def _update_adc_window(self):
+        channel = self.adc_window_channel
+        if not self.adc_winmode or channel is None:
+            return
+        value = self.adc.get(channel, 0)
+        low, high = self.adc_winthresh
+        inside = low < value < high
+        met = (
+            None,
+            value > low,
+            value < high,
+            inside,
+            not inside,
+        )[self.adc_winmode]
+        if met:
+            self.adc_status |= _ADC_WINMON
+
+    def set_touch(self, channel, value):
+        """Set the reading of touch ``channel`` (the firmware channel offset)"""
+        self.touch[channel] = value
+
+    def receive(self, data):
+        """Feed ``data`` into the UART as if it arrived on its RX pin"""
+        self.uart_rx.extend(data)
+
+    def turn(self, steps, encoder=0):
+        """Rotate ``encoder`` by ``steps`` detents"""
+        self.encoders[encoder] += steps
+        if steps and self.encoder_inten & (1 << encoder):
+            self.encoder_intflag |= 1 << encoder
+
+    def _key_event(self, key, edge):
+        if (key, edge) in self.keypad_events:
+            self.keypad_fifo.append((key << 2) | edge)
+
+    def press(self, key):
+        """Press keypad ``key``"""
+        self._key_event(key, _KEYPAD_EDGE_RISING)
+
+    def release(self, key):
+        """Release keypad ``key``"""
+        self._key_event(key, _KEYPAD_EDGE_FALLING)
+
+    # Bus side
+
+    def _check_ready(self, now):
+        if not self.responding(now):
+            raise OSError(5, "Input/output error")
+
+    def handle_write(self, data, now):
+        """Process a write transaction of ``data`` at time ``now``"""
+        self._check_ready(now)
+        if self.max_write is not None and len(data) > self.max_write:
+            raise OSError(5, "Input/output error")
+        if len(data) < 2:
+            return
+        base, reg = data[0], data[1]
+        self._selected = (base, reg)
+        self._selected_at = now
+        payload = data[2:]
+        if payload:
+            self._write_register(base, reg, payload, now)
+        elif base == _NEOPIXEL_BASE and reg == _NEOPIXEL_SHOW:
+            self.shown = bytes(self.neopixel_buf)
+            self.shows += 1
+
+    def handle_read(self, length, now):
+        """Return ``length`` bytes for a read transaction at time ``now``"""
+        self._check_ready(now)
+        base, reg = self._selected
+        # allow for rounding in the accumulated clock
+        if now - self._selected_at < self.response_time(base, reg) - 1e-9:
+            self.early_reads += 1
+            return b"\xff" * length
+        data = bytes(self._read_register(base, reg, length))
+        if len(data) < length:
+            data += b"\xff" * (length - len(data))
+        return data[:length]
+
+    def _write_register(self, base, reg, payload, now):
+        if base == _STATUS_BASE:
+            if reg == _STATUS_SWRST:
+                self.resets += 1
+                self._reset_state()
+                self._ready_at = now + self.boot_time
+        elif base == _GPIO_BASE:
+            self._write_gpio(reg, _mask64(payload))
+        elif base == _SERCOM0_BASE:
+            self._write_sercom(reg, payload)
+        elif base == _TIMER_BASE:
+            value = int.from_bytes(payload[1:], "big")
+            if reg == _TIMER_PWM:
+                self.pwm[payload[0]] = value
+            elif reg == _TIMER_FREQ:
+                self.pwm_freq[payload[0]] = value
+        elif base == _ADC_BASE:
+            self._write_adc(reg, payload)
+        elif base == _EEPROM_BASE:
+            if reg + len(payload) > len(self.eeprom):
+                raise OSError(5, "EEPROM write past end of memory")
+            self.eeprom[reg : reg + len(payload)] = payload
+        elif base == _NEOPIXEL_BASE:
+            self._write_neopixel(reg, payload)
+        elif base == _KEYPAD_BASE:
+            if reg == _KEYPAD_EVENT:
+                key, flags = payload[0], payload[1]
+                for edge in range(4):
+                    if flags & (1 << (edge + 1)):
+                        if flags & 1:
+                            self.keypad_events.add((key, edge))
+                        else:
+                            self.keypad_events.discard((key, edge))
+            elif reg == _KEYPAD_INTENSET:
+                self.keypad_inten = True
+            elif reg == _KEYPAD_INTENCLR:
+                self.keypad_inten = False
+        elif base == _ENCODER_BASE:
+            self._write_encoder(reg, payload)
+
+    def _write_gpio(self, reg, mask):
+        if reg == _GPIO_DIRSET_BULK:
+            self.direction |= mask
+        elif reg == _GPIO_DIRCLR_BULK:
+            self.direction &= ~mask
+        elif reg == _GPIO_BULK:
+            self.latch = mask
+        elif reg == _GPIO_BULK_SET:
+            self.latch |= mask
+        elif reg == _GPIO_BULK_CLR:
+            self.latch &= ~mask
+        elif reg == _GPIO_BULK_TOGGLE:
+            self.latch ^= mask
+        elif reg == _GPIO_INTENSET:
+            self.gpio_inten |= mask
+        elif reg == _GPIO_INTENCLR:
+            self.gpio_inten &= ~mask
+        elif reg == _GPIO_PULLENSET:
+            self.pulls |= mask
+        elif reg == _GPIO_PULLENCLR:
+            self.pulls &= ~mask
+        self._update_gpio_interrupts()
+
+    def _write_neopixel(self, reg, payload):
+        if reg == _NEOPIXEL_PIN:
+            self.neopixel_pin = payload[0]
+        elif reg == _NEOPIXEL_SPEED:
+            self.neopixel_speed = payload[0]
+        elif reg == _NEOPIXEL_BUF_LENGTH:
+            self.neopixel_buf = bytearray(int.from_bytes(payload[:2], "big"))
+        elif reg == _NEOPIXEL_BUF:
+            offset = int.from_bytes(payload[:2], "big")
+            data = payload[2:]
+            if offset + len(data) > len(self.neopixel_buf):
+                raise OSError(5, "NeoPixel write past end of buffer")
+            self.neopixel_buf[offset : offset + len(data)] = data
+
+    def _write_sercom(self, reg, payload):
+        if reg == _SERCOM_BAUD:
+            self.uart_baud = int.from_bytes(payload[:4], "big")
+        elif reg == _SERCOM_DATA:
+            self.uart_tx.extend(payload)
+        elif reg == _SERCOM_INTEN:
+            self.uart_inten |= payload[0]
+        elif reg == _SERCOM_INTENCLR:
+            self.uart_inten &= ~payload[0]
+
+    def _write_encoder(self, reg, payload):
+        if _ENCODER_INTENSET <= reg < _ENCODER_INTENSET + 4:
+            self.encoder_inten |= 1 << (reg - _ENCODER_INTENSET)
+        elif _ENCODER_INTENCLR <= reg < _ENCODER_INTENCLR + 4:
+            self.encoder_inten &= ~(1 << (reg - _ENCODER_INTENCLR))
+        elif _ENCODER_POSITION <= reg < _ENCODER_POSITION + 4:
+            encoder = reg - _ENCODER_POSITION
+            position = int.from_bytes(payload[:4], "big")
+            if position & 0x80000000:
+                position -= 0x100000000
+            self.encoders[encoder] = position
+            self._encoder_last[encoder] = position
+
+    def _read_register(self, base, reg, length):
+        reader = {
+            _STATUS_BASE: self._read_status,
+            _GPIO_BASE: self._read_gpio,
+            _SERCOM0_BASE: self._read_sercom,
+            _ADC_BASE: self._read_adc,
+            _TOUCH_BASE: self._read_touch,
+            _EEPROM_BASE: self._read_eeprom,
+            _KEYPAD_BASE: self._read_keypad,
+            _NEOPIXEL_BASE: self._read_neopixel,
+            _ENCODER_BASE: self._read_encoder,
+        }.get(base)
+        if reader is None:
+            return b""
+        return reader(reg, length)
+
+    def _read_status(self, reg, length):
+        if reg == _STATUS_HW_ID:
+            return bytes([self.chip_id])
+        if reg == _STATUS_VERSION:
+            return ((self.pid << 16) | self.date_code).to_bytes(4, "big")
+        if reg == _STATUS_OPTIONS:
+            return self.options.to_bytes(4, "big")
+        if reg == _STATUS_TEMP:
+            return (int(self.temperature * 65536) & 0x3FFFFFFF).to_bytes(4, "big")
+        return b""
+
+    def _read_gpio(self, reg, length):
+        if reg == _GPIO_BULK:
+            levels = self.levels()
+            return (levels & _PORT_MASK).to_bytes(4, "big") + (levels >> 32).to_bytes(4, "big")
+        if reg == _GPIO_INTFLAG:
+            flags, self.gpio_intflag = self.gpio_intflag, 0
+            return (flags & _PORT_MASK).to_bytes(4, "big")
+        return b""
+
+    def _write_adc(self, reg, payload):
+        if reg >= _ADC_CHANNEL_OFFSET:
+            raise OSError(5, "ADC channels are read only")
+        if reg == _ADC_INTEN:
+            self.adc_inten |= payload[0]
+        elif reg == _ADC_INTENCLR:
+            self.adc_inten &= ~payload[0]
+        elif reg == _ADC_WINMODE:
+            self.adc_winmode = payload[0]
+        elif reg == _ADC_WINTHRESH:
+            high = int.from_bytes(payload[0:2], "big")
+            self.adc_winthresh = (int.from_bytes(payload[2:4], "big"), high)
+        self._update_adc_window()
+
+    def _read_sercom(self, reg, length):
+        if reg == _SERCOM_STATUS:
+            return bytes([_SERCOM_STATUS_DATA_RDY if self.uart_rx else 0])
+        if reg == _SERCOM_DATA and self.uart_rx:
+            # the firmware hands out one byte per read
+            data = self.uart_rx[:1]
+            del self.uart_rx[:1]
+            return data
+        return b""
+
+    def _read_adc(self, reg, length):
+        if reg == _ADC_STATUS:
+            status, self.adc_status = self.adc_status, 0
+            return bytes([status])
+        if reg < _ADC_CHANNEL_OFFSET:
+            return b""
+        channel = reg - _ADC_CHANNEL_OFFSET
+        self.adc_window_channel = channel
+        value = self.adc.get(channel, 0)
+        self._update_adc_window()
+        return value.to_bytes(2, "big")
+
+    def _read_touch(self, reg, length):
+        if reg < _TOUCH_CHANNEL_OFFSET:
+            return b""
+        return self.touch.get(reg - _TOUCH_CHANNEL_OFFSET, 0).to_bytes(2, "big")
+
+    def _read_eeprom(self, reg, length):
+        return self.eeprom[reg : reg + length]
+
+    def _read_neopixel(self, reg, length):
+        if reg != _NEOPIXEL_BUF:
+            return b""
+        return self.neopixel_buf[:length]
+
+    def _read_keypad(self, reg, length):
+        if reg == _KEYPAD_COUNT:
+            return bytes([len(self.keypad_fifo)])
+        if reg == _KEYPAD_FIFO:
+            events = self.keypad_fifo[:length]
+            del self.keypad_fifo[:length]
+            return bytes(events)
+        return b""
+
+    def _read_encoder(self, reg, length):
+        if _ENCODER_POSITION <= reg < _ENCODER_POSITION + 4:
+            encoder = reg - _ENCODER_POSITION
+            self.encoder_intflag &= ~(1 << encoder)
+            return (self.encoders[encoder] & 0xFFFFFFFF).to_bytes(4, "big")
+        if _ENCODER_DELTA <= reg < _ENCODER_DELTA + 4:
+            encoder = reg - _ENCODER_DELTA
+            self.encoder_intflag &= ~(1 << encoder)
+            delta = self.encoders[encoder] - self._encoder_last[encoder]
+            self._encoder_last[encoder] = self.encoders[encoder]
+            return (delta & 0xFFFFFFFF).to_bytes(4, "big")
+        return b""
+
+
+def _mask64(payload):
+    """Decode a 4 or 8 byte GPIO payload into a 64 bit pin mask"""
+    mask = int.from_bytes(payload[:4], "big")
+    if len(payload) >= 8:
+        mask |= int.from_bytes(payload[4:8], "big") << 32
+    return mask
@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.interrupts`
+====================================================
+
+Interrupt driven input handling for seesaw devices.
+
+Instead of polling every input over I2C, an `InterruptDispatcher` watches the
+seesaw's INT line and only talks to the device once it asserts. It then reads
+the GPIO interrupt flags, the watched encoders, the ADC window comparator and
+the keypad FIFO, and calls the callbacks registered for whatever changed.
+
+.. code-block:: python
+
+    import board
+    import digitalio
+
+    from adafruit_seesaw.interrupts import InterruptDispatcher
+    from adafruit_seesaw.seesaw import Seesaw
+
+    seesaw = Seesaw(board.I2C())
+    seesaw.pin_mode(24, seesaw.INPUT_PULLUP)
+    int_pin = digitalio.DigitalInOut(board.D5)
+    int_pin.pull = digitalio.Pull.UP
+
+    dispatcher = InterruptDispatcher(seesaw, int_pin)
+    dispatcher.watch_pin(24, lambda pin, value: print(pin, value))
+    while True:
+        dispatcher.poll()
+
+* Author(s): Adafruit Industries
+"""
+
+import struct
+import time
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(x):
+        return x
+
+
+from adafruit_seesaw.keypad import KeyEvent
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+_GPIO_BASE = const(0x01)
+_GPIO_BULK = const(0x04)
+
+# Longest pause of `InterruptDispatcher.wait` while INT stays asserted
+# without anything to dispatch
+_MAX_INTERVAL = 0.05
+
+
+class InterruptDispatcher:
+    """Calls back on input changes, reading the device only when its INT
+    line is asserted
+
+    :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The device
+    :param interrupt: The host pin connected to the seesaw's INT output, as
+        a `digitalio.DigitalInOut`, which must be pulled up. Alternatively a
+        callable that returns True while the interrupt is asserted."""
+
+    def __init__(self, seesaw, interrupt):
+        self._seesaw = seesaw
+        if callable(interrupt):
+            self._asserted = interrupt
+        else:
+            interrupt.switch_to_input()
+            self._asserted = lambda: not interrupt.value
+        self._pin_callbacks = {}
+        self._pin_mask = 0
+        self._encoder_callbacks = {}
+        self._keypad_callback = None
+        self._adc_window_callback = None
+        self._buf = bytearray(4)
+
+    @property
+    def asserted(self):
+        """Whether the device is currently signalling an interrupt"""
+        return bool(self._asserted())
+
+    def watch_pin(self, pin, callback):
+        """Call ``callback(pin, value)`` whenever input ``pin`` changes level.
+
+        The pin must already be configured as an input and be on port A."""
+        if not 0 <= pin < 32:
+            raise ValueError("Only pins on port A can raise interrupts")
+        self._pin_callbacks[pin] = callback
+        self._pin_mask |= 1 << pin
+        self._seesaw.set_GPIO_interrupts(1 << pin, True)
+
+    def unwatch_pin(self, pin):
+        """Stop watching ``pin`` and disable its interrupt"""
+        del self._pin_callbacks[pin]
+        self._pin_mask &= ~(1 << pin)
+        self._seesaw.set_GPIO_interrupts(1 << pin, False)
+
+    def watch_encoder(self, callback, encoder=0):
+        """Call ``callback(encoder, delta)`` whenever ``encoder`` moves"""
+        self._encoder_callbacks[encoder] = callback
+        self._seesaw.enable_encoder_interrupt(encoder)
+
+    def unwatch_encoder(self, encoder=0):
+        """Stop watching ``encoder`` and disable its interrupt"""
+        del self._encoder_callbacks[encoder]
+        self._seesaw.disable_encoder_interrupt(encoder)
+
+    def watch_keypad(self, callback):
+        """Call ``callback(event)`` with a `adafruit_seesaw.keypad.KeyEvent`
+        for every keypad event. The device must be a
+        `adafruit_seesaw.keypad.Keypad` with its events configured."""
+        self._keypad_callback = callback
+        self._seesaw.interrupt_enabled = True
+
+    def unwatch_keypad(self):
+        """Stop watching the keypad and disable its interrupt"""
+        self._keypad_callback = None
+        self._seesaw.interrupt_enabled = False
+
+    def watch_adc_window(self, callback):
+        """Call ``callback(pin, value)`` with a fresh reading whenever the ADC
+        window comparator set up by
+        `adafruit_seesaw.seesaw.Seesaw.set_adc_window` triggers. The
+        comparator keeps triggering while the condition holds, so the
+        callback will usually move or disable the window."""
+        self._adc_window_callback = callback
+
+    def unwatch_adc_window(self):
+        """Stop watching the ADC window comparator, leaving it configured"""
+        self._adc_window_callback = None
+
+    def poll(self):
+        """Dispatch pending events if the interrupt is asserted.
+
+        Costs no bus traffic while the INT line is idle.
+
+        :return: The number of callbacks made"""
+        if not self._asserted():
+            return 0
+        return self._dispatch()
+
+    def wait(self, timeout=None, interval=0.001):
+        """Watch the INT line until something is dispatched or ``timeout``
+        seconds pass. The bus is only used once the line asserts.
+
+        If the line stays asserted with nothing to dispatch, for example
+        because a source that is not watched holds it, the pause between
+        checks doubles up to 50 ms instead of reading the device every
+        ``interval``.
+
+        :param float timeout: How long to wait, or None to wait forever
+        :param float interval: Pause between checks of the INT line
+        :return: The number of callbacks made"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pause = interval
+        while True:
+            asserted = self._asserted()
+            dispatched = self._dispatch() if asserted else 0
+            if dispatched:
+                return dispatched
+            if asserted:
+                pause = min(pause * 2, max(interval, _MAX_INTERVAL))
+            else:
+                pause = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return 0
+                pause = min(pause, remaining)
+            time.sleep(pause)
+
+    def _dispatch(self):
+        return (
+            self._dispatch_pins()
+            + self._dispatch_encoders()
+            + self._dispatch_adc_window()
+            + self._dispatch_keypad()
+        )
+
+    def _dispatch_pins(self):
+        if not self._pin_mask:
+            return 0
+        seesaw = self._seesaw
+        flags = seesaw.get_GPIO_interrupt_flag() & self._pin_mask
+        if not flags:
+            return 0
+        # read the port directly, a snapshot could predate the interrupt
+        buf = self._buf
+        seesaw.read(_GPIO_BASE, _GPIO_BULK, buf)
+        levels = struct.unpack_from(">I", buf)[0]
+        dispatched = 0
+        for pin, callback in self._pin_callbacks.items():
+            if flags & (1 << pin):
+                callback(pin, bool(levels & (1 << pin)))
+                dispatched += 1
+        return dispatched
+
+    def _dispatch_encoders(self):
+        dispatched = 0
+        for encoder, callback in self._encoder_callbacks.items():
+            delta = self._seesaw.encoder_delta(encoder)
+            if delta:
+                callback(encoder, delta)
+                dispatched += 1
+        return dispatched
+
+    def _dispatch_adc_window(self):
+        callback = self._adc_window_callback
+        seesaw = self._seesaw
+        pin = seesaw.adc_window_pin
+        if callback is None or pin is None or not seesaw.get_adc_window_flag():
+            return 0
+        callback(pin, seesaw.analog_read(pin))
+        return 1
+
+    def _dispatch_keypad(self):
+        callback = self._keypad_callback
+        if callback is None:
+            return 0
+        events = self._seesaw.drain()
+        for number, edge in events:
+            callback(KeyEvent(number, edge))
+        return len(events)
@@ -8,6 +8,8 @@
 ====================================================
 """
 
+import array
+
 try:
     from micropython import const
 except ImportError:
@@ -30,6 +32,10 @@ _KEYPAD_INTENCLR = const(0x03)
 _KEYPAD_COUNT = const(0x04)
 _KEYPAD_FIFO = const(0x10)
 
+# FIFO entries hold the key number above a two bit edge
+_KEY_NUMBERS = bytes(raw >> 2 for raw in range(256))
+_KEY_EDGES = bytes(raw & 0x03 for raw in range(256))
+
 
 class KeyEvent:
     """Holds information about a key event in its properties
@@ -38,6 +44,8 @@ class KeyEvent:
     :param int edge: One of the EDGE propertes of `adafruit_seesaw.keypad.Keypad`
     """
 
+    __slots__ = ("edge", "number")
+
     def __init__(self, num, edge):
         self.number = int(num)
         self.edge = int(edge)
@@ -46,12 +54,107 @@ class KeyEvent:
 # pylint: enable=too-few-public-methods
 
 
+def _key_events(raw):
+    """Decode FIFO bytes into a list of `KeyEvent`"""
+    return [KeyEvent(_KEY_NUMBERS[entry], _KEY_EDGES[entry]) for entry in raw]
+
+
+class KeyEvents:
+    """A reusable buffer of decoded keypad events, filled by `Keypad.drain`
+
+    The events are held in two arrays rather than as objects. Iterating
+    yields ``(number, edge)`` tuples for the events of the last drain.
+
+    :param int capacity: The most events one drain can return"""
+
+    def __init__(self, capacity=32):
+        #: The FIFO bytes as read from the device
+        self.raw = bytearray(capacity)
+        #: The key numbers, valid up to `count`
+        self.numbers = array.array("B", bytes(capacity))
+        #: The edges, valid up to `count`, see `Keypad.EDGE_HIGH` and others
+        self.edges = array.array("B", bytes(capacity))
+        #: The number of events held
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError("event index out of range")
+        return self.numbers[index], self.edges[index]
+
+    def __iter__(self):
+        numbers = self.numbers
+        edges = self.edges
+        for i in range(self.count):
+            yield numbers[i], edges[i]
+
+    def decode(self, count):
+        """Decode the first ``count`` bytes of `raw` into the event arrays"""
+        raw = self.raw
+        numbers = self.numbers
+        edges = self.edges
+        for i in range(count):
+            entry = raw[i]
+            numbers[i] = _KEY_NUMBERS[entry]
+            edges[i] = _KEY_EDGES[entry]
+        self.count = count
+
+
+class _EdgeShadow:
+    """The event edges per key known to be enabled and disabled on a device"""
+
+    def __init__(self):
+        self.on = {}
+        self.off = {}
+
+    @staticmethod
+    def mask(edges, enable):
+        """Validate arguments to ``set_events`` and combine ``edges`` into a mask"""
+        if enable not in {True, False}:
+            raise ValueError("event enable must be True or False")
+        mask = 0
+        for edge in edges:
+            if edge > 3 or edge < 0:
+                raise ValueError("invalid edge")
+            mask |= 1 << edge
+        return mask
+
+    @staticmethod
+    def pack(out, key, mask, enable):
+        """Place an EVENT command for the edges in ``mask`` in the payload of
+        ``out`` and return its length"""
+        out[2] = key
+        out[3] = (mask << 1) | enable
+        return 2
+
+    def needed(self, key, mask, enable):
+        """The edges of ``mask`` not already set to ``enable`` for ``key``"""
+        known = self.on if enable else self.off
+        return mask & ~known.get(key, 0)
+
+    def record(self, key, mask, enable):
+        """Remember that the edges in ``mask`` were set to ``enable``"""
+        on = self.on
+        off = self.off
+        if enable:
+            on[key] = on.get(key, 0) | mask
+            off[key] = off.get(key, 0) & ~mask
+        else:
+            off[key] = off.get(key, 0) | mask
+            on[key] = on.get(key, 0) & ~mask
+
+
 class Keypad(Seesaw):
     """On compatible SeeSaw devices, reads from a keypad.
 
     :param ~busio.I2C i2c_bus: Bus the SeeSaw is connected to
     :param int addr: I2C address of the SeeSaw device
-    :param ~digitalio.DigitalInOut drdy: Pin connected to SeeSaw's 'ready' output"""
+    :param ~digitalio.DigitalInOut drdy: Pin connected to SeeSaw's 'ready' output
+
+    Other keyword arguments are passed on to `adafruit_seesaw.seesaw.Seesaw`."""
 
     #: Indicates that the key is currently pressed
     EDGE_HIGH = 0
@@ -62,9 +165,18 @@ class Keypad(Seesaw):
     #: Indicates that the key was recently released
     EDGE_RISING = 3
 
-    def __init__(self, i2c_bus, addr=0x49, drdy=None):
-        super().__init__(i2c_bus, addr, drdy)
+    def __init__(self, i2c_bus, addr=0x49, drdy=None, **kwargs):
+        # set before the reset in Seesaw.__init__ clears it
+        self._edges = _EdgeShadow()
+        super().__init__(i2c_bus, addr, drdy, **kwargs)
         self._interrupt_enabled = False
+        self._events = None
+
+    def invalidate_shadow(self):
+        """Forget the remembered pin and PWM settings and the keypad events
+        enabled by `set_events`"""
+        super().invalidate_shadow()
+        self._edges = _EdgeShadow()
 
     @property
     def interrupt_enabled(self):
@@ -97,17 +209,34 @@ class Keypad(Seesaw):
         :param int key: The key number
         :param int edge: The type of event
         :param bool enable: True to enable the event, False to disable it"""
-
-        if enable not in {True, False}:
-            raise ValueError("event enable must be True or False")
-        if edge > 3 or edge < 0:
-            raise ValueError("invalid edge")
-
-        cmd = bytearray(2)
-        cmd[0] = key
-        cmd[1] = (1 << (edge + 1)) | enable
-
-        self.write(_KEYPAD_BASE, _KEYPAD_EVENT, cmd)
+        self._write_edges(key, _EdgeShadow.mask((edge,), enable), enable)
+
+    def set_events(self, keys, edges, enable=True, force=False):
+        """Enable or disable several kinds of events on several keys.
+
+        All the edges of one key go in a single write, and edges that this
+        object already set the same way are left out, so keys that need no
+        change cost nothing. Enabling rising and falling edges on a 4x4
+        keypad takes 16 writes instead of 32.
+
+        :param keys: The key numbers
+        :param edges: The types of event, such as `EDGE_RISING`
+        :param bool enable: True to enable the events, False to disable them
+        :param bool force: Send every write, even those that look already applied
+        :return: The number of writes sent"""
+        mask = _EdgeShadow.mask(edges, enable)
+        writes = 0
+        for key in keys:
+            needed = mask if force else self._edges.needed(key, mask, enable)
+            if needed:
+                self._write_edges(key, needed, enable)
+                writes += 1
+        return writes
+
+    def _write_edges(self, key, mask, enable):
+        """Send one EVENT command for the edges in ``mask`` and remember it"""
+        self._write_out(_KEYPAD_BASE, _KEYPAD_EVENT, _EdgeShadow.pack(self._out, key, mask, enable))
+        self._edges.record(key, mask, enable)
 
     def read_keypad(self, num):
         """Read data from the keypad
@@ -116,3 +245,30 @@ class Keypad(Seesaw):
         ret = bytearray(num)
         self.read(_KEYPAD_BASE, _KEYPAD_FIFO, ret)
         return ret
+
+    def drain(self, events=None):
+        """Read the waiting events into a reusable `KeyEvents` buffer.
+
+        Costs one COUNT read, plus one FIFO read when there are events. If
+        more events are waiting than ``events`` holds, the rest are left for
+        the next drain.
+
+        .. code-block:: python
+
+            events = KeyEvents()
+            while True:
+                for number, edge in keypad.drain(events):
+                    print(number, edge)
+
+        :param KeyEvents events: The buffer to fill. Defaults to one owned by
+            the keypad, which the next drain overwrites.
+        :return: ``events``"""
+        if events is None:
+            events = self._events
+            if events is None:
+                events = self._events = KeyEvents()
+        count = min(self.read8(_KEYPAD_BASE, _KEYPAD_COUNT), len(events.raw))
+        if count:
+            self.read(_KEYPAD_BASE, _KEYPAD_FIFO, events.raw, end=count)
+        events.decode(count)
+        return events
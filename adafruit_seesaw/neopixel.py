@@ -9,6 +9,7 @@
 """
 
 import struct
+import time
 
 from adafruit_pixelbuf import PixelBuf
 
@@ -38,8 +39,21 @@ _NEOPIXEL_BUF_LENGTH = const(0x03)
 _NEOPIXEL_BUF = const(0x04)
 _NEOPIXEL_SHOW = const(0x05)
 
-# try lower values if IO errors
-_OUTPUT_BUFFER_SIZE = const(24)
+# Pixel bytes per BUF write unless chosen otherwise, lowered on IO errors
+_DEFAULT_CHUNK_SIZE = const(22)
+_MIN_CHUNK_SIZE = const(4)
+# Module base, register and pixel offset in front of every chunk
+_CHUNK_HEADER_SIZE = const(4)
+
+_SHOW_COMMAND = bytes((_NEOPIXEL_BASE, _NEOPIXEL_SHOW))
+
+#: Chunk sizes `NeoPixel.probe_chunk_size` tries, largest first
+PROBE_CHUNK_SIZES = (254, 126, 62, 30, 28, 22, 14, 6)
+
+#: The largest chunk the seesaw firmware documents room for: its 32 byte I2C
+#: receive buffer less the chunk header. Firmware may acknowledge a longer
+#: write and silently drop the end, which a probe cannot detect.
+FIRMWARE_CHUNK_LIMIT = 32 - _CHUNK_HEADER_SIZE
 
 # Pixel color order constants
 RGB = "RGB"
@@ -62,13 +76,38 @@ class NeoPixel(PixelBuf):
     :param float brightness: The brightness, from 0.0 to 1.0
     :param bool auto_write: Automatically update the pixels when changed
     :param tuple pixel_order: The layout of the pixels.
-        Use one of the order constants such as RGBW."""
+        Use one of the order constants such as RGBW.
+    :param bool track_changes: Only upload the bytes that changed since the
+        last show, see `invalidate`. Costs a copy of the pixel buffer.
+    :param int chunk_size: Pixel bytes sent per write, see `chunk_size`"""
 
     def __init__(
-        self, seesaw, pin, n, *, bpp=None, brightness=1.0, auto_write=True, pixel_order="GRB"
+        self,
+        seesaw,
+        pin,
+        n,
+        *,
+        bpp=None,
+        brightness=1.0,
+        auto_write=True,
+        pixel_order="GRB",
+        track_changes=True,
+        chunk_size=_DEFAULT_CHUNK_SIZE,
     ):
+        self._init_buffer(seesaw, pin, n, bpp, brightness, auto_write, pixel_order, track_changes)
+        self.chunk_size = chunk_size
+        for reg, cmd in self._setup_commands():
+            self._seesaw.write(_NEOPIXEL_BASE, reg, cmd)
+
+    def _init_buffer(self, seesaw, pin, n, bpp, brightness, auto_write, pixel_order, track_changes):
         self._seesaw = seesaw
         self._pin = pin
+        self.track_changes = track_changes
+        # What the device holds, as of the last show. None until the first
+        # upload and while changes are not tracked.
+        self._uploaded = None
+        self._source = None
+        self._source_view = None
         if not pixel_order:
             pixel_order = GRB if bpp == 3 else GRBW
         elif isinstance(pixel_order, tuple):
@@ -83,22 +122,430 @@ class NeoPixel(PixelBuf):
             auto_write=auto_write,
         )
 
-        cmd = bytearray([pin])
-        self._seesaw.write(_NEOPIXEL_BASE, _NEOPIXEL_PIN, cmd)
-        cmd = struct.pack(">H", n * self.bpp)
-        self._seesaw.write(_NEOPIXEL_BASE, _NEOPIXEL_BUF_LENGTH, cmd)
-        self.output_buffer = bytearray(_OUTPUT_BUFFER_SIZE)
+    def _setup_commands(self):
+        """The ``(register, payload)`` writes that configure the device"""
+        return (
+            (_NEOPIXEL_PIN, bytearray([self._pin])),
+            (_NEOPIXEL_BUF_LENGTH, struct.pack(">H", len(self) * self.bpp)),
+        )
+
+    @property
+    def chunk_size(self):
+        """The number of pixel bytes sent per write to the device.
+
+        Larger chunks need fewer transactions, but the firmware and the host
+        bus limit how long a write may be. The size is halved automatically,
+        down to a minimum of 4, whenever a write fails with an `OSError`. See
+        `probe_chunk_size` to find the largest size that works."""
+        return self._chunk_size
+
+    @chunk_size.setter
+    def chunk_size(self, size):
+        if size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._chunk_size = size
+        self.output_buffer = bytearray(size + _CHUNK_HEADER_SIZE)
+        self.output_buffer[0] = _NEOPIXEL_BASE
+        self.output_buffer[1] = _NEOPIXEL_BUF
+        self._output_view = memoryview(self.output_buffer)
+
+    def _chunk(self, view, start):
+        """Place the BUF command for the chunk at ``start`` of the pixel data
+        in ``view`` in the output buffer and return it"""
+        length = min(self._chunk_size, len(view) - start)
+        out = self.output_buffer
+        out[2] = start >> 8
+        out[3] = start & 0xFF
+        out[_CHUNK_HEADER_SIZE : length + _CHUNK_HEADER_SIZE] = view[start : start + length]
+        if length == self._chunk_size:
+            return out
+        return self._output_view[: length + _CHUNK_HEADER_SIZE]
+
+    def _view(self, buffer):
+        """A memoryview of ``buffer``, kept while the same buffer is shown"""
+        if self._source is not buffer:
+            self._source = buffer
+            self._source_view = memoryview(buffer)
+        return self._source_view
+
+    def _shrink_chunks(self):
+        """Halve the chunk size after a failed write, returning False when it
+        is already as small as it goes"""
+        if self._chunk_size <= _MIN_CHUNK_SIZE:
+            return False
+        self.chunk_size = max(self._chunk_size // 2, _MIN_CHUNK_SIZE)
+        return True
+
+    def _send_chunk(self, view, start):
+        """Write the chunk at ``start``, retrying with smaller chunks on IO
+        errors, and return the offset after it"""
+        while True:
+            try:
+                chunk = self._chunk(view, start)
+                self._seesaw.write_raw(chunk)
+                return start + len(chunk) - _CHUNK_HEADER_SIZE
+            except OSError:
+                if not self._shrink_chunks():
+                    raise
+
+    def _probe_sizes(self, sizes, limit):
+        """The candidates from ``sizes`` that fit in the pixel buffer and
+        within ``limit``"""
+        capacity = len(self) * self.bpp
+        if limit is not None:
+            capacity = min(capacity, limit)
+        # The probe overwrites the device's buffer
+        self.invalidate()
+        return [size for size in sizes if size <= capacity] or [capacity]
+
+    def probe_chunk_size(self, sizes=PROBE_CHUNK_SIZES, trials=3, limit=FIRMWARE_CHUNK_LIMIT):
+        """Find the largest chunk size the device and bus accept and use it.
+
+        Each size in ``sizes`` up to ``limit`` is tried, largest first, by
+        writing that many zero bytes to the start of the device's pixel
+        buffer ``trials`` times. The first size that never raises an
+        `OSError` is kept. The pixels are not shown meanwhile, and the next
+        show uploads the whole buffer.
+
+        Only failures that surface as IO errors can be detected, and the
+        firmware may acknowledge a write that it truncates. Sizes above
+        `FIRMWARE_CHUNK_LIMIT` are therefore only tried if ``limit`` is
+        raised, or None, for firmware known to have a larger buffer.
+
+        :return: The chosen chunk size"""
+        for size in self._probe_sizes(sizes, limit):
+            # a fresh output buffer, with zeros at offset 0
+            self.chunk_size = size
+            view = self._output_view[: size + _CHUNK_HEADER_SIZE]
+            try:
+                for _ in range(trials):
+                    self._seesaw.write_raw(view)
+            except OSError:
+                continue
+            return size
+        raise OSError(5, "No chunk size could be written")
+
+    def invalidate(self):
+        """Forget what the device is showing, so the next show uploads every
+        byte. Call this after the device was reset behind the driver's back."""
+        self._uploaded = None
+
+    def _next_chunk(self, buffer, start):
+        """The offset of the next chunk at or after ``start`` that has to be
+        sent, or None when the rest of ``buffer`` is already on the device"""
+        size = len(buffer)
+        last = self._uploaded
+        if last is None:
+            return start if start < size else None
+        step = self._chunk_size
+        while start < size:
+            end = min(start + step, size)
+            if buffer[start:end] != last[start:end]:
+                # begin the chunk at the first changed byte
+                while buffer[start] == last[start]:
+                    start += 1
+                return start
+            start = end
+        return None
+
+    def _uploaded_all(self, buffer):
+        """Remember ``buffer`` as what the device now holds"""
+        if not self.track_changes:
+            self._uploaded = None
+        elif self._uploaded is None or len(self._uploaded) != len(buffer):
+            self._uploaded = bytearray(buffer)
+        else:
+            self._uploaded[:] = buffer
 
     def _transmit(self, buffer: bytearray) -> None:
         """Update the pixels even if auto_write is False"""
 
-        step = _OUTPUT_BUFFER_SIZE - 2
-        for i in range(0, len(buffer), step):
-            self.output_buffer[0:2] = struct.pack(">H", i)
-            self.output_buffer[2:] = buffer[i : i + step]
-            self._seesaw.write(_NEOPIXEL_BASE, _NEOPIXEL_BUF, self.output_buffer)
+        view = self._view(buffer)
+        start = self._next_chunk(buffer, 0)
+        try:
+            while start is not None:
+                start = self._next_chunk(buffer, self._send_chunk(view, start))
+        except BaseException:
+            # The device holds part of this frame, so nothing can be skipped
+            self.invalidate()
+            raise
+        self._uploaded_all(buffer)
 
-        self._seesaw.write(_NEOPIXEL_BASE, _NEOPIXEL_SHOW)
+        self._seesaw.write_raw(_SHOW_COMMAND)
 
     def deinit(self):
         pass
+
+
+class _Frames:
+    """Two pixel buffers handing frames from the caller to a background
+    uploader. The caller fills the back buffer, the uploader swaps it to the
+    front and sends that."""
+
+    def __init__(self, size, max_fps):
+        self.back = bytearray(size)
+        self.front = bytearray(size)
+        self.pending = False
+        self.dropped = 0
+        self.max_fps = max_fps
+        self._last = None
+
+    def put(self, buffer):
+        """Copy a frame in, replacing one that has not been taken yet"""
+        if self.pending:
+            self.dropped += 1
+        self.back[:] = buffer
+        self.pending = True
+
+    def delay(self):
+        """Seconds until the frame rate cap allows the next frame"""
+        if not self.max_fps or self._last is None:
+            return 0
+        return self._last + 1 / self.max_fps - time.monotonic()
+
+    def take(self):
+        """Swap the buffers and return the frame to upload"""
+        self._last = time.monotonic()
+        self.front, self.back = self.back, self.front
+        self.pending = False
+        return self.front
+
+
+class ThreadedNeoPixel(NeoPixel):
+    """`NeoPixel` that uploads from a background thread, for Blinka and other
+    hosts with `threading`
+
+    `show` copies the pixels into a back buffer and returns at once. A
+    thread swaps it with the front buffer and uploads that, at most
+    ``max_fps`` times a second. Frames shown faster than they can be
+    uploaded replace each other, so only the newest is sent; they are
+    counted in `dropped_frames`. An error in the thread is raised by the
+    next `show`.
+
+    The device gets a `threading.RLock` as its
+    `adafruit_seesaw.seesaw.Seesaw.lock` unless it already has one, so the
+    caller can keep using it from the main thread.
+
+    :param float max_fps: The most frames to upload per second, or None for
+        no limit
+
+    The other parameters are those of `NeoPixel`."""
+
+    def __init__(self, seesaw, pin, n, *, max_fps=None, **kwargs):
+        import threading  # noqa: PLC0415
+
+        super().__init__(seesaw, pin, n, **kwargs)
+        if seesaw.lock is None:
+            seesaw.lock = threading.RLock()
+        self._frames = _Frames(len(self) * self.bpp, max_fps)
+        self._condition = threading.Condition()
+        self._running = True
+        self._uploading = False
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def max_fps(self):
+        """The most frames uploaded per second, or None for no limit"""
+        return self._frames.max_fps
+
+    @max_fps.setter
+    def max_fps(self, value):
+        self._frames.max_fps = value
+
+    @property
+    def dropped_frames(self):
+        """How many shown frames were replaced before they were uploaded"""
+        return self._frames.dropped
+
+    def _transmit(self, buffer: bytearray) -> None:
+        with self._condition:
+            error = self._error
+            if error is not None:
+                self._error = None
+                raise error
+            self._frames.put(buffer)
+            self._condition.notify_all()
+
+    def _run(self):
+        frames = self._frames
+        condition = self._condition
+        while True:
+            with condition:
+                while self._running and not frames.pending:
+                    condition.wait()
+                if not self._running:
+                    return
+            delay = frames.delay()
+            if delay > 0:
+                time.sleep(delay)
+            with condition:
+                frame = frames.take()
+                self._uploading = True
+            error = None
+            try:
+                NeoPixel._transmit(self, frame)
+            except Exception as exc:  # noqa: BLE001
+                error = exc
+            with condition:
+                if error is not None:
+                    self._error = error
+                self._uploading = False
+                condition.notify_all()
+
+    def flush(self, timeout=None):
+        """Wait until every shown frame has been uploaded or dropped
+
+        :param float timeout: The longest to wait, or None to wait forever
+        :return: True if the uploader caught up, False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not (self._frames.pending or self._uploading), timeout
+            )
+
+    def deinit(self):
+        """Stop the upload thread, after it finishes the frame in progress"""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join()
+
+
+class AsyncNeoPixel(NeoPixel):
+    """asyncio version of `NeoPixel` for use with
+    `adafruit_seesaw.async_seesaw.AsyncSeesaw`
+
+    Create instances with `create`, or construct and await `begin`. Pixels
+    are only sent by awaiting `show`, so ``auto_write`` is not supported.
+
+    :param ~adafruit_seesaw.async_seesaw.AsyncSeesaw seesaw: The device
+    :param int pin: The pin number on the device
+    :param int n: The number of pixels
+    :param int bpp: The number of bytes per pixel
+    :param float brightness: The brightness, from 0.0 to 1.0
+    :param tuple pixel_order: The layout of the pixels.
+        Use one of the order constants such as RGBW.
+    :param bool track_changes: Only upload the bytes that changed since the
+        last show, see `NeoPixel.invalidate`
+    :param int chunk_size: Pixel bytes sent per write, see `NeoPixel.chunk_size`"""
+
+    def __init__(
+        self,
+        seesaw,
+        pin,
+        n,
+        *,
+        bpp=None,
+        brightness=1.0,
+        pixel_order="GRB",
+        track_changes=True,
+        chunk_size=_DEFAULT_CHUNK_SIZE,
+    ):
+        self._init_buffer(seesaw, pin, n, bpp, brightness, False, pixel_order, track_changes)
+        self.chunk_size = chunk_size
+        self._pending = None
+        self._frames = None
+        self._frame_ready = None
+
+    @classmethod
+    async def create(cls, seesaw, pin, n, **kwargs):
+        """Construct the pixels and await `begin`"""
+        pixels = cls(seesaw, pin, n, **kwargs)
+        await pixels.begin()
+        return pixels
+
+    async def begin(self):
+        """Configure the pin and buffer length on the device"""
+        for reg, cmd in self._setup_commands():
+            await self._seesaw.write(_NEOPIXEL_BASE, reg, cmd)
+
+    def _transmit(self, buffer: bytearray) -> None:
+        # PixelBuf.show hands over the buffer with brightness applied
+        self._pending = buffer
+
+    async def show(self):
+        """Send the pixels to the device and display them"""
+        super().show()
+        await self._upload(self._pending)
+
+    async def _upload(self, buffer):
+        view = self._view(buffer)
+        start = self._next_chunk(buffer, 0)
+        try:
+            while start is not None:
+                start = self._next_chunk(buffer, await self._send_chunk(view, start))
+        except BaseException:
+            self.invalidate()
+            raise
+        self._uploaded_all(buffer)
+
+        await self._seesaw.write_raw(_SHOW_COMMAND)
+
+    @property
+    def dropped_frames(self):
+        """How many frames passed to `request_show` were replaced before
+        `run` uploaded them"""
+        return 0 if self._frames is None else self._frames.dropped
+
+    def request_show(self):
+        """Hand the pixels to `run` for upload and return at once.
+
+        The pixels are copied, so they can be changed straight away. A frame
+        that `run` has not started uploading yet is replaced."""
+        super().show()
+        if self._frames is None:
+            self._frames = _Frames(len(self._pending), None)
+        self._frames.put(self._pending)
+        if self._frame_ready is not None:
+            self._frame_ready.set()
+
+    async def run(self, max_fps=None):
+        """Upload the frames passed to `request_show` until cancelled. Start
+        it as a task next to the code that draws the frames.
+
+        :param float max_fps: The most frames to upload per second, or None
+            for no limit"""
+        import asyncio  # noqa: PLC0415
+
+        if self._frames is None:
+            self._frames = _Frames(len(self) * self.bpp, None)
+        frames = self._frames
+        frames.max_fps = max_fps
+        self._frame_ready = asyncio.Event()
+        if frames.pending:
+            self._frame_ready.set()
+        try:
+            while True:
+                await self._frame_ready.wait()
+                delay = frames.delay()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._frame_ready.clear()
+                await self._upload(frames.take())
+        finally:
+            self._frame_ready = None
+
+    async def _send_chunk(self, view, start):
+        while True:
+            try:
+                chunk = self._chunk(view, start)
+                await self._seesaw.write_raw(chunk)
+                return start + len(chunk) - _CHUNK_HEADER_SIZE
+            except OSError:
+                if not self._shrink_chunks():
+                    raise
+
+    async def probe_chunk_size(self, sizes=PROBE_CHUNK_SIZES, trials=3, limit=FIRMWARE_CHUNK_LIMIT):
+        """Find the largest chunk size the device and bus accept and use it,
+        see `NeoPixel.probe_chunk_size`"""
+        for size in self._probe_sizes(sizes, limit):
+            self.chunk_size = size
+            view = self._output_view[: size + _CHUNK_HEADER_SIZE]
+            try:
+                for _ in range(trials):
+                    await self._seesaw.write_raw(view)
+            except OSError:
+                continue
+            return size
+        raise OSError(5, "No chunk size could be written")
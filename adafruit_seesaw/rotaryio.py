@@ -8,9 +8,26 @@
 ====================================================
 """
 
+import array
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(x):
+        return x
+
+
+from adafruit_seesaw.scheduler import ReadSchedule
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
 
+_ENCODER_BASE = const(0x11)
+
+_ENCODER_POSITION = const(0x30)
+_ENCODER_DELTA = const(0x40)
+
 
 class IncrementalEncoder:
     """IncrementalEncoder determines the relative rotational position based
@@ -31,3 +48,90 @@ class IncrementalEncoder:
     @position.setter
     def position(self, value):
         self._seesaw.set_encoder_position(value, self._encoder)
+
+    @property
+    def delta(self):
+        """The change in position since the delta was last read. Reading it
+        resets the device's count, so only one reader should use it."""
+        return self._seesaw.encoder_delta(self._encoder)
+
+
+class EncoderBank:
+    """Reads many encoders, on one or several devices, in a single sweep.
+
+    The reads are run as a `adafruit_seesaw.scheduler.ReadSchedule`, so the
+    encoders of different devices share one delay. Results are kept in
+    arrays indexed like ``encoders``.
+
+    .. code-block:: python
+
+        bank = EncoderBank([(seesaw, n) for n in range(4)])
+        while True:
+            if bank.update():
+                print(bank.positions, bank.velocities)
+
+    :param encoders: ``(seesaw, encoder)`` pairs
+    :param bool use_delta: Read each encoder's delta rather than its
+        position, and accumulate `positions` on the host. This resets the
+        device's delta, so nothing else should read it.
+    :param float smoothing: Weight of the previous velocity when estimating a
+        new one, from 0 (no smoothing) up to but not including 1"""
+
+    def __init__(self, encoders, use_delta=False, smoothing=0.0):
+        if not 0 <= smoothing < 1:
+            raise ValueError("smoothing must be at least 0 and less than 1")
+        self._use_delta = use_delta
+        self._smoothing = smoothing
+        self._schedule = ReadSchedule()
+        reg = _ENCODER_DELTA if use_delta else _ENCODER_POSITION
+        for seesaw, encoder in encoders:
+            self._schedule.add(seesaw, _ENCODER_BASE, reg + encoder, ">i")
+        count = len(self._schedule)
+        #: The position of each encoder, in pulses
+        self.positions = array.array("l", [0] * count)
+        #: The movement of each encoder during the last `update`
+        self.deltas = array.array("l", [0] * count)
+        #: The estimated speed of each encoder, in pulses per second
+        self.velocities = array.array("f", [0.0] * count)
+        #: The estimated change in speed, in pulses per second squared
+        self.accelerations = array.array("f", [0.0] * count)
+        #: The `time.monotonic` time each encoder was last read at
+        self.timestamps = array.array("d", [0.0] * count)
+        self._times = array.array("d", [0.0] * count)
+        self._updated = False
+
+    def __len__(self):
+        return len(self.positions)
+
+    def update(self):
+        """Read every encoder and refresh the arrays. The first update only
+        establishes the positions, so its velocities are zero.
+
+        :return: The number of encoders that moved"""
+        values = self._schedule.run(self._times)
+        times = self._times
+        positions = self.positions
+        deltas = self.deltas
+        velocities = self.velocities
+        accelerations = self.accelerations
+        timestamps = self.timestamps
+        smoothing = self._smoothing
+        moved = 0
+        for i, value in enumerate(values):
+            if self._use_delta:
+                delta = value
+                positions[i] += value
+            else:
+                delta = value - positions[i] if self._updated else 0
+                positions[i] = value
+            deltas[i] = delta
+            if delta:
+                moved += 1
+            elapsed = times[i] - timestamps[i]
+            if self._updated and elapsed > 0:
+                velocity = smoothing * velocities[i] + (1 - smoothing) * delta / elapsed
+                accelerations[i] = (velocity - velocities[i]) / elapsed
+                velocities[i] = velocity
+            timestamps[i] = times[i]
+        self._updated = True
+        return moved
@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.scheduler`
+====================================================
+
+Register reads across several seesaw devices on one bus, with their
+conversion delays overlapped.
+
+A plain `adafruit_seesaw.seesaw.Seesaw.read` selects a register, sleeps and
+reads it back, one device at a time. A `ReadSchedule` selects the registers of
+every device first, sleeps once for the longest delay any of them needs and
+then collects all the results, so N devices cost about one delay instead of N.
+
+Each device can only have one register selected at a time, so when a device
+has several requests they are spread over consecutive waves, each of which
+contains at most one request per device.
+
+.. code-block:: python
+
+    from adafruit_seesaw.scheduler import ReadSchedule
+
+    schedule = ReadSchedule()
+    for sensor in sensors:
+        schedule.add(sensor, 0x0F, 0x10, ">H")  # moisture
+    moisture = schedule.run()
+
+* Author(s): Adafruit Industries
+"""
+
+import struct
+import time
+
+from adafruit_seesaw.seesaw import (
+    _MOISTURE_ATTEMPTS,
+    _MOISTURE_RETRY_DELAY,
+    _TOUCH_BASE,
+    _TOUCH_CHANNEL_OFFSET,
+    Seesaw,
+)
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+
+class ReadSchedule:
+    """A reusable set of register reads to run across devices.
+
+    Buffers are allocated when requests are added, so running the same
+    schedule repeatedly only allocates the result list."""
+
+    def __init__(self):
+        self._requests = []
+        self._waves = None
+
+    def __len__(self):
+        return len(self._requests)
+
+    def add(self, device, reg_base, reg, fmt):
+        """Add a read and return its index in the results of `run`.
+
+        :param ~adafruit_seesaw.seesaw.Seesaw device: The device to read
+        :param int reg_base: The module base
+        :param int reg: The register
+        :param fmt: Either a `struct` format string to decode the register
+            with, or a number of bytes to return undecoded as a bytearray.
+            Formats with a single field decode to that value, others to a
+            tuple.
+        :return: The index of the result
+        :raises TypeError: If ``device`` is an
+            `adafruit_seesaw.async_seesaw.AsyncSeesaw`, whose reads must be
+            awaited"""
+        if not getattr(device, "_blocking_io", True):
+            raise TypeError(
+                f"{type(device).__name__} can't be read by a ReadSchedule; "
+                "gather its coroutines instead"
+            )
+        if isinstance(fmt, int):
+            buf = bytearray(fmt)
+            fmt = None
+        else:
+            buf = bytearray(struct.calcsize(fmt))
+        self._requests.append((device, reg_base, reg, buf, fmt))
+        self._waves = None
+        return len(self._requests) - 1
+
+    def clear(self):
+        """Remove every request"""
+        self._requests = []
+        self._waves = None
+
+    @property
+    def waves(self):
+        """The request indices grouped into waves, each holding at most one
+        request per device, in the order they run"""
+        if self._waves is None:
+            waves = []
+            seen = {}
+            for index, request in enumerate(self._requests):
+                wave = seen.get(id(request[0]), 0)
+                seen[id(request[0])] = wave + 1
+                if wave == len(waves):
+                    waves.append([])
+                waves[wave].append(index)
+            self._waves = waves
+        return self._waves
+
+    def run(self, times=None):
+        """Perform every read and return the decoded results in the order the
+        requests were added
+
+        :param times: An optional sequence, such as an ``array('d')``, as long
+            as the schedule. Each entry is set to the `time.monotonic` time at
+            which its result was fetched."""
+        requests = self._requests
+        results = [None] * len(requests)
+        for wave in self.waves:
+            started = finished = 0
+            try:
+                delay = 0
+                for index in wave:
+                    device, reg_base, reg, _, _ = requests[index]
+                    delay = max(delay, device.read_start(reg_base, reg))
+                    started += 1
+                time.sleep(delay)
+                if times is not None:
+                    now = time.monotonic()
+                    for index in wave:
+                        times[index] = now
+                for index in wave:
+                    device, _, _, buf, fmt = requests[index]
+                    # read_finish releases the device even when it fails
+                    finished += 1
+                    device.read_finish(buf)
+                    results[index] = self._decode(buf, fmt)
+            finally:
+                self._finish(requests, wave[finished:started])
+        return results
+
+    @staticmethod
+    def _finish(requests, indices):
+        """Complete the started reads of ``indices`` after another read of
+        their wave failed, so their devices' locks are released"""
+        for index in indices:
+            device, _, _, buf, _ = requests[index]
+            try:
+                device.read_finish(buf)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _decode(buf, fmt):
+        if fmt is None:
+            return bytearray(buf)
+        values = struct.unpack_from(fmt, buf)
+        if len(values) == 1:
+            return values[0]
+        return values
+
+
+def read_many(requests):
+    """Run a one-off set of reads, see `ReadSchedule`
+
+    :param requests: ``(device, reg_base, reg, fmt)`` tuples, with ``fmt`` as
+        for `ReadSchedule.add`
+    :return: The decoded results, in the order of ``requests``"""
+    schedule = ReadSchedule()
+    for device, reg_base, reg, fmt in requests:
+        schedule.add(device, reg_base, reg, fmt)
+    return schedule.run()
+
+
+def read_moisture(sensors, deadline=None):
+    """Read several soil sensors with their delays overlapped.
+
+    Bad readings are retried together, only for the sensors that returned
+    them, as in `adafruit_seesaw.seesaw.Seesaw.moisture_read`, and counted
+    in each sensor's ``moisture_stats``.
+
+    :param sensors: The `adafruit_seesaw.seesaw.Seesaw` devices
+    :param float deadline: A `time.monotonic` time after which no retry is
+        started. The first attempt is always made.
+    :return: The readings, in the order of ``sensors``, with None for
+        sensors that gave no good reading"""
+    results = [None] * len(sensors)
+    pending = list(range(len(sensors)))
+    for attempt in range(_MOISTURE_ATTEMPTS):
+        if attempt:
+            time.sleep(_MOISTURE_RETRY_DELAY)
+        if not Seesaw._moisture_retry(attempt, deadline):
+            break
+        schedule = ReadSchedule()
+        for index in pending:
+            schedule.add(sensors[index], _TOUCH_BASE, _TOUCH_CHANNEL_OFFSET, 2)
+        retry = []
+        for index, buf in zip(pending, schedule.run()):
+            value = sensors[index]._moisture_value(buf)
+            if value is not None:
+                results[index] = value
+            else:
+                retry.append(index)
+        pending = retry
+        if not pending:
+            break
+    for index in pending:
+        sensors[index].moisture_stats.failures += 1
+    return results
@@ -28,6 +28,7 @@ Implementation Notes
 # This code needs to be broken up into analogio, busio, digitalio, and pulseio
 # compatible classes so we won't bother with some lints until then.
 
+import array
 import struct
 import time
 
@@ -41,6 +42,8 @@ except ImportError:
 
 from adafruit_bus_device.i2c_device import I2CDevice
 
+from adafruit_seesaw.timing import TimingProfile
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
 
@@ -88,12 +91,18 @@ _ADC_WINMODE = const(0x04)
 _ADC_WINTHRESH = const(0x05)
 _ADC_CHANNEL_OFFSET = const(0x07)
 
+# ADC STATUS and interrupt enable bit of the window comparator
+_ADC_WINMON = const(0x02)
+
 _SERCOM_STATUS = const(0x00)
 _SERCOM_INTEN = const(0x02)
 _SERCOM_INTENCLR = const(0x03)
 _SERCOM_BAUD = const(0x04)
 _SERCOM_DATA = const(0x05)
 
+_SERCOM_STATUS_DATA_RDY = const(0x02)
+_SERCOM_INTEN_DATA_RDY = const(0x01)
+
 _NEOPIXEL_STATUS = const(0x00)
 _NEOPIXEL_PIN = const(0x01)
 _NEOPIXEL_SPEED = const(0x02)
@@ -125,6 +134,194 @@ _5690_PID = const(5690)
 _5681_PID = const(5681)
 _5743_PID = const(5743)
 
+# Full scale of an ADC reading and the voltage it stands for
+_ADC_MAX = const(1023)
+_ADC_REFERENCE = 3.3
+
+# Moisture readings above this are bad, and retried up to the attempt limit
+_MOISTURE_MAX = const(4095)
+_MOISTURE_ATTEMPTS = const(5)
+_MOISTURE_RETRY_DELAY = 0.001
+
+# EEPROM addresses are one byte. Reads fetch up to _EEPROM_READ_CHUNK bytes
+# per transaction, and writes never cross a multiple of _EEPROM_WRITE_CHUNK,
+# which divides the EEPROM page and row sizes of every supported chip.
+_EEPROM_SPACE = const(256)
+_EEPROM_READ_CHUNK = const(32)
+_EEPROM_WRITE_CHUNK = const(16)
+
+# First and longest pauses between HW_ID polls while a device boots
+_READY_POLL_INTERVAL = 0.002
+_READY_POLL_MAX_INTERVAL = 0.05
+
+# Header plus the largest payload the driver itself writes
+_OUT_BUFFER_SIZE = const(10)
+
+# Shadowed bulk GPIO registers: (state index, whether the register sets the bit)
+_SHADOW_DIRECTION = const(0)
+_SHADOW_PULL = const(1)
+_SHADOW_LATCH = const(2)
+_SHADOW_REGISTERS = {
+    _GPIO_DIRSET_BULK: (_SHADOW_DIRECTION, True),
+    _GPIO_DIRCLR_BULK: (_SHADOW_DIRECTION, False),
+    _GPIO_PULLENSET: (_SHADOW_PULL, True),
+    _GPIO_PULLENCLR: (_SHADOW_PULL, False),
+    _GPIO_BULK_SET: (_SHADOW_LATCH, True),
+    _GPIO_BULK_CLR: (_SHADOW_LATCH, False),
+}
+
+_CHIP_IDS = (
+    _ATTINY416_HW_ID_CODE,
+    _ATTINY806_HW_ID_CODE,
+    _ATTINY807_HW_ID_CODE,
+    _ATTINY816_HW_ID_CODE,
+    _ATTINY817_HW_ID_CODE,
+    _ATTINY1616_HW_ID_CODE,
+    _ATTINY1617_HW_ID_CODE,
+    _SAMD09_HW_ID_CODE,
+)
+
+# Bulk GPIO registers written, in order, to put pins in each mode
+_PIN_MODE_REGISTERS = {
+    0x00: (_GPIO_DIRCLR_BULK, _GPIO_PULLENCLR),  # INPUT
+    0x01: (_GPIO_DIRSET_BULK,),  # OUTPUT
+    0x02: (_GPIO_DIRCLR_BULK, _GPIO_PULLENSET, _GPIO_BULK_SET),  # INPUT_PULLUP
+    0x03: (_GPIO_DIRCLR_BULK, _GPIO_PULLENSET, _GPIO_BULK_CLR),  # INPUT_PULLDOWN
+}
+
+
+class _ShadowState:
+    """The last direction, pull enable, output latch and PWM settings written
+    to a device, used to skip writes that would not change anything"""
+
+    def __init__(self):
+        # [direction, pull, latch], each split into ports A and B
+        self.known = [[0, 0], [0, 0], [0, 0]]
+        self.values = [[0, 0], [0, 0], [0, 0]]
+        self.pwm = {}
+        self.pwm_freq = {}
+
+    def needed(self, port, reg, pins):
+        """The subset of ``pins`` that writing ``reg`` would actually change"""
+        index, state = _SHADOW_REGISTERS[reg]
+        known = self.known[index][port]
+        values = self.values[index][port]
+        if state:
+            return pins & ~(known & values)
+        return pins & ~(known & ~values)
+
+    def record(self, port, reg, pins):
+        """Remember that ``reg`` was written for ``pins``"""
+        index, state = _SHADOW_REGISTERS[reg]
+        self.known[index][port] |= pins
+        if state:
+            self.values[index][port] |= pins
+        else:
+            self.values[index][port] &= ~pins
+
+
+def pin_mapping_for(chip_id, pid):
+    """The pin mapping class for a device with the given hardware ID and
+    product ID, the upper 16 bits of its VERSION register"""
+    if pid == _CRICKIT_PID:
+        from adafruit_seesaw.crickit import Crickit_Pinmap  # noqa: PLC0415
+
+        return Crickit_Pinmap
+    if pid == _ROBOHATMM1_PID:
+        from adafruit_seesaw.robohat import MM1_Pinmap  # noqa: PLC0415
+
+        return MM1_Pinmap
+    if (pid in {_5690_PID, _5681_PID, _5743_PID}) or (
+        chip_id
+        in {
+            _ATTINY416_HW_ID_CODE,
+            _ATTINY816_HW_ID_CODE,
+            _ATTINY806_HW_ID_CODE,
+            _ATTINY1616_HW_ID_CODE,
+        }
+    ):
+        from adafruit_seesaw.attinyx16 import ATtinyx16_Pinmap  # noqa: PLC0415
+
+        return ATtinyx16_Pinmap
+    if chip_id == _SAMD09_HW_ID_CODE:
+        from adafruit_seesaw.samd09 import SAMD09_Pinmap  # noqa: PLC0415
+
+        return SAMD09_Pinmap
+    if chip_id in {
+        _ATTINY817_HW_ID_CODE,
+        _ATTINY807_HW_ID_CODE,
+        _ATTINY1617_HW_ID_CODE,
+    }:
+        from adafruit_seesaw.attiny8x7 import ATtiny8x7_Pinmap  # noqa: PLC0415
+
+        return ATtiny8x7_Pinmap
+    return None
+
+
+class MoistureStats:
+    """Counts of the moisture readings taken from a device, kept in
+    `Seesaw.moisture_stats`"""
+
+    def __init__(self):
+        #: Readings received, good or bad
+        self.reads = 0
+        #: Readings above 4095, which were retried
+        self.bad_reads = 0
+        #: Calls that gave up without a good reading
+        self.failures = 0
+
+    @property
+    def bad_rate(self):
+        """The fraction of readings that were bad"""
+        return self.bad_reads / self.reads if self.reads else 0.0
+
+    def record(self, value):
+        """Count a reading and return whether it is good"""
+        self.reads += 1
+        if value > _MOISTURE_MAX:
+            self.bad_reads += 1
+            return False
+        return True
+
+
+class _EepromMirror:
+    """A host copy of the EEPROM bytes read from or written to a device"""
+
+    def __init__(self):
+        self.data = bytearray(_EEPROM_SPACE)
+        self.valid = bytearray(_EEPROM_SPACE)
+
+    def covers(self, addr, length):
+        """Whether every byte from ``addr`` to ``addr + length`` is known"""
+        return self.valid.find(b"\x00", addr, addr + length) < 0
+
+    def record(self, addr, data):
+        """Remember that ``data`` is stored at ``addr``"""
+        end = addr + len(data)
+        self.data[addr:end] = data
+        self.valid[addr:end] = b"\x01" * len(data)
+
+
+class _Snapshot:
+    """Context manager returned by `Seesaw.snapshot`"""
+
+    def __init__(self, seesaw):
+        self._seesaw = seesaw
+
+    def __enter__(self):
+        self._seesaw.refresh_snapshot()
+        return self._seesaw
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._seesaw.clear_snapshot()
+
+    async def __aenter__(self):
+        await self._seesaw.refresh_snapshot()
+        return self._seesaw
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._seesaw.clear_snapshot()
+
 
 class Seesaw:
     """Driver for Seesaw i2c generic conversion trip
@@ -132,90 +329,473 @@ class Seesaw:
     :param ~busio.I2C i2c_bus: Bus the SeeSaw is connected to
     :param int addr: I2C address of the SeeSaw device
     :param ~digitalio.DigitalInOut drdy: Pin connected to SeeSaw's 'ready' output
-    :param bool reset: Whether to do a software reset on init"""
+    :param bool reset: Whether to do a software reset on init
+    :param ~adafruit_seesaw.timing.TimingProfile timing: Register read delays to
+        use instead of the built-in profile for the detected chip
+    :param bool shadow: Whether to remember pin and PWM settings and skip
+        writes that would not change them. See `shadow`.
+    :param tuple identity: The ``(chip_id, pid)`` of the device, if already
+        known, for example from `adafruit_seesaw.discovery`. The device is
+        then neither probed, reset nor read during construction.
+    :param bool poll_reset: After the reset, poll the device until it answers
+        instead of sleeping for a fixed half second. See `wait_ready`."""
 
     INPUT = const(0x00)
     OUTPUT = const(0x01)
     INPUT_PULLUP = const(0x02)
     INPUT_PULLDOWN = const(0x03)
 
-    def __init__(self, i2c_bus, addr=0x49, drdy=None, reset=True):
+    #: ADC window comparator modes for `set_adc_window`
+    ADC_WINDOW_OFF = const(0)
+    #: Trigger while the reading is above ``low``
+    ADC_WINDOW_ABOVE = const(1)
+    #: Trigger while the reading is below ``high``
+    ADC_WINDOW_BELOW = const(2)
+    #: Trigger while the reading is between ``low`` and ``high``
+    ADC_WINDOW_INSIDE = const(3)
+    #: Trigger while the reading is outside ``low`` to ``high``
+    ADC_WINDOW_OUTSIDE = const(4)
+
+    def __init__(
+        self,
+        i2c_bus,
+        addr=0x49,
+        drdy=None,
+        reset=True,
+        timing=None,
+        shadow=False,
+        identity=None,
+        poll_reset=False,
+    ):
+        self._prepare(drdy, shadow)
+        if identity is not None:
+            chip_id, pid = identity
+            self.i2c_device = I2CDevice(i2c_bus, addr, probe=False)
+            self._identify(chip_id, timing)
+            self._map_pins(pid)
+            return
+        self.i2c_device = I2CDevice(i2c_bus, addr)
+        chip_id = None
+        if reset:
+            chip_id = self.sw_reset(poll=poll_reset)
+        if chip_id is None:
+            chip_id = self.read8(_STATUS_BASE, _STATUS_HW_ID)
+
+        self._identify(chip_id, timing)
+        self._map_pins(self.get_version() >> 16)
+
+    @classmethod
+    def attach(cls, i2c_bus, addr=0x49, identity=None, **kwargs):
+        """Construct a driver for a device that is already running, without
+        resetting it.
+
+        The device must answer with a known hardware ID. If ``identity`` is
+        given, its chip and product IDs must also match, so a different board
+        at the address is caught. Nothing is assumed about the pin settings:
+        `shadow` state starts empty, so the first write of each is sent.
+
+        :param tuple identity: The expected ``(chip_id, pid)``, for example
+            `adafruit_seesaw.discovery.DeviceInfo.identity`
+        :raises RuntimeError: If the device is not the expected one
+
+        Other arguments are passed to the class, without ``reset``."""
+        seesaw = cls(i2c_bus, addr, reset=False, **kwargs)
+        seesaw._check_identity(identity)
+        return seesaw
+
+    # The methods up to sw_reset do no I/O. They hold the register encoding
+    # shared with adafruit_seesaw.async_seesaw.
+
+    def _prepare(self, drdy, shadow):
+        """Set up the state kept for a device before talking to it"""
         self._drdy = drdy
+        self.timing = TimingProfile()
+        self._shadow = _ShadowState() if shadow else None
+        # Preallocated so that steady-state transactions do not touch the heap:
+        # _out holds the register header followed by the payload of a write,
+        # and the _inN buffers receive N-byte register reads.
+        self._out = bytearray(_OUT_BUFFER_SIZE)
+        self._in1 = bytearray(1)
+        self._in2 = bytearray(2)
+        self._in4 = bytearray(4)
+        self._in8 = bytearray(8)
+        self._snapshot_max_age = None
+        self._snapshot = [0, 0]
+        self._snapshot_time = None
+        self._io_lock = None
+        self._scan = ((), b"")
+        #: The pin watched by the ADC window comparator, or None. See
+        #: `set_adc_window`.
+        self.adc_window_pin = None
+        self._moisture_stats = MoistureStats()
+        self._eeprom_mirror = None
         if drdy is not None:
             drdy.switch_to_input()
 
-        self.i2c_device = I2CDevice(i2c_bus, addr)
-        if reset:
-            self.sw_reset()
-
-        self.chip_id = self.read8(_STATUS_BASE, _STATUS_HW_ID)
-        if self.chip_id not in {
-            _ATTINY416_HW_ID_CODE,
-            _ATTINY806_HW_ID_CODE,
-            _ATTINY807_HW_ID_CODE,
-            _ATTINY816_HW_ID_CODE,
-            _ATTINY817_HW_ID_CODE,
-            _ATTINY1616_HW_ID_CODE,
-            _ATTINY1617_HW_ID_CODE,
-            _SAMD09_HW_ID_CODE,
-        }:
+    def _identify(self, chip_id, timing):
+        """Check the hardware ID read from the device and pick its timing"""
+        self.chip_id = chip_id
+        if chip_id not in _CHIP_IDS:
             raise RuntimeError(
-                f"Seesaw hardware ID returned 0x{self.chip_id:x} is not "
+                f"Seesaw hardware ID returned 0x{chip_id:x} is not "
                 "correct! Please check your wiring."
             )
+        self.timing = TimingProfile(chip_id) if timing is None else timing
+
+    def _map_pins(self, pid):
+        """Pick the pin mapping for the product ID and chip of the device"""
+        self._pid = pid
+        self.pin_mapping = pin_mapping_for(self.chip_id, pid)
+
+    def _check_identity(self, identity):
+        """Raise if the identified device is not ``identity``"""
+        if identity is None:
+            return
+        found = (self.chip_id, self._pid)
+        if found != tuple(identity):
+            raise RuntimeError(
+                f"Seesaw with chip ID 0x{found[0]:x} and product ID {found[1]} "
+                f"is not the expected 0x{identity[0]:x} and {identity[1]}"
+            )
 
-        pid = self.get_version() >> 16
-        if pid == _CRICKIT_PID:
-            from adafruit_seesaw.crickit import Crickit_Pinmap  # noqa: PLC0415
-
-            self.pin_mapping = Crickit_Pinmap
-        elif pid == _ROBOHATMM1_PID:
-            from adafruit_seesaw.robohat import MM1_Pinmap  # noqa: PLC0415
-
-            self.pin_mapping = MM1_Pinmap
-        elif (pid in {_5690_PID, _5681_PID, _5743_PID}) or (
-            self.chip_id
-            in {
-                _ATTINY416_HW_ID_CODE,
-                _ATTINY816_HW_ID_CODE,
-                _ATTINY806_HW_ID_CODE,
-                _ATTINY1616_HW_ID_CODE,
-            }
-        ):
-            from adafruit_seesaw.attinyx16 import ATtinyx16_Pinmap  # noqa: PLC0415
-
-            self.pin_mapping = ATtinyx16_Pinmap
-        elif self.chip_id == _SAMD09_HW_ID_CODE:
-            from adafruit_seesaw.samd09 import SAMD09_Pinmap  # noqa: PLC0415
-
-            self.pin_mapping = SAMD09_Pinmap
-        elif self.chip_id in {
-            _ATTINY817_HW_ID_CODE,
-            _ATTINY807_HW_ID_CODE,
-            _ATTINY1617_HW_ID_CODE,
-        }:
-            from adafruit_seesaw.attiny8x7 import ATtiny8x7_Pinmap  # noqa: PLC0415
+    @staticmethod
+    def _poll_interval(interval, deadline):
+        """The pause before the next readiness poll, doubling each time but
+        never past ``deadline``"""
+        return max(0, min(interval * 2, _READY_POLL_MAX_INTERVAL, deadline - time.monotonic()))
 
-            self.pin_mapping = ATtiny8x7_Pinmap
+    def _adc_offset(self, pin):
+        """The ADC channel register offset of an analog pin"""
+        if pin not in self.pin_mapping.analog_pins:
+            raise ValueError("Invalid ADC pin")
 
-    def sw_reset(self, post_reset_delay=0.5):
-        """Trigger a software reset of the SeeSaw chip"""
+        if self.chip_id == _SAMD09_HW_ID_CODE:
+            return self.pin_mapping.analog_pins.index(pin)
+        return pin
+
+    def _scan_registers(self, pins):
+        """The ADC channel registers of ``pins``, validated once per pin list"""
+        key, registers = self._scan
+        if pins is key:
+            return registers
+        pins = tuple(pins)
+        if pins != key:
+            registers = bytes(_ADC_CHANNEL_OFFSET + self._adc_offset(pin) for pin in pins)
+            self._scan = (pins, registers)
+        return registers
+
+    @staticmethod
+    def _scan_output(count, out):
+        """Check or allocate the result storage of `analog_scan`"""
+        if out is None:
+            return array.array("H", bytes(2 * count))
+        if isinstance(out, (bytes, bytearray, memoryview)) or getattr(out, "typecode", "H") in "bB":
+            raise TypeError("out must hold 16 bit values, such as an array('H')")
+        if len(out) < count:
+            raise ValueError("out is shorter than pins")
+        return out
+
+    @staticmethod
+    def _to_volts(values, count):
+        """Convert the first ``count`` raw ADC readings to volts, as an
+        ndarray when ulab or NumPy is available, otherwise as a list"""
+        scale = _ADC_REFERENCE / _ADC_MAX
+        try:
+            from ulab import numpy as np  # noqa: PLC0415
+        except ImportError:
+            try:
+                import numpy as np  # noqa: PLC0415
+            except ImportError:
+                return [values[i] * scale for i in range(count)]
+        return np.array(values[:count]) * scale
+
+    def _pwm_offset(self, pin):
+        """The PWM channel number of a PWM pin"""
+        if pin not in self.pin_mapping.pwm_pins:
+            raise ValueError("Invalid PWM pin")
+
+        if self.chip_id == _SAMD09_HW_ID_CODE:
+            return self.pin_mapping.pwm_pins.index(pin)
+        return pin
+
+    def _touch_offset(self, pin):
+        """The touch channel register offset of a touch pin"""
+        if pin not in self.pin_mapping.touch_pins:
+            raise ValueError("Invalid touch pin")
+
+        return self.pin_mapping.touch_pins.index(pin)
+
+    def _pack_pwm(self, offset, value):
+        """Place a PWM duty cycle command in the payload and return its length"""
+        out = self._out
+        out[2] = offset
+        if self.pin_mapping.pwm_width == 16:
+            out[3] = value >> 8
+            out[4] = value & 0xFF
+            return 3
+        out[3] = value
+        return 2
+
+    def _pack_pwm_freq(self, offset, freq):
+        """Place a PWM frequency command in the payload and return its length"""
+        out = self._out
+        out[2] = offset
+        out[3] = freq >> 8
+        out[4] = freq & 0xFF
+        return 3
+
+    def _pack_byte(self, value):
+        """Place a single byte payload and return its length"""
+        self._out[2] = value
+        return 1
+
+    def _pack_window(self, mode, low, high):
+        """Validate window comparator settings, place the thresholds in the
+        payload and return its length"""
+        if not 0 <= mode <= self.ADC_WINDOW_OUTSIDE:
+            raise ValueError("Invalid ADC window mode")
+        if not 0 <= low <= 0xFFFF or not 0 <= high <= 0xFFFF:
+            raise ValueError("ADC window thresholds must be 0 to 65535")
+        struct.pack_into(">HH", self._out, 2, high, low)
+        return 4
+
+    @staticmethod
+    def _window_interrupt_register(mode):
+        """The ADC register that enables or, for `ADC_WINDOW_OFF`, disables
+        the window interrupt"""
+        return _ADC_INTEN if mode else _ADC_INTENCLR
+
+    @staticmethod
+    def _moisture_retry(attempt, deadline):
+        """Whether attempt number ``attempt`` of a moisture read may start,
+        after the pause before it"""
+        return not attempt or deadline is None or time.monotonic() < deadline
+
+    def _moisture_value(self, buf):
+        """Decode and count a moisture reading, None if it is bad"""
+        value = struct.unpack_from(">H", buf)[0]
+        return value if self._moisture_stats.record(value) else None
+
+    def _moisture_failed(self):
+        """Count a moisture read that gave up, and return the error to raise"""
+        self._moisture_stats.failures += 1
+        return RuntimeError("Could not get a valid moisture reading.")
+
+    @staticmethod
+    def _check_eeprom_range(addr, length):
+        if addr < 0 or addr + length > _EEPROM_SPACE:
+            raise ValueError("EEPROM range out of bounds")
+
+    def _eeprom_known(self, addr, length):
+        """The `eeprom_mirror` copy of ``length`` bytes at ``addr``, or None
+        unless all of them are known"""
+        mirror = self._eeprom_mirror
+        if mirror is not None and mirror.covers(addr, length):
+            return mirror.data[addr : addr + length]
+        return None
+
+    def _eeprom_record(self, addr, data):
+        """Remember ``data`` at ``addr`` if `eeprom_mirror` is enabled"""
+        if self._eeprom_mirror is not None:
+            self._eeprom_mirror.record(addr, data)
+
+    @staticmethod
+    def _eeprom_reads(addr, buf):
+        """The ``(address, chunk)`` reads that fill ``buf`` from ``addr``"""
+        view = memoryview(buf)
+        length = len(buf)
+        for start in range(0, length, _EEPROM_READ_CHUNK):
+            yield addr + start, view[start : min(length, start + _EEPROM_READ_CHUNK)]
+
+    @staticmethod
+    def _eeprom_writes(addr, buf, current):
+        """The ``(address, chunk)`` writes that store ``buf`` at ``addr``:
+        the bytes that differ from ``current``, or all of them if it is None,
+        split so that no chunk crosses a write chunk boundary"""
+        writes = []
+        view = memoryview(buf)
+        length = len(buf)
+        i = 0
+        while i < length:
+            if current is not None and buf[i] == current[i]:
+                i += 1
+                continue
+            start = i
+            limit = min(
+                length,
+                (addr + i) // _EEPROM_WRITE_CHUNK * _EEPROM_WRITE_CHUNK
+                + _EEPROM_WRITE_CHUNK
+                - addr,
+            )
+            while i < limit and (current is None or buf[i] != current[i]):
+                i += 1
+            writes.append((addr + start, view[start:i]))
+        return writes
+
+    def _pack_pins(self, offset, pins):
+        """Place a pin mask for port A (offset 0) or B (offset 4) in the payload"""
+        out = self._out
+        if offset:
+            out[2] = out[3] = out[4] = out[5] = 0
+        struct.pack_into(">I", out, 2 + offset, pins)
+
+    @staticmethod
+    def _pin_mode_registers(mode):
+        """The bulk GPIO registers that set ``mode``, in the order to write them"""
+        registers = _PIN_MODE_REGISTERS.get(mode)
+        if registers is None:
+            raise ValueError("Invalid pin mode")
+        return registers
+
+    @staticmethod
+    def _unpack_port(buf, offset):
+        try:
+            return struct.unpack_from(">I", buf, offset)[0]
+        except OverflowError:
+            buf[offset] &= 0x3F
+            return struct.unpack_from(">I", buf, offset)[0]
+
+    def _store_snapshot(self, buf):
+        """Keep both ports from a bulk GPIO read as the snapshot"""
+        snapshot = self._snapshot
+        snapshot[0] = self._unpack_port(buf, 0)
+        snapshot[1] = self._unpack_port(buf, 4)
+        self._snapshot_time = time.monotonic()
+        return snapshot[0] | (snapshot[1] << 32)
+
+    def _snapshot_stale(self):
+        """Whether the snapshot must be refreshed before a digital read is
+        answered from it. Only meaningful while `_snapshot_in_use`."""
+        max_age = self._snapshot_max_age
+        if self._snapshot_time is None:
+            return True
+        return max_age is not None and time.monotonic() - self._snapshot_time > max_age
+
+    def _snapshot_in_use(self):
+        """Whether digital reads are answered from the snapshot"""
+        return self._snapshot_time is not None or self._snapshot_max_age is not None
+
+    def sw_reset(self, post_reset_delay=0.5, poll=False):
+        """Trigger a software reset of the SeeSaw chip
+
+        :param float post_reset_delay: How long to wait for the chip to
+            restart or, with ``poll``, the longest to wait
+        :param bool poll: Return as soon as the chip answers, see `wait_ready`
+        :return: The hardware ID if ``poll`` is set, otherwise None"""
         self.write8(_STATUS_BASE, _STATUS_SWRST, 0xFF)
+        self.invalidate_shadow()
+        if poll:
+            return self.wait_ready(post_reset_delay)
         time.sleep(post_reset_delay)
+        return None
+
+    def wait_ready(self, timeout=0.5):
+        """Poll the hardware ID until the device answers with a known one.
+
+        NAKs and unexpected values while the device boots are ignored. The
+        pause between polls starts at 2 ms and doubles up to 50 ms.
+
+        :param float timeout: The longest to wait, in seconds
+        :return: The hardware ID
+        :raises RuntimeError: If the device did not answer in time"""
+        deadline = time.monotonic() + timeout
+        interval = _READY_POLL_INTERVAL
+        while True:
+            time.sleep(interval)
+            try:
+                chip_id = self.read8(_STATUS_BASE, _STATUS_HW_ID)
+            except OSError:
+                chip_id = None
+            if chip_id in _CHIP_IDS:
+                return chip_id
+            if time.monotonic() >= deadline:
+                raise RuntimeError("Seesaw did not answer after reset")
+            interval = self._poll_interval(interval, deadline)
+
+    @property
+    def shadow(self):
+        """Whether pin and PWM writes that would not change the device's state
+        are skipped.
+
+        While enabled, the direction, pull and output latch of every pin and
+        the duty cycle and frequency of every PWM output are remembered as
+        they are written, so `pin_mode`, `digital_write`, `analog_write`,
+        `set_pwm_freq` and their bulk variants only send what differs. Call
+        `invalidate_shadow` if anything other than this object changes the
+        device, for example an external reset."""
+        return self._shadow is not None
+
+    @shadow.setter
+    def shadow(self, value):
+        if not value:
+            self._shadow = None
+        elif self._shadow is None:
+            self._shadow = _ShadowState()
+
+    def invalidate_shadow(self):
+        """Forget every remembered pin and PWM setting, so the next write of
+        each is sent to the device"""
+        if self._shadow is not None:
+            self._shadow = _ShadowState()
+
+    @property
+    def eeprom_mirror(self):
+        """Whether EEPROM bytes are remembered on the host once read or
+        written, so that reading them again costs no bus traffic and writes
+        skip bytes that already match. Disabling forgets the copy; do so if
+        anything other than this object writes the EEPROM."""
+        return self._eeprom_mirror is not None
+
+    @eeprom_mirror.setter
+    def eeprom_mirror(self, value):
+        if not value:
+            self._eeprom_mirror = None
+        elif self._eeprom_mirror is None:
+            self._eeprom_mirror = _EepromMirror()
+
+    @property
+    def moisture_stats(self):
+        """The `MoistureStats` of the moisture readings taken from this
+        device"""
+        return self._moisture_stats
+
+    @property
+    def lock(self):
+        """A reentrant lock, such as `threading.RLock`, held around every
+        transaction, or None. Set it when another thread shares the device,
+        for example `adafruit_seesaw.neopixel.ThreadedNeoPixel`.
+
+        Only `read`, `read_start` to `read_finish`, `write_raw` and the
+        individual writes are covered, so no two threads may call the other
+        methods concurrently."""
+        return self._io_lock
+
+    @lock.setter
+    def lock(self, value):
+        self._io_lock = value
+
+    @property
+    def snapshot_max_age(self):
+        """The longest time, in seconds, a GPIO snapshot is served before
+        digital reads refresh it. None means only explicit refreshes. See
+        `refresh_snapshot`."""
+        return self._snapshot_max_age
+
+    @snapshot_max_age.setter
+    def snapshot_max_age(self, value):
+        self._snapshot_max_age = value
 
     def get_options(self):
         """Retrieve the 'options' word from the SeeSaw board"""
-        buf = bytearray(4)
+        buf = self._in4
         self.read(_STATUS_BASE, _STATUS_OPTIONS, buf)
-        ret = struct.unpack(">I", buf)[0]
-        return ret
+        return struct.unpack_from(">I", buf)[0]
 
     def get_version(self):
         """Retrieve the 'version' word from the SeeSaw board"""
-        buf = bytearray(4)
+        buf = self._in4
         self.read(_STATUS_BASE, _STATUS_VERSION, buf)
-        ret = struct.unpack(">I", buf)[0]
-        return ret
+        return struct.unpack_from(">I", buf)[0]
 
     def pin_mode(self, pin, mode):
         """Set the mode of a pin by number"""
@@ -237,109 +817,187 @@ class Seesaw:
             return self.digital_read_bulk_b(1 << (pin - 32)) != 0
         return self.digital_read_bulk(1 << pin) != 0
 
-    def digital_read_bulk(self, pins, delay=0.008):
-        """Get the values of all the pins on the 'A' port as a bitmask"""
-        buf = bytearray(4)
+    def digital_read_bulk(self, pins, delay=None):
+        """Get the values of all the pins on the 'A' port as a bitmask
+
+        Served from the GPIO snapshot when there is one, see `refresh_snapshot`."""
+        if self._snapshot_current():
+            return self._snapshot[0] & pins
+        buf = self._in4
         self.read(_GPIO_BASE, _GPIO_BULK, buf, delay=delay)
-        try:
-            ret = struct.unpack(">I", buf)[0]
-        except OverflowError:
-            buf[0] &= 0x3F
-            ret = struct.unpack(">I", buf)[0]
-        return ret & pins
+        return self._unpack_port(buf, 0) & pins
+
+    def digital_read_bulk_b(self, pins, delay=None):
+        """Get the values of all the pins on the 'B' port as a bitmask
 
-    def digital_read_bulk_b(self, pins, delay=0.008):
-        """Get the values of all the pins on the 'B' port as a bitmask"""
-        buf = bytearray(8)
+        Served from the GPIO snapshot when there is one, see `refresh_snapshot`."""
+        if self._snapshot_current():
+            return self._snapshot[1] & pins
+        buf = self._in8
         self.read(_GPIO_BASE, _GPIO_BULK, buf, delay=delay)
-        ret = struct.unpack(">I", buf[4:])[0]
-        return ret & pins
+        return struct.unpack_from(">I", buf, 4)[0] & pins
+
+    def refresh_snapshot(self, delay=None):
+        """Read ports A and B in a single transaction and keep the result.
+
+        Until `clear_snapshot` is called, `digital_read`, `digital_read_bulk`,
+        `digital_read_bulk_b` and everything built on them (such as
+        `adafruit_seesaw.digitalio.DigitalIO` inputs) are answered from the
+        snapshot without touching the bus. If `snapshot_max_age` is set, a
+        snapshot older than that is refreshed by the next read, and the first
+        read takes one even without calling this.
+
+        :return: Both ports as a 64 bit mask, port B in the upper half"""
+        buf = self._in8
+        self.read(_GPIO_BASE, _GPIO_BULK, buf, delay=delay)
+        return self._store_snapshot(buf)
+
+    def clear_snapshot(self):
+        """Drop the GPIO snapshot so digital reads go to the bus again"""
+        self._snapshot_time = None
+
+    def snapshot(self):
+        """A context manager that takes a GPIO snapshot on entry and drops it
+        on exit, so every digital read inside the block shares one transaction
+
+        .. code-block:: python
+
+            with seesaw.snapshot():
+                pressed = [not button.value for button in buttons]
+        """
+        return _Snapshot(self)
+
+    def _snapshot_current(self):
+        """Whether digital reads should be answered from the snapshot,
+        refreshing it first if it has expired"""
+        if not self._snapshot_in_use():
+            return False
+        if self._snapshot_stale():
+            self.refresh_snapshot()
+        return True
 
     def set_GPIO_interrupts(self, pins, enabled):
         """Enable or disable the GPIO interrupt"""
-        cmd = struct.pack(">I", pins)
-        if enabled:
-            self.write(_GPIO_BASE, _GPIO_INTENSET, cmd)
-        else:
-            self.write(_GPIO_BASE, _GPIO_INTENCLR, cmd)
+        struct.pack_into(">I", self._out, 2, pins)
+        self._write_out(_GPIO_BASE, _GPIO_INTENSET if enabled else _GPIO_INTENCLR, 4)
 
-    def get_GPIO_interrupt_flag(self, delay=0.008):
+    def get_GPIO_interrupt_flag(self, delay=None):
         """Read and clear GPIO interrupts that have fired"""
-        buf = bytearray(4)
+        buf = self._in4
         self.read(_GPIO_BASE, _GPIO_INTFLAG, buf, delay=delay)
-        return struct.unpack(">I", buf)[0]
+        return struct.unpack_from(">I", buf)[0]
 
-    def analog_read(self, pin, delay=0.008):
+    def analog_read(self, pin, delay=None):
         """Read the value of an analog pin by number"""
-        buf = bytearray(2)
-        if pin not in self.pin_mapping.analog_pins:
-            raise ValueError("Invalid ADC pin")
-
-        if self.chip_id == _SAMD09_HW_ID_CODE:
-            offset = self.pin_mapping.analog_pins.index(pin)
-        else:
-            offset = pin
-
-        self.read(_ADC_BASE, _ADC_CHANNEL_OFFSET + offset, buf, delay)
-        ret = struct.unpack(">H", buf)[0]
-        return ret
-
-    def touch_read(self, pin):
+        buf = self._in2
+        self.read(_ADC_BASE, _ADC_CHANNEL_OFFSET + self._adc_offset(pin), buf, delay)
+        return struct.unpack_from(">H", buf)[0]
+
+    def analog_scan(self, pins, out=None, volts=False, delay=None):
+        """Read several analog pins in one call.
+
+        The pins are validated and mapped to ADC channels once, and reused
+        while the same pins are scanned again. The device converts one
+        channel per selected register, so each channel still costs one
+        conversion delay; use `adafruit_seesaw.scheduler` to overlap the
+        delays of several devices.
+
+        :param pins: The pin numbers to read
+        :param out: Where to store the raw readings, an ``array('H')`` or a
+            list, at least as long as ``pins``. Byte buffers, which cannot
+            hold readings above 255, raise `TypeError`. A new ``array('H')``
+            is allocated if None.
+        :param bool volts: Also convert the readings to volts and return those
+        :param float delay: The conversion delay, or None to use the
+            device's timing profile
+        :return: ``out``, or the voltages if ``volts`` is True"""
+        registers = self._scan_registers(pins)
+        count = len(registers)
+        out = self._scan_output(count, out)
+        buf = self._in2
+        for i in range(count):
+            self.read(_ADC_BASE, registers[i], buf, delay)
+            out[i] = (buf[0] << 8) | buf[1]
+        if volts:
+            return self._to_volts(out, count)
+        return out
+
+    def set_adc_window(self, pin, mode, low=0, high=0):
+        """Set up the ADC window comparator to watch an analog pin.
+
+        The comparator runs on the device and raises the interrupt while the
+        reading meets ``mode``, so a level alarm costs no bus traffic until
+        it trips. Use `get_adc_window_flag` or
+        `adafruit_seesaw.interrupts.InterruptDispatcher.watch_adc_window` to
+        react to it. The comparator follows the channel converted last, so
+        reading other analog pins moves it; this method reads ``pin`` once to
+        select it.
+
+        :param int pin: The analog pin to watch
+        :param int mode: One of the ``ADC_WINDOW_`` modes, such as
+            `ADC_WINDOW_ABOVE`. `ADC_WINDOW_OFF` disables the comparator.
+        :param int low: The lower threshold
+        :param int high: The upper threshold"""
+        offset = self._adc_offset(pin)
+        self._write_out(_ADC_BASE, _ADC_WINTHRESH, self._pack_window(mode, low, high))
+        self.write8(_ADC_BASE, _ADC_WINMODE, mode)
+        if mode:
+            self.read(_ADC_BASE, _ADC_CHANNEL_OFFSET + offset, self._in2)
+        self.write8(_ADC_BASE, self._window_interrupt_register(mode), _ADC_WINMON)
+        self.adc_window_pin = pin if mode else None
+
+    def get_adc_window_flag(self, delay=None):
+        """Read and clear whether the ADC window comparator has triggered"""
+        buf = self._in1
+        self.read(_ADC_BASE, _ADC_STATUS, buf, delay)
+        return bool(buf[0] & _ADC_WINMON)
+
+    def touch_read(self, pin, delay=None):
         """Read the value of a touch pin by number"""
-        buf = bytearray(2)
-
-        if pin not in self.pin_mapping.touch_pins:
-            raise ValueError("Invalid touch pin")
-
-        self.read(
-            _TOUCH_BASE,
-            _TOUCH_CHANNEL_OFFSET + self.pin_mapping.touch_pins.index(pin),
-            buf,
-        )
-        ret = struct.unpack(">H", buf)[0]
-        return ret
-
-    def moisture_read(self):
-        """Read the value of the moisture sensor"""
-        buf = bytearray(2)
-
-        self.read(_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET, buf, 0.005)
-        ret = struct.unpack(">H", buf)[0]
-        time.sleep(0.001)
-
-        # retry if reading was bad
-        count = 0
-        while ret > 4095:
-            self.read(_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET, buf, 0.005)
-            ret = struct.unpack(">H", buf)[0]
-            time.sleep(0.001)
-            count += 1
-            if count > 3:
-                raise RuntimeError("Could not get a valid moisture reading.")
-
-        return ret
+        buf = self._in2
+        self.read(_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET + self._touch_offset(pin), buf, delay)
+        return struct.unpack_from(">H", buf)[0]
+
+    def moisture_read(self, delay=None, deadline=None):
+        """Read the value of the moisture sensor
+
+        Bad readings are retried up to four times, and counted in
+        `moisture_stats`. To read several sensors with their delays
+        overlapped, use `adafruit_seesaw.scheduler.read_moisture`.
+
+        :param float delay: The conversion delay, or None to use the device's
+            timing profile
+        :param float deadline: A `time.monotonic` time after which no retry
+            is started. The first attempt is always made.
+        :raises RuntimeError: If no good reading was received"""
+        buf = self._in2
+        for attempt in range(_MOISTURE_ATTEMPTS):
+            if attempt:
+                time.sleep(_MOISTURE_RETRY_DELAY)
+            if not self._moisture_retry(attempt, deadline):
+                break
+            self.read(_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET, buf, delay)
+            value = self._moisture_value(buf)
+            if value is not None:
+                return value
+        raise self._moisture_failed()
+
+    def _write_pins(self, capacity, offset, reg, pins):
+        """Write a bulk GPIO register, leaving out pins the shadow state shows
+        are already set that way"""
+        shadow = self._shadow
+        if shadow is not None:
+            pins = shadow.needed(offset >> 2, reg, pins)
+            if not pins:
+                return
+        self._pack_pins(offset, pins)
+        self._write_out(_GPIO_BASE, reg, capacity)
+        if shadow is not None:
+            shadow.record(offset >> 2, reg, pins)
 
     def _pin_mode_bulk_x(self, capacity, offset, pins, mode):
-        cmd = bytearray(capacity)
-        cmd[offset:] = struct.pack(">I", pins)
-        if mode == self.OUTPUT:
-            self.write(_GPIO_BASE, _GPIO_DIRSET_BULK, cmd)
-        elif mode == self.INPUT:
-            self.write(_GPIO_BASE, _GPIO_DIRCLR_BULK, cmd)
-            self.write(_GPIO_BASE, _GPIO_PULLENCLR, cmd)
-
-        elif mode == self.INPUT_PULLUP:
-            self.write(_GPIO_BASE, _GPIO_DIRCLR_BULK, cmd)
-            self.write(_GPIO_BASE, _GPIO_PULLENSET, cmd)
-            self.write(_GPIO_BASE, _GPIO_BULK_SET, cmd)
-
-        elif mode == self.INPUT_PULLDOWN:
-            self.write(_GPIO_BASE, _GPIO_DIRCLR_BULK, cmd)
-            self.write(_GPIO_BASE, _GPIO_PULLENSET, cmd)
-            self.write(_GPIO_BASE, _GPIO_BULK_CLR, cmd)
-
-        else:
-            raise ValueError("Invalid pin mode")
+        for reg in self._pin_mode_registers(mode):
+            self._write_pins(capacity, offset, reg, pins)
 
     def pin_mode_bulk(self, pins, mode):
         """Set the mode of all the pins on the 'A' port as a bitmask"""
@@ -351,76 +1009,59 @@ class Seesaw:
 
     def digital_write_bulk(self, pins, value):
         """Set the mode of pins on the 'A' port as a bitmask"""
-        cmd = struct.pack(">I", pins)
-        if value:
-            self.write(_GPIO_BASE, _GPIO_BULK_SET, cmd)
-        else:
-            self.write(_GPIO_BASE, _GPIO_BULK_CLR, cmd)
+        self._write_pins(4, 0, _GPIO_BULK_SET if value else _GPIO_BULK_CLR, pins)
 
     def digital_write_bulk_b(self, pins, value):
         """Set the mode of pins on the 'B' port as a bitmask"""
-        cmd = bytearray(8)
-        cmd[4:] = struct.pack(">I", pins)
-        if value:
-            self.write(_GPIO_BASE, _GPIO_BULK_SET, cmd)
-        else:
-            self.write(_GPIO_BASE, _GPIO_BULK_CLR, cmd)
+        self._write_pins(8, 4, _GPIO_BULK_SET if value else _GPIO_BULK_CLR, pins)
 
     def analog_write(self, pin, value, delay=0.001):
         """Set the value of an analog output by number"""
-        if pin not in self.pin_mapping.pwm_pins:
-            raise ValueError("Invalid PWM pin")
-
-        if self.chip_id == _SAMD09_HW_ID_CODE:
-            offset = self.pin_mapping.pwm_pins.index(pin)
-        else:
-            offset = pin
-
-        if self.pin_mapping.pwm_width == 16:
-            cmd = bytearray([offset, (value >> 8), value & 0xFF])
-        else:
-            cmd = bytearray([offset, value])
-
-        self.write(_TIMER_BASE, _TIMER_PWM, cmd)
+        offset = self._pwm_offset(pin)
+        shadow = self._shadow
+        if shadow is not None and shadow.pwm.get(offset) == value:
+            return
+
+        self._write_out(_TIMER_BASE, _TIMER_PWM, self._pack_pwm(offset, value))
+        if shadow is not None:
+            shadow.pwm[offset] = value
         time.sleep(delay)
 
-    def get_temp(self):
+    def get_temp(self, delay=None):
         """Read the temperature"""
-        buf = bytearray(4)
-        self.read(_STATUS_BASE, _STATUS_TEMP, buf, 0.005)
+        buf = self._in4
+        self.read(_STATUS_BASE, _STATUS_TEMP, buf, delay)
         buf[0] &= 0x3F
-        ret = struct.unpack(">I", buf)[0]
+        ret = struct.unpack_from(">I", buf)[0]
         return 0.00001525878 * ret
 
     def set_pwm_freq(self, pin, freq):
         """Set the PWM frequency of a pin by number"""
-        if pin not in self.pin_mapping.pwm_pins:
-            raise ValueError("Invalid PWM pin")
+        offset = self._pwm_offset(pin)
+        shadow = self._shadow
+        if shadow is not None and shadow.pwm_freq.get(offset) == freq:
+            return
 
-        if self.chip_id == _SAMD09_HW_ID_CODE:
-            offset = self.pin_mapping.pwm_pins.index(pin)
-        else:
-            offset = pin
-
-        cmd = bytearray([offset, (freq >> 8), freq & 0xFF])
-        self.write(_TIMER_BASE, _TIMER_FREQ, cmd)
+        self._write_out(_TIMER_BASE, _TIMER_FREQ, self._pack_pwm_freq(offset, freq))
+        if shadow is not None:
+            shadow.pwm_freq[offset] = freq
 
     def encoder_position(self, encoder=0):
         """The current position of the encoder"""
-        buf = bytearray(4)
+        buf = self._in4
         self.read(_ENCODER_BASE, _ENCODER_POSITION + encoder, buf)
-        return struct.unpack(">i", buf)[0]
+        return struct.unpack_from(">i", buf)[0]
 
     def set_encoder_position(self, pos, encoder=0):
         """Set the current position of the encoder"""
-        cmd = struct.pack(">i", pos)
-        self.write(_ENCODER_BASE, _ENCODER_POSITION + encoder, cmd)
+        struct.pack_into(">i", self._out, 2, pos)
+        self._write_out(_ENCODER_BASE, _ENCODER_POSITION + encoder, 4)
 
     def encoder_delta(self, encoder=0):
         """The change in encoder position since it was last read"""
-        buf = bytearray(4)
+        buf = self._in4
         self.read(_ENCODER_BASE, _ENCODER_DELTA + encoder, buf)
-        return struct.unpack(">i", buf)[0]
+        return struct.unpack_from(">i", buf)[0]
 
     def enable_encoder_interrupt(self, encoder=0):
         """Enable the interrupt to fire when the encoder changes position"""
@@ -430,21 +1071,21 @@ class Seesaw:
         """Disable the interrupt from firing when the encoder changes"""
         self.write8(_ENCODER_BASE, _ENCODER_INTENCLR + encoder, 0x01)
 
-    # def enable_sercom_data_rdy_interrupt(self, sercom):
-    #
-    #     _sercom_inten.DATA_RDY = 1
-    #     self.write8(SEESAW_SERCOM0_BASE + sercom, SEESAW_SERCOM_INTEN, _sercom_inten.get())
-    #
-    #
-    # def disable_sercom_data_rdy_interrupt(self, sercom):
-    #
-    #     _sercom_inten.DATA_RDY = 0
-    #     self.write8(SEESAW_SERCOM0_BASE + sercom, SEESAW_SERCOM_INTEN, _sercom_inten.get())
-    #
-    #
-    # def read_sercom_data(self, sercom):
-    #
-    #     return self.read8(SEESAW_SERCOM0_BASE + sercom, SEESAW_SERCOM_DATA)
+    def enable_sercom_data_rdy_interrupt(self, sercom=0):
+        """Enable the interrupt to fire when the SERCOM has received data"""
+        self.write8(_SERCOM0_BASE + sercom, _SERCOM_INTEN, _SERCOM_INTEN_DATA_RDY)
+
+    def disable_sercom_data_rdy_interrupt(self, sercom=0):
+        """Disable the interrupt from firing when the SERCOM receives data"""
+        self.write8(_SERCOM0_BASE + sercom, _SERCOM_INTENCLR, _SERCOM_INTEN_DATA_RDY)
+
+    def sercom_data_ready(self, sercom=0):
+        """Whether the SERCOM has received data waiting to be read"""
+        return bool(self.read8(_SERCOM0_BASE + sercom, _SERCOM_STATUS) & _SERCOM_STATUS_DATA_RDY)
+
+    def read_sercom_data(self, sercom=0):
+        """Read one received byte from the SERCOM"""
+        return self.read8(_SERCOM0_BASE + sercom, _SERCOM_DATA)
 
     def _get_eeprom_i2c_addr(self):
         """Return the EEPROM address used to store I2C address."""
@@ -476,50 +1117,175 @@ class Seesaw:
 
     def eeprom_write8(self, addr, val):
         """Write a single byte directly to the device's EEPROM"""
-        self.eeprom_write(addr, bytearray([val]))
-
-    def eeprom_write(self, addr, buf):
-        """Write multiple bytes directly to the device's EEPROM"""
-        self.write(_EEPROM_BASE, addr, buf)
+        self.write8(_EEPROM_BASE, addr, val)
+        self._eeprom_record(addr, bytes((val,)))
+
+    def eeprom_write(self, addr, buf, compare=False):
+        """Write multiple bytes directly to the device's EEPROM.
+
+        The write is split so that no transaction crosses an EEPROM page.
+        Bytes already known to hold the same value are skipped.
+
+        :param int addr: The first address to write
+        :param buf: The bytes to write
+        :param bool compare: Read the range first, if `eeprom_mirror` does
+            not already know it, so that matching bytes can be skipped
+        :return: The number of bytes actually written"""
+        length = len(buf)
+        self._check_eeprom_range(addr, length)
+        current = self._eeprom_known(addr, length)
+        if current is None and compare:
+            current = self.eeprom_read(addr, length)
+        written = 0
+        for reg, chunk in self._eeprom_writes(addr, buf, current):
+            self.write(_EEPROM_BASE, reg, chunk)
+            written += len(chunk)
+        self._eeprom_record(addr, buf)
+        return written
 
     def eeprom_read8(self, addr):
         """Read a single byte directly to the device's EEPROM"""
-        return self.read8(_EEPROM_BASE, addr)
+        known = self._eeprom_known(addr, 1)
+        if known is not None:
+            return known[0]
+        value = self.read8(_EEPROM_BASE, addr)
+        self._eeprom_record(addr, bytes((value,)))
+        return value
+
+    def eeprom_read(self, addr, length):
+        """Read ``length`` bytes from the device's EEPROM, see `eeprom_readinto`"""
+        return self.eeprom_readinto(addr, bytearray(length))
+
+    def eeprom_readinto(self, addr, buf):
+        """Fill ``buf`` from the device's EEPROM starting at ``addr``, reading
+        up to 32 bytes per transaction, or none if `eeprom_mirror` already
+        knows them
+
+        :return: ``buf``"""
+        self._check_eeprom_range(addr, len(buf))
+        known = self._eeprom_known(addr, len(buf))
+        if known is not None:
+            buf[:] = known
+            return buf
+        for reg, chunk in self._eeprom_reads(addr, buf):
+            self.read(_EEPROM_BASE, reg, chunk)
+        self._eeprom_record(addr, buf)
+        return buf
 
     def uart_set_baud(self, baud):
         """Set the serial baudrate of the device"""
-        cmd = struct.pack(">I", baud)
-        self.write(_SERCOM0_BASE, _SERCOM_BAUD, cmd)
+        struct.pack_into(">I", self._out, 2, baud)
+        self._write_out(_SERCOM0_BASE, _SERCOM_BAUD, 4)
 
     def write8(self, reg_base, reg, value):
         """Write an arbitrary I2C byte register on the device"""
-        self.write(reg_base, reg, bytearray([value]))
+        self._write_out(reg_base, reg, self._pack_byte(value))
 
     def read8(self, reg_base, reg):
         """Read an arbitrary I2C byte register on the device"""
-        ret = bytearray(1)
+        ret = self._in1
         self.read(reg_base, reg, ret)
         return ret[0]
 
-    def read(self, reg_base, reg, buf, delay=0.008):
-        """Read an arbitrary I2C register range on the device"""
-        self.write(reg_base, reg)
+    def read(self, reg_base, reg, buf, delay=None, end=None):
+        """Read an arbitrary I2C register range on the device
+
+        Unless ``delay`` is given, the wait between selecting the register and
+        reading it back comes from the device's `timing` profile. Only the
+        first ``end`` bytes of ``buf`` are filled if ``end`` is given."""
+        lock = self._io_lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            self._write_out(reg_base, reg, 0)
+            if self._drdy is not None:
+                while self._drdy.value is False:
+                    pass
+            else:
+                if delay is None:
+                    delay = self.timing.delay(reg_base, reg)
+                time.sleep(delay)
+            with self.i2c_device as i2c:
+                # CircuitPython defaults end to sys.maxsize and rejects None
+                if end is None:
+                    i2c.readinto(buf)
+                else:
+                    i2c.readinto(buf, end=end)
+        finally:
+            if lock is not None:
+                lock.release()
+
+    def read_start(self, reg_base, reg):
+        """Select a register for reading, the first half of `read`.
+
+        Call `read_finish` once the returned delay has passed. Splitting the
+        read lets `adafruit_seesaw.scheduler` overlap the delays of several
+        devices.
+
+        :return: The delay in seconds to wait before `read_finish`"""
+        lock = self._io_lock
+        if lock is not None:
+            # held until read_finish
+            lock.acquire()
+        try:
+            self._write_out(reg_base, reg, 0)
+        except BaseException:
+            if lock is not None:
+                lock.release()
+            raise
         if self._drdy is not None:
-            while self._drdy.value is False:
-                pass
-        else:
-            time.sleep(delay)
-        with self.i2c_device as i2c:
-            i2c.readinto(buf)
+            return 0
+        return self.timing.delay(reg_base, reg)
+
+    def read_finish(self, buf):
+        """Read the register selected by `read_start` into ``buf``"""
+        try:
+            if self._drdy is not None:
+                while self._drdy.value is False:
+                    pass
+            with self.i2c_device as i2c:
+                i2c.readinto(buf)
+        finally:
+            if self._io_lock is not None:
+                self._io_lock.release()
 
     def write(self, reg_base, reg, buf=None):
         """Write an arbitrary I2C register range on the device"""
-        full_buffer = bytearray([reg_base, reg])
+        length = 0
         if buf is not None:
-            full_buffer += buf
-
-        if self._drdy is not None:
-            while self._drdy.value is False:
-                pass
-        with self.i2c_device as i2c:
-            i2c.write(full_buffer)
+            length = len(buf)
+            if length + 2 > len(self._out):
+                self._out = bytearray(length + 2)
+            self._out[2 : length + 2] = buf
+        self._write_out(reg_base, reg, length)
+
+    def write_raw(self, buf):
+        """Write ``buf``, which already starts with the module base and
+        register, as a single transaction.
+
+        Nothing is copied, and the driver's own output buffer is left alone,
+        so a thread holding its own buffer can write while another thread
+        prepares the next command."""
+        self._write_buffer(buf, len(buf))
+
+    def _write_out(self, reg_base, reg, length):
+        """Send the register header followed by the first ``length`` payload
+        bytes already placed in the output buffer"""
+        out = self._out
+        out[0] = reg_base
+        out[1] = reg
+        self._write_buffer(out, length + 2)
+
+    def _write_buffer(self, buf, end):
+        lock = self._io_lock
+        if lock is not None:
+            lock.acquire()
+        try:
+            if self._drdy is not None:
+                while self._drdy.value is False:
+                    pass
+            with self.i2c_device as i2c:
+                i2c.write(buf, end=end)
+        finally:
+            if lock is not None:
+                lock.release()
@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.timing`
+====================================================
+
+How long to wait between selecting a register and reading it back.
+
+`adafruit_seesaw.seesaw.Seesaw` looks the delay for each register up in a
+`TimingProfile` chosen by the chip ID of the attached device. The built-in
+`PROFILES` can be edited before devices are created, a profile can be
+adjusted on a live device through its ``timing`` attribute, and `calibrate`
+measures the shortest safe delays for the attached board.
+
+* Author(s): Adafruit Industries
+"""
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(x):
+        return x
+
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+_STATUS_BASE = const(0x00)
+_GPIO_BASE = const(0x01)
+_SERCOM0_BASE = const(0x02)
+_ADC_BASE = const(0x09)
+_EEPROM_BASE = const(0x0D)
+_TOUCH_BASE = const(0x0F)
+_KEYPAD_BASE = const(0x10)
+_ENCODER_BASE = const(0x11)
+
+_STATUS_HW_ID = const(0x01)
+_STATUS_VERSION = const(0x02)
+_STATUS_OPTIONS = const(0x03)
+_STATUS_TEMP = const(0x04)
+_GPIO_BULK = const(0x04)
+_ADC_CHANNEL_OFFSET = const(0x07)
+_TOUCH_CHANNEL_OFFSET = const(0x10)
+_ENCODER_POSITION = const(0x30)
+
+_SAMD09_HW_ID_CODE = const(0x55)
+
+#: The delay used for any register a profile has no entry for
+DEFAULT_DELAY = 0.008
+
+# The ATtiny firmware answers these modules well within the delays the
+# Arduino seesaw driver uses for them. Touch gets the 5 ms moisture_read has
+# always waited for its touch channel, shorter than the 8 ms default that
+# touch_read used to wait, and the keypad FIFO the Arduino driver's 1 ms.
+_ATTINY_DELAYS = {
+    _STATUS_BASE: 0.001,
+    _GPIO_BASE: 0.00025,
+    _ADC_BASE: 0.0005,
+    _EEPROM_BASE: 0.0005,
+    _TOUCH_BASE: 0.005,
+    _KEYPAD_BASE: 0.001,
+    _ENCODER_BASE: 0.00025,
+}
+
+#: Built-in delays keyed by chip ID. Each entry maps a module base, or a
+#: ``(base, register)`` tuple, to a delay in seconds.
+PROFILES = {
+    _SAMD09_HW_ID_CODE: {
+        (_STATUS_BASE, _STATUS_TEMP): 0.005,
+        # touch_read has always waited the 8 ms default, moisture_read 5 ms.
+        # The soil sensor's moisture register is the first touch channel, so
+        # a Crickit's first touch pad reads after 5 ms too.
+        _TOUCH_BASE: 0.008,
+        (_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET): 0.005,
+        # the Arduino driver's default delay, which it uses for the UART
+        _SERCOM0_BASE: 0.00025,
+    },
+    0x46: _ATTINY_DELAYS,  # ATtiny416
+    0x84: _ATTINY_DELAYS,  # ATtiny806
+    0x85: _ATTINY_DELAYS,  # ATtiny807
+    0x86: _ATTINY_DELAYS,  # ATtiny816
+    0x87: _ATTINY_DELAYS,  # ATtiny817
+    0x88: _ATTINY_DELAYS,  # ATtiny1616
+    0x89: _ATTINY_DELAYS,  # ATtiny1617
+}
+
+#: Delays tried by `calibrate`, longest first
+CALIBRATION_DELAYS = (0.008, 0.005, 0.003, 0.002, 0.001, 0.0005, 0.00025, 0.0001, 0.00005, 0)
+
+
+class TimingProfile:
+    """Register read delays for one device
+
+    :param int chip_id: The chip ID whose entry in `PROFILES` to start from.
+        ``None`` gives `DEFAULT_DELAY` for every register.
+    :param dict delays: Additional entries, taking precedence over `PROFILES`
+    :param float default: The delay for registers without an entry"""
+
+    def __init__(self, chip_id=None, delays=None, default=DEFAULT_DELAY):
+        self.chip_id = chip_id
+        self.default = default
+        self.delays = dict(PROFILES.get(chip_id, {}))
+        if delays:
+            self.delays.update(delays)
+
+    def delay(self, reg_base, reg):
+        """The delay, in seconds, to wait before reading ``reg`` of ``reg_base``"""
+        delays = self.delays
+        delay = delays.get((reg_base, reg))
+        if delay is None:
+            delay = delays.get(reg_base, self.default)
+        return delay
+
+    def set_delay(self, delay, reg_base, reg=None):
+        """Override the delay for a whole module, or for one register of it
+
+        :param float delay: The delay in seconds
+        :param int reg_base: The module base
+        :param int reg: The register, or None for every register of the module"""
+        self.delays[reg_base if reg is None else (reg_base, reg)] = delay
+
+    def to_dict(self):
+        """A JSON serializable representation of the profile"""
+        return {
+            "chip_id": self.chip_id,
+            "default": self.default,
+            "delays": [
+                list(key) + [delay] if isinstance(key, tuple) else [key, None, delay]
+                for key, delay in self.delays.items()
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a profile from the output of `to_dict`"""
+        profile = cls(data["chip_id"], default=data["default"])
+        profile.delays = {}
+        for reg_base, reg, delay in data["delays"]:
+            profile.set_delay(delay, reg_base, reg)
+        return profile
+
+    def save(self, path):
+        """Write the profile to a JSON file at ``path``"""
+        import json  # noqa: PLC0415
+
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path):
+        """Read a profile written by `save`"""
+        import json  # noqa: PLC0415
+
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+
+def default_registers(seesaw):
+    """The ``(base, register, length)`` triples `calibrate` measures by default.
+
+    Only modules the device reports in its OPTIONS word are included."""
+    options = seesaw.get_options()
+    registers = [
+        (_STATUS_BASE, _STATUS_HW_ID, 1),
+        (_STATUS_BASE, _STATUS_VERSION, 4),
+        (_STATUS_BASE, _STATUS_OPTIONS, 4),
+    ]
+    if options & (1 << _GPIO_BASE):
+        registers.append((_GPIO_BASE, _GPIO_BULK, 8))
+    pin_mapping = seesaw.pin_mapping
+    if options & (1 << _ADC_BASE) and pin_mapping.analog_pins:
+        pin = pin_mapping.analog_pins[0]
+        if seesaw.chip_id == _SAMD09_HW_ID_CODE:
+            pin = 0
+        registers.append((_ADC_BASE, _ADC_CHANNEL_OFFSET + pin, 2))
+    if options & (1 << _TOUCH_BASE):
+        registers.append((_TOUCH_BASE, _TOUCH_CHANNEL_OFFSET, 2))
+    if options & (1 << _ENCODER_BASE):
+        registers.append((_ENCODER_BASE, _ENCODER_POSITION, 4))
+    return registers
+
+
+def calibrate(
+    seesaw,
+    registers=None,
+    *,
+    delays=CALIBRATION_DELAYS,
+    trials=5,
+    tolerance=0,
+    margin=1.5,
+    path=None,
+):
+    """Find the shortest safe delay for each register of an attached device.
+
+    Every register is first read with the longest of ``delays`` to get a
+    reference value. Shorter delays are then tried in turn, and a delay is
+    accepted when ``trials`` consecutive reads all agree with the reference.
+    The shortest accepted delay, multiplied by ``margin``, is stored in
+    ``seesaw.timing`` for that register.
+
+    Only calibrate registers whose value holds still while this runs.
+
+    :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The device
+    :param registers: ``(base, register, length)`` triples to measure.
+        Defaults to `default_registers`.
+    :param delays: Candidate delays, longest first
+    :param int trials: Reads that must agree before a delay is accepted
+    :param int tolerance: How far a value, read as a big endian integer, may
+        stray from the reference. Use a few counts for ADC and touch readings.
+    :param float margin: Factor applied to the shortest accepted delay
+    :param str path: Where to save the resulting profile, if anywhere
+    :return: The updated `TimingProfile`"""
+    if registers is None:
+        registers = default_registers(seesaw)
+    profile = seesaw.timing
+    for reg_base, reg, length in registers:
+        buf = bytearray(length)
+        seesaw.read(reg_base, reg, buf, delays[0])
+        reference = int.from_bytes(buf, "big")
+        safe = delays[0]
+        for delay in delays[1:]:
+            if not _agrees(seesaw, reg_base, reg, buf, delay, reference, trials, tolerance):
+                break
+            safe = delay
+        profile.set_delay(min(safe * margin, delays[0]), reg_base, reg)
+    if path is not None:
+        profile.save(path)
+    return profile
+
+
+def _agrees(seesaw, reg_base, reg, buf, delay, reference, trials, tolerance):
+    for _ in range(trials):
+        try:
+            seesaw.read(reg_base, reg, buf, delay)
+        except OSError:
+            return False
+        if abs(int.from_bytes(buf, "big") - reference) > tolerance:
+            return False
+    return True
@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.touch`
+====================================================
+
+Capacitive touch scanning with baseline tracking.
+
+A `TouchScanner` reads every touch pin of a device as one
+`adafruit_seesaw.scheduler.ReadSchedule`, compares each reading with a
+per-channel baseline and reports touched and released events, so
+applications don't each reimplement thresholding.
+
+.. code-block:: python
+
+    from adafruit_seesaw.seesaw import Seesaw
+    from adafruit_seesaw.touch import TouchScanner
+
+    crickit = Seesaw(board.I2C())
+    scanner = TouchScanner(crickit)
+    while True:
+        for pin, touched in scanner.update():
+            print(pin, "touched" if touched else "released")
+
+* Author(s): Adafruit Industries
+"""
+
+import array
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(x):
+        return x
+
+
+from adafruit_seesaw.scheduler import ReadSchedule
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+_TOUCH_BASE = const(0x0F)
+_TOUCH_CHANNEL_OFFSET = const(0x10)
+
+
+class TouchScanner:
+    """Reads the touch pins of a device and turns the readings into touched
+    and released events.
+
+    A channel counts as touched once its reading rises more than
+    ``threshold`` above its baseline, and as released once it falls back
+    below ``threshold - hysteresis``. While a channel is released its
+    baseline follows the readings by ``drift`` of the difference per scan,
+    which compensates for slow changes in humidity and temperature.
+
+    :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The device
+    :param pins: The touch pins to scan, all of ``pin_mapping.touch_pins``
+        if None
+    :param int threshold: The rise over the baseline that means touched
+    :param int hysteresis: How far under ``threshold`` a reading must fall
+        to mean released
+    :param float drift: How quickly baselines follow released channels,
+        from 0 (never) to 1 (immediately)"""
+
+    def __init__(self, seesaw, pins=None, threshold=100, hysteresis=20, drift=0.01):
+        touch_pins = seesaw.pin_mapping.touch_pins
+        if pins is None:
+            pins = touch_pins
+        if not 0 <= drift <= 1:
+            raise ValueError("drift must be from 0 to 1")
+        if not 0 <= hysteresis < threshold:
+            raise ValueError("hysteresis must be at least 0 and less than threshold")
+        self._schedule = ReadSchedule()
+        for pin in pins:
+            if pin not in touch_pins:
+                raise ValueError("Invalid touch pin")
+            self._schedule.add(
+                seesaw, _TOUCH_BASE, _TOUCH_CHANNEL_OFFSET + touch_pins.index(pin), ">H"
+            )
+        count = len(self._schedule)
+        #: The pins scanned, in the order of the arrays
+        self.pins = tuple(pins)
+        #: The latest reading of each pin
+        self.values = array.array("H", bytes(2 * count))
+        #: The untouched reading of each pin
+        self.baselines = array.array("f", [0.0] * count)
+        self._touched = bytearray(count)
+        self._threshold = threshold
+        self._release = threshold - hysteresis
+        self._drift = drift
+        self._calibrated = False
+
+    def __len__(self):
+        return len(self.pins)
+
+    @property
+    def touched(self):
+        """The pins currently touched"""
+        return tuple(pin for pin, touched in zip(self.pins, self._touched) if touched)
+
+    def is_touched(self, pin):
+        """Whether ``pin`` is currently touched"""
+        return bool(self._touched[self.pins.index(pin)])
+
+    def calibrate(self, samples=4):
+        """Set the baselines to the average of ``samples`` scans, which must
+        be taken while nothing touches the pins. The first `update` calibrates
+        from a single scan if this was not called."""
+        count = len(self.pins)
+        totals = [0] * count
+        for _ in range(samples):
+            for i, value in enumerate(self._schedule.run()):
+                totals[i] += value
+        for i in range(count):
+            self.baselines[i] = totals[i] / samples
+            self._touched[i] = 0
+        self._calibrated = True
+
+    def update(self):
+        """Scan every pin once.
+
+        :return: ``(pin, touched)`` pairs for the pins that were touched or
+            released since the last scan"""
+        if not self._calibrated:
+            self.calibrate(1)
+        values = self.values
+        baselines = self.baselines
+        touched = self._touched
+        drift = self._drift
+        events = []
+        for i, value in enumerate(self._schedule.run()):
+            values[i] = value
+            rise = value - baselines[i]
+            if touched[i]:
+                if rise < self._release:
+                    touched[i] = 0
+                    events.append((self.pins[i], False))
+            elif rise > self._threshold:
+                touched[i] = 1
+                events.append((self.pins[i], True))
+            else:
+                baselines[i] += drift * rise
+        return events
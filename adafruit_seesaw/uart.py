@@ -0,0 +1,262 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_seesaw.uart`
+====================================================
+
+A `busio.UART` compatible stream over the UART of a SAMD09 seesaw.
+
+Received bytes are moved from the device into a ring buffer on the host, so
+`UART.read` and `UART.readline` serve whatever has already arrived without
+touching the bus. Given the seesaw's INT line, the driver leaves the bus
+alone until the data-ready interrupt asserts instead of polling the status
+register. Writes go out in chunks of up to 32 bytes per transaction.
+
+Receiving cannot be batched the same way: the firmware hands out one byte per
+read of the DATA register, so every received byte costs a select, the
+SERCOM read delay and a read. Without an INT line each byte also needs a
+STATUS read first, doubling that. With the line, STATUS is read once per
+burst and the line alone decides whether more bytes follow, so no other
+module's interrupt should be enabled while it asserts. Either way the
+receive rate is bounded by the bus, at about a thousand bytes a second on a
+100 kHz bus, so sustained input much above 9600 baud overruns the device.
+
+.. code-block:: python
+
+    import board
+    import digitalio
+
+    from adafruit_seesaw.seesaw import Seesaw
+    from adafruit_seesaw.uart import UART
+
+    seesaw = Seesaw(board.I2C())
+    int_pin = digitalio.DigitalInOut(board.D5)
+    int_pin.pull = digitalio.Pull.UP
+
+    uart = UART(seesaw, 9600, interrupt=int_pin)
+    uart.write(b"hello\\r\\n")
+    print(uart.readline())
+
+* Author(s): Adafruit Industries
+"""
+
+import time
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(x):
+        return x
+
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_seesaw.git"
+
+_SERCOM0_BASE = const(0x02)
+
+_SERCOM_DATA = const(0x05)
+
+# Bytes of data sent per write transaction, as the Arduino driver does
+_WRITE_CHUNK = const(32)
+
+
+class UART:
+    """A serial port on a seesaw device, with a receive ring buffer on the host
+
+    :param ~adafruit_seesaw.seesaw.Seesaw seesaw: The device
+    :param int baudrate: The transmit and receive speed
+    :param interrupt: The host pin connected to the seesaw's INT output, as
+        a `digitalio.DigitalInOut`, which must be pulled up, or a callable
+        that returns True while the interrupt is asserted. Without it the
+        status register is polled, once per byte.
+    :param float timeout: The initial `timeout`, in seconds
+    :param int receiver_buffer_size: The size of the ring buffer
+    :param float interval: Pause between checks for data while waiting"""
+
+    def __init__(
+        self,
+        seesaw,
+        baudrate=9600,
+        *,
+        interrupt=None,
+        timeout=1.0,
+        receiver_buffer_size=64,
+        interval=0.001,
+    ):
+        self._seesaw = seesaw
+        self._timeout = timeout
+        self._interval = interval
+        self._ring = bytearray(receiver_buffer_size)
+        self._head = 0
+        self._count = 0
+        self._out = bytearray(_WRITE_CHUNK + 2)
+        self._out[0] = _SERCOM0_BASE
+        self._out[1] = _SERCOM_DATA
+        self.baudrate = baudrate
+        if interrupt is None:
+            self._asserted = None
+        else:
+            if callable(interrupt):
+                self._asserted = interrupt
+            else:
+                interrupt.switch_to_input()
+                self._asserted = lambda: not interrupt.value
+            seesaw.enable_sercom_data_rdy_interrupt()
+
+    def deinit(self):
+        """Disable the data-ready interrupt"""
+        if self._asserted is not None:
+            self._seesaw.disable_sercom_data_rdy_interrupt()
+            self._asserted = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.deinit()
+
+    @property
+    def timeout(self):
+        """How long `read`, `readinto` and `readline` wait for data to
+        arrive, in seconds"""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self._timeout = value
+
+    @property
+    def baudrate(self):
+        """The transmit and receive speed"""
+        return self._baudrate
+
+    @baudrate.setter
+    def baudrate(self, value):
+        self._seesaw.uart_set_baud(value)
+        self._baudrate = value
+
+    @property
+    def in_waiting(self):
+        """The number of bytes received and not yet read"""
+        self._fill()
+        return self._count
+
+    def reset_input_buffer(self):
+        """Discard every byte received so far, on the device and the host"""
+        while self._fill():
+            self._count = 0
+        self._count = 0
+
+    def read(self, nbytes=None):
+        """Read up to ``nbytes`` bytes, waiting up to `timeout` for them to
+        arrive. Reads everything waiting if ``nbytes`` is None.
+
+        :return: The bytes read, or None if nothing arrived"""
+        if nbytes is None:
+            self._fill()
+            nbytes = self._count
+        buf = bytearray(nbytes)
+        count = self.readinto(buf)
+        if not count:
+            return None
+        return buf if count == nbytes else buf[:count]
+
+    def readinto(self, buf, nbytes=None):
+        """Read bytes into ``buf``, waiting up to `timeout` for ``nbytes`` of
+        them, or as many as ``buf`` holds.
+
+        :return: The number of bytes read, or None if nothing arrived"""
+        if nbytes is None:
+            nbytes = len(buf)
+        done = 0
+        deadline = time.monotonic() + self._timeout
+        while True:
+            done += self._take(buf, done, nbytes - done)
+            if done >= nbytes or not self._wait(deadline):
+                break
+        return done or None
+
+    def readline(self):
+        """Read up to and including a newline, waiting up to `timeout` for it
+
+        :return: The line, what arrived before the timeout if it has no
+            newline yet, or None if nothing arrived"""
+        line = bytearray()
+        deadline = time.monotonic() + self._timeout
+        while True:
+            ring = self._ring
+            size = len(ring)
+            while self._count:
+                byte = ring[self._head]
+                self._head = (self._head + 1) % size
+                self._count -= 1
+                line.append(byte)
+                if byte == 0x0A:
+                    return line
+            if not self._wait(deadline):
+                return line or None
+
+    def write(self, buf):
+        """Send ``buf`` out of the UART
+
+        :return: The number of bytes written"""
+        out = self._out
+        seesaw = self._seesaw
+        for start in range(0, len(buf), _WRITE_CHUNK):
+            chunk = buf[start : start + _WRITE_CHUNK]
+            out[2 : 2 + len(chunk)] = chunk
+            seesaw.write_raw(memoryview(out)[: 2 + len(chunk)])
+        return len(buf)
+
+    def _wait(self, deadline):
+        """Wait for more data until ``deadline``, returning whether any came"""
+        while True:
+            if self._fill():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self._interval)
+
+    def _fill(self):
+        """Move the bytes waiting on the device into the ring buffer, stopping
+        when it is full, and return how many were moved"""
+        seesaw = self._seesaw
+        asserted = self._asserted
+        ring = self._ring
+        size = len(ring)
+        moved = 0
+        confirmed = False
+        while self._count < size:
+            if asserted is not None:
+                # the INT line is free to check. One status read confirms
+                # that the UART, not another module, raised it; after that
+                # the line alone says whether more bytes are waiting.
+                if not asserted():
+                    break
+                if not confirmed:
+                    if not seesaw.sercom_data_ready():
+                        break
+                    confirmed = True
+            elif not seesaw.sercom_data_ready():
+                break
+            ring[(self._head + self._count) % size] = seesaw.read_sercom_data()
+            self._count += 1
+            moved += 1
+        return moved
+
+    def _take(self, buf, start, nbytes):
+        """Copy up to ``nbytes`` buffered bytes into ``buf`` at ``start``"""
+        ring = self._ring
+        size = len(ring)
+        count = min(nbytes, self._count)
+        head = self._head
+        first = min(count, size - head)
+        buf[start : start + first] = ring[head : head + first]
+        if count > first:
+            buf[start + first : start + count] = ring[: count - first]
+        self._head = (head + count) % size
+        self._count -= count
+        return count
@@ -40,5 +40,8 @@ for arcade_qt in arcade_qts:
         leds.append(led)
 
 while True:
+    # Read all of a board's buttons in one transaction instead of one per button
+    for arcade_qt in arcade_qts:
+        arcade_qt.refresh_snapshot()
     for led_number, button in enumerate(buttons):
         leds[led_number].value = not button.value
@@ -19,7 +19,8 @@ import adafruit_seesaw.seesaw
 i2c = board.STEMMA_I2C()
 seesaw = adafruit_seesaw.seesaw.Seesaw(i2c, 0x49)
 
-encoders = [adafruit_seesaw.rotaryio.IncrementalEncoder(seesaw, n) for n in range(4)]
+# read all four encoders in one sweep
+encoders = adafruit_seesaw.rotaryio.EncoderBank([(seesaw, n) for n in range(4)])
 switches = [adafruit_seesaw.digitalio.DigitalIO(seesaw, pin) for pin in (12, 14, 17, 9)]
 for switch in switches:
     switch.switch_to_input(digitalio.Pull.UP)  # input & pullup!
@@ -33,7 +34,8 @@ colors = [0, 0, 0, 0]  # start at red
 
 while True:
     # negate the position to make clockwise rotation positive
-    positions = [encoder.position for encoder in encoders]
+    encoders.update()
+    positions = list(encoders.positions)
     print(positions)
     for n, rotary_pos in enumerate(positions):
         if rotary_pos != last_positions[n]:
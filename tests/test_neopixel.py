@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_seesaw.emulator import EmulatedI2C, SeesawEmulator
+from adafruit_seesaw.neopixel import NeoPixel
+from adafruit_seesaw.seesaw import Seesaw
+
+
+class _FailingWrites:
+    """Fail every pixel buffer write after the first ``allowed``"""
+
+    def __init__(self, seesaw, allowed):
+        self._write_raw = seesaw.write_raw
+        self.allowed = allowed
+
+    def __call__(self, buf):
+        if buf[1] == 0x04:  # NEOPIXEL_BUF
+            if self.allowed <= 0:
+                raise OSError(5, "Input/output error")
+            self.allowed -= 1
+        self._write_raw(buf)
+
+
+def test_failed_upload_is_resent():
+    i2c = EmulatedI2C()
+    device = i2c.add_device(0x49, SeesawEmulator())
+    with i2c.clock:
+        ss = Seesaw(i2c)
+        pixels = NeoPixel(ss, 10, 20, auto_write=False, chunk_size=6)
+        pixels.show()
+
+        # the first chunk of the new frame lands, the rest fails
+        pixels.fill((1, 1, 1))
+        ss.write_raw = _FailingWrites(ss, 1)
+        with pytest.raises(OSError):
+            pixels.show()
+        assert device.neopixel_buf[:3] == b"\x01\x01\x01"
+        del ss.write_raw
+
+        # going back to the last complete frame has to resend those bytes
+        pixels.fill((0, 0, 0))
+        pixels.show()
+        assert bytes(device.shown) == bytes(60)